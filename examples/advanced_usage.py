@@ -48,13 +48,10 @@ def main():
     print(f"Found {len(results)} CVPR papers from 2020-2023 with abstracts")
 
     # Group by year
-    by_year = {}
-    for paper in results.papers:
-        year = paper.year or "Unknown"
-        by_year[year] = by_year.get(year, 0) + 1
+    by_year = results.counts_by("year")
 
     print("\nPapers by year:")
-    for year in sorted(by_year.keys()):
+    for year in sorted(by_year, key=str):
         print(f"  {year}: {by_year[year]} papers")
 
     # Analyze field coverage
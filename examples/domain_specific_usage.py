@@ -136,10 +136,7 @@ for field in ["abstract", "citation_count", "pdf_url", "keywords"]:
         print(f"  {stats[field]}")
 
 # Show papers by database
-by_database = {}
-for paper in results.papers:
-    db = paper.source_database
-    by_database[db] = by_database.get(db, 0) + 1
+by_database = results.counts_by("source_database")
 
 print("\nPapers by database:")
 for db, count in sorted(by_database.items()):
@@ -5,6 +5,9 @@ This example demonstrates how to use the PDF downloader to fetch
 PDFs from various academic databases that provide open access links.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Semaphore
+
 from paperseek import UnifiedSearchClient
 from paperseek.utils.pdf_downloader import PDFDownloader
 
@@ -57,7 +60,7 @@ results = client.search(title="climate change modeling", year_range=(2022, 2023)
 print(f"Found {len(results.papers)} papers across databases")
 
 # Count papers with PDF URLs
-papers_with_pdfs = [p for p in results.papers if p.pdf_url]
+papers_with_pdfs = results.papers_with_pdf()
 print(f"Papers with PDF URLs: {len(papers_with_pdfs)}")
 
 # Download PDFs with very conservative rate limiting
@@ -91,11 +94,33 @@ print(f"Found {len(results.papers)} papers")
 # Now check for OA versions using Unpaywall
 client_unpaywall = UnifiedSearchClient(databases=["unpaywall"])
 
+# Lookups are network-bound, so overlap them with a small thread pool.
+# The semaphore caps in-flight requests to stay polite towards Unpaywall.
+unpaywall_slots = Semaphore(4)
+
+
+def lookup_oa_version(doi):
+    """Look up a DOI in Unpaywall while holding one of the request slots."""
+    with unpaywall_slots:
+        return client_unpaywall.get_by_doi(doi)
+
+
 oa_papers = []
-for paper in results.papers:
-    if paper.doi:
-        # Check Unpaywall for OA version
-        oa_paper = client_unpaywall.get_by_doi(paper.doi)
+with ThreadPoolExecutor(max_workers=8) as executor:
+    future_to_paper = {
+        executor.submit(lookup_oa_version, paper.doi): paper
+        for paper in results.papers
+        if paper.doi
+    }
+
+    for future in as_completed(future_to_paper):
+        paper = future_to_paper[future]
+        try:
+            oa_paper = future.result()
+        except Exception as e:
+            print(f"Unpaywall lookup failed for {paper.doi}: {e}")
+            continue
+
         if oa_paper and oa_paper.is_open_access and oa_paper.pdf_url:
             oa_papers.append(oa_paper)
             print(f"Found OA version: {paper.title[:60]}...")
@@ -132,7 +157,7 @@ results = client.search(title="cancer immunotherapy", year_range=(2022, 2023), m
 print(f"Found {len(results.papers)} biomedical papers")
 
 # Filter for papers with PDF URLs
-papers_with_pdfs = [p for p in results.papers if p.pdf_url]
+papers_with_pdfs = results.papers_with_pdf()
 print(f"Papers with PDF access: {len(papers_with_pdfs)}")
 
 # Download with conservative settings
@@ -226,9 +251,10 @@ with PDFDownloader(
 
     print(f"\nDownloaded {len(downloaded)} PDFs")
 
-    # List downloaded files with metadata
+    # List downloaded files with metadata (results are keyed by title)
+    papers_by_title = {p.title: p for p in filtered_papers}
     for title, filepath in downloaded.items():
-        paper = next(p for p in filtered_papers if p.title == title)
+        paper = papers_by_title[title]
         print(f"\n{filepath.name}:")
         print(f"  Citations: {paper.citation_count}")
         print(f"  Year: {paper.year}")
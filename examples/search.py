@@ -9,10 +9,12 @@ The script searches multiple databases and exports results to various formats.
 """
 
 from paperseek import UnifiedSearchClient
-from paperseek.core.models import SearchFilters
+from paperseek.core.models import SearchFilters, SearchResult
 from paperseek.exporters.bibtex_exporter import BibTeXExporter
 from paperseek.exporters.csv_exporter import CSVExporter
 from paperseek.exporters.json_exporter import JSONExporter
+from paperseek.utils.dedup import RAPIDFUZZ_AVAILABLE, unique_title_indices, within_k
+from paperseek.utils.normalization import TextNormalizer
 from paperseek.utils.pdf_downloader import PDFDownloader
 from dotenv import load_dotenv
 import os
@@ -24,6 +26,18 @@ load_dotenv()
 RESULTS_DIR = "./search_results"
 
 
+def first_author_surname(paper) -> str:
+    """Normalized surname of the first author ("" if there are no authors)."""
+    if not paper.authors:
+        return ""
+    name = paper.authors[0].name
+    # "Family, Given" or "Given Family"
+    if "," in name:
+        return TextNormalizer.normalize_title(name.split(",")[0])
+    words = TextNormalizer.normalize_title(name).split()
+    return words[-1] if words else ""
+
+
 def search(venue: str, year: int):
     
     print("=" * 70)
@@ -59,35 +73,49 @@ def search(venue: str, year: int):
     print(f"  Found {len(results_strategy.papers)} papers")
     
     # Combine and deduplicate results
+    # (one hashed lookup per key; titles are normalized once per paper)
     print("\nCombining and deduplicating results...")
-    all_papers = []
-    seen_dois = set()
-    seen_titles = set()
-
-    for results in [results_strategy]:
-        for paper in results.papers:
-            is_duplicate = False
-            
-            if paper.doi and paper.doi in seen_dois:
-                is_duplicate = True
-            elif paper.title.lower().strip() in seen_titles:
-                is_duplicate = True
-            
-            if not is_duplicate:
-                all_papers.append(paper)
-                if paper.doi:
-                    seen_dois.add(paper.doi)
-                seen_titles.add(paper.title.lower().strip())
-    
-    # Create combined results
-    from paperseek.core.models import SearchResult
     results = SearchResult(
         query_info={"venue": venue, "year": year,},
         databases_queried=list(client.clients.keys())
     )
-    for paper in all_papers:
+    seen = set()
+
+    for paper in results_strategy.papers:
+        keys = [("title", TextNormalizer.normalize_title(paper.title))]
+        if paper.doi:
+            keys.append(("doi", paper.doi.lower()))
+
+        if any(key in seen for key in keys):
+            continue
+
+        seen.update(keys)
         results.add_paper(paper)
 
+    # Catch small typos (up to 3 edits) in otherwise identical titles. Titles are
+    # only compared within the same (first-author surname, year) block, which
+    # avoids comparing every pair of papers.
+    kept_titles = {}
+    unique_papers = []
+    for paper in results.papers:
+        title = TextNormalizer.normalize_title(paper.title)
+        block = kept_titles.setdefault((first_author_surname(paper), paper.year), [])
+        if any(within_k(title, other, k=3) for other in block):
+            continue
+        block.append(title)
+        unique_papers.append(paper)
+    results.papers = unique_papers
+    results.total_results = len(unique_papers)
+
+    # Optional fuzzy pass for titles that differ slightly between databases
+    # (requires: pip install "paperseek[fuzzy]")
+    if RAPIDFUZZ_AVAILABLE:
+        titles = [TextNormalizer.normalize_title(p.title) for p in results.papers]
+        keep = unique_title_indices(titles, threshold=0.92)
+        print(f"  Fuzzy title matching removed {len(titles) - len(keep)} near-duplicates")
+        results.papers = [results.papers[i] for i in keep]
+        results.total_results = len(results.papers)
+
     print(f"Searching for papers from {venue} {year}...")
     print(f"  Combined unique papers: {len(results.papers)}")
     print(f"  Databases queried: {', '.join(results.databases_queried)}")
@@ -111,34 +139,30 @@ def search(venue: str, year: int):
             print("  or the venue name format may differ.")
             return results
         
-        # Papers by database
-        db_counts = {}
+        # Papers by database (Counter tallies in C)
+        db_counts = results.counts_by("source_database")
+
+        # Field coverage, gathered in a single pass
+        field_counts = {"oa": 0, "pdf": 0, "doi": 0, "abstract": 0}
         for paper in results.papers:
-            db = paper.source_database
-            db_counts[db] = db_counts.get(db, 0) + 1
+            field_counts["oa"] += bool(paper.is_open_access)
+            field_counts["pdf"] += bool(paper.pdf_url)
+            field_counts["doi"] += bool(paper.doi)
+            field_counts["abstract"] += bool(paper.abstract)
         
         for db, count in sorted(db_counts.items()):
             print(f"  {db:20s}: {count:3d} papers")
         
-        # Open access statistics
-        open_access_count = sum(1 for p in results.papers if p.is_open_access)
-        open_access_pct = 100 * open_access_count / len(results.papers) if results.papers else 0
-        print(f"\n  Open Access Papers  : {open_access_count}/{len(results.papers)} ({open_access_pct:.1f}%)")
-        
-        # Papers with PDFs
-        pdf_count = sum(1 for p in results.papers if p.pdf_url)
-        pdf_pct = 100 * pdf_count / len(results.papers) if results.papers else 0
-        print(f"  Papers with PDF URL : {pdf_count}/{len(results.papers)} ({pdf_pct:.1f}%)")
-        
-        # Papers with DOI
-        doi_count = sum(1 for p in results.papers if p.doi)
-        doi_pct = 100 * doi_count / len(results.papers) if results.papers else 0
-        print(f"  Papers with DOI     : {doi_count}/{len(results.papers)} ({doi_pct:.1f}%)")
-        
-        # Papers with abstracts
-        abstract_count = sum(1 for p in results.papers if p.abstract)
-        abstract_pct = 100 * abstract_count / len(results.papers) if results.papers else 0
-        print(f"  Papers with Abstract: {abstract_count}/{len(results.papers)} ({abstract_pct:.1f}%)")
+        print()
+        total = len(results.papers)
+        for key, label in [
+            ("oa", "Open Access Papers"),
+            ("pdf", "Papers with PDF URL"),
+            ("doi", "Papers with DOI"),
+            ("abstract", "Papers with Abstract"),
+        ]:
+            count = field_counts[key]
+            print(f"  {label:20s}: {count}/{total} ({100 * count / total:.1f}%)")
         
         print()
         
@@ -205,22 +229,19 @@ def search(venue: str, year: int):
             print("-" * 70)
             
             pdf_dir = os.path.join(output_dir, "pdfs")
-            downloader = PDFDownloader(download_dir=pdf_dir)
+            # Keep a few downloads in flight; request starts remain rate limited
+            downloader = PDFDownloader(download_dir=pdf_dir, max_concurrent_downloads=4)
             
             # Filter papers with PDF URLs
-            papers_with_pdf = [p for p in results.papers if p.pdf_url]
+            papers_with_pdf = results.papers_with_pdf()
             print(f"Found {len(papers_with_pdf)} papers with PDF URLs")
             print(f"Starting downloads...")
             print()
             
-            # Download papers one by one (PDFDownloader doesn't have batch_download)
-            success_count = 0
-            for i, paper in enumerate(papers_with_pdf, 1):
-                print(f"Downloading {i}/{len(papers_with_pdf)}: {paper.title[:60]}...")
-                if downloader.download_paper(paper):
-                    success_count += 1
+            with downloader:
+                downloaded = downloader.download_papers(papers_with_pdf)
             
-            print(f"\n✓ Downloaded {success_count}/{len(papers_with_pdf)} PDFs")
+            print(f"\n✓ Downloaded {len(downloaded)}/{len(papers_with_pdf)} PDFs")
             print(f"  PDFs saved to: {pdf_dir}")
         
         print()
@@ -5,12 +5,21 @@ This is useful when dealing with thousands of papers that might
 not fit comfortably in memory.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterable, Iterator
+
 from paperseek import UnifiedSearchClient
+from paperseek.core.models import Paper
 from paperseek.exporters.csv_exporter import StreamingCSVExporter
 from paperseek.exporters.json_exporter import StreamingJSONLExporter
 from paperseek.exporters.bibtex_exporter import StreamingBibTeXExporter
 
 
+def high_impact(papers: Iterable[Paper], min_citations: int = 50) -> Iterator[Paper]:
+    """Yield papers that have an abstract and at least min_citations citations."""
+    return (p for p in papers if p.abstract and (p.citation_count or 0) >= min_citations)
+
+
 def main():
     """Main streaming example."""
 
@@ -27,24 +36,36 @@ def main():
 
     venues = ["ICML", "NeurIPS", "ICLR", "CVPR", "ACL"]
     years = range(2020, 2024)
+    tasks = [(venue, year) for venue in venues for year in years]
 
     total_papers = 0
 
+    # Searches are network-bound, so run several at once. Each database
+    # client keeps its own rate limit, and results are written from this
+    # thread as they complete, so the exporter needs no locking.
     with StreamingCSVExporter("large_ml_dataset.csv") as csv_exporter:
-        for venue in venues:
-            for year in years:
-                print(f"Fetching {venue} {year}...")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            future_to_task = {
+                executor.submit(client.search, venue=venue, year=year, max_results=100): (
+                    venue,
+                    year,
+                )
+                for venue, year in tasks
+            }
+
+            for future in as_completed(future_to_task):
+                venue, year = future_to_task[future]
 
                 try:
-                    results = client.search(venue=venue, year=year, max_results=100)
+                    results = future.result()
 
                     csv_exporter.write_papers(results.papers)
                     total_papers += len(results)
 
-                    print(f"  Added {len(results)} papers (total: {total_papers})")
+                    print(f"{venue} {year}: added {len(results)} papers (total: {total_papers})")
 
                 except Exception as e:
-                    print(f"  Error: {e}")
+                    print(f"{venue} {year}: error: {e}")
                     continue
 
     print(f"\nTotal papers exported to CSV: {total_papers}")
@@ -120,14 +141,13 @@ def main():
 
                     total_papers += len(results)
 
-                    # Filter for high-impact papers
-                    for paper in results.papers:
-                        # Only include papers with abstract and 50+ citations
-                        if paper.abstract and paper.citation_count and paper.citation_count >= 50:
-                            csv_exporter.write_paper(paper)
-                            filtered_papers += 1
+                    # Filter lazily so papers go straight to the file
+                    written_before = csv_exporter.count
+                    csv_exporter.write_papers(high_impact(results.papers))
+                    written = csv_exporter.count - written_before
+                    filtered_papers += written
 
-                    print(f"  Total: {len(results)}, High-impact: {filtered_papers}")
+                    print(f"  Total: {len(results)}, High-impact: {written}")
 
                 except Exception as e:
                     print(f"  Error: {e}")
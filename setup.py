@@ -42,6 +42,19 @@ setup(
         "bibtexparser>=1.4.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+            "lxml>=4.9.0",
+        ],
+        "fuzzy": [
+            "rapidfuzz>=3.0",
+        ],
+        "cache": [
+            "requests-cache>=1.0",
+        ],
+        "streaming": [
+            "ijson>=3.1",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
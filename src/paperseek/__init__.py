@@ -1,20 +1,45 @@
 """
 PaperSeek - A unified interface for searching multiple academic databases.
+
+Public classes are imported lazily on first attribute access, so
+``import paperseek`` stays cheap and only the backends that are used get loaded.
 """
 
-from .core.unified_client import UnifiedSearchClient
-from .core.models import Paper, SearchResult, SearchFilters
-from .core.config import AcademicSearchConfig
-from .clients.crossref import CrossRefClient
-from .clients.openalex import OpenAlexClient
-from .clients.semantic_scholar import SemanticScholarClient
-from .clients.doi import DOIClient
-from .clients.pubmed import PubMedClient
-from .clients.arxiv import ArXivClient
-from .clients.core import COREClient
-from .clients.unpaywall import UnpaywallClient
-from .clients.dblp import DBLPClient
-from .utils.pdf_downloader import PDFDownloader
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core.unified_client import UnifiedSearchClient
+    from .core.models import Paper, SearchResult, SearchFilters
+    from .core.config import AcademicSearchConfig
+    from .clients.crossref import CrossRefClient
+    from .clients.openalex import OpenAlexClient
+    from .clients.semantic_scholar import SemanticScholarClient
+    from .clients.doi import DOIClient
+    from .clients.pubmed import PubMedClient
+    from .clients.arxiv import ArXivClient
+    from .clients.core import COREClient
+    from .clients.unpaywall import UnpaywallClient
+    from .clients.dblp import DBLPClient
+    from .utils.pdf_downloader import PDFDownloader
+
+_LAZY_IMPORTS = {
+    "UnifiedSearchClient": ".core.unified_client",
+    "Paper": ".core.models",
+    "SearchResult": ".core.models",
+    "SearchFilters": ".core.models",
+    "AcademicSearchConfig": ".core.config",
+    "CrossRefClient": ".clients.crossref",
+    "OpenAlexClient": ".clients.openalex",
+    "SemanticScholarClient": ".clients.semantic_scholar",
+    "DOIClient": ".clients.doi",
+    "PubMedClient": ".clients.pubmed",
+    "ArXivClient": ".clients.arxiv",
+    "COREClient": ".clients.core",
+    "UnpaywallClient": ".clients.unpaywall",
+    "DBLPClient": ".clients.dblp",
+    "PDFDownloader": ".utils.pdf_downloader",
+}
 
 __version__ = "0.1.0"
 __all__ = [
@@ -34,3 +59,18 @@ __all__ = [
     "DBLPClient",
     "PDFDownloader",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public classes on first access."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    """List public names, including lazily imported classes."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,14 +1,34 @@
-"""Database client implementations."""
-
-from .crossref import CrossRefClient
-from .openalex import OpenAlexClient
-from .semantic_scholar import SemanticScholarClient
-from .doi import DOIClient
-from .pubmed import PubMedClient
-from .arxiv import ArXivClient
-from .core import COREClient
-from .unpaywall import UnpaywallClient
-from .dblp import DBLPClient
+"""Database client implementations.
+
+Client classes are imported lazily on first attribute access, so importing
+one backend (e.g. ``paperseek.clients.arxiv``) does not load all the others.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .crossref import CrossRefClient
+    from .openalex import OpenAlexClient
+    from .semantic_scholar import SemanticScholarClient
+    from .doi import DOIClient
+    from .pubmed import PubMedClient
+    from .arxiv import ArXivClient
+    from .core import COREClient
+    from .unpaywall import UnpaywallClient
+    from .dblp import DBLPClient
+
+_CLIENT_MODULES = {
+    "CrossRefClient": ".crossref",
+    "OpenAlexClient": ".openalex",
+    "SemanticScholarClient": ".semantic_scholar",
+    "DOIClient": ".doi",
+    "PubMedClient": ".pubmed",
+    "ArXivClient": ".arxiv",
+    "COREClient": ".core",
+    "UnpaywallClient": ".unpaywall",
+    "DBLPClient": ".dblp",
+}
 
 __all__ = [
     "CrossRefClient",
@@ -21,3 +41,18 @@ __all__ = [
     "UnpaywallClient",
     "DBLPClient",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import client classes on first access."""
+    if name in _CLIENT_MODULES:
+        module = importlib.import_module(_CLIENT_MODULES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    """List public names, including lazily imported clients."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,6 @@
 """arXiv API client implementation."""
 
+import re
 from typing import Any, Dict, List, Optional
 import xml.etree.ElementTree as ET
 from datetime import datetime
@@ -7,6 +8,7 @@ from datetime import datetime
 from ..core.base import DatabaseClient
 from ..core.models import Paper, Author, SearchFilters, SearchResult
 from ..core.exceptions import APIError
+from ..utils import xml_parsing
 from ..utils.normalization import (
     TextNormalizer,
     DateNormalizer,
@@ -15,6 +17,31 @@ from ..utils.normalization import (
     URLNormalizer,
 )
 
+# Element tags in Clark notation, resolved once instead of on every find() call
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ARXIV = "{http://arxiv.org/schemas/atom}"
+_ATOM_ENTRY = _ATOM + "entry"
+_ATOM_ID = _ATOM + "id"
+_ATOM_TITLE = _ATOM + "title"
+_ATOM_AUTHOR = _ATOM + "author"
+_ATOM_NAME = _ATOM + "name"
+_ATOM_SUMMARY = _ATOM + "summary"
+_ATOM_PUBLISHED = _ATOM + "published"
+_ATOM_CATEGORY = _ATOM + "category"
+_ATOM_LINK = _ATOM + "link"
+_ARXIV_PRIMARY_CATEGORY = _ARXIV + "primary_category"
+_ARXIV_COMMENT = _ARXIV + "comment"
+
+# arXiv DOIs look like 10.48550/arXiv.YYMM.NNNNN
+_ARXIV_DOI_PATTERN = re.compile(r"10\.48550/arxiv\.(\S+)", re.IGNORECASE)
+# "arXiv:" prefix and version suffix around an arXiv identifier
+_ARXIV_ID_DECORATION_PATTERN = re.compile(r"^arxiv:|v\d+$", re.IGNORECASE)
+
+
+def _base_arxiv_id(identifier: str) -> str:
+    """Strip the "arXiv:" prefix and version suffix from an arXiv identifier."""
+    return _ARXIV_ID_DECORATION_PATTERN.sub("", identifier.strip())
+
 
 class ArXivClient(DatabaseClient):
     """
@@ -26,10 +53,12 @@ class ArXivClient(DatabaseClient):
 
     API Documentation: https://info.arxiv.org/help/api/index.html
 
-    Note: No API key required. Rate limiting: 1 request per 3 seconds recommended.
+    Note: No API key required. Requests are limited to 1 per 3 seconds as the API asks.
     """
 
     BASE_URL = "http://export.arxiv.org/api/query"
+    MAX_REQUESTS_PER_SECOND = 1 / 3
+    ID_LIST_CHUNK_SIZE = 200
 
     # Namespace for XML parsing
     ATOM_NS = {"atom": "http://www.w3.org/2005/Atom"}
@@ -69,6 +98,14 @@ class ArXivClient(DatabaseClient):
         if filters.author:
             query_parts.append(f'au:"{filters.author}"')
 
+        # Date filtering happens server side; an open end uses the widest bound
+        year_start = filters.year or filters.year_start
+        year_end = filters.year or filters.year_end
+        if year_start or year_end:
+            start = f"{year_start}01010000" if year_start else "000001010000"
+            end = f"{year_end}12312359" if year_end else "999912312359"
+            query_parts.append(f"submittedDate:[{start} TO {end}]")
+
         if not query_parts:
             query_parts.append("all:*")  # Search all if no specific criteria
 
@@ -93,26 +130,16 @@ class ArXivClient(DatabaseClient):
         )
 
         try:
-            root = ET.fromstring(response.text)
-
-            for entry in root.findall("atom:entry", self.ATOM_NS):
+            # Stream entries so large pages never build the full tree
+            for entry in xml_parsing.iter_elements(response.content, _ATOM_ENTRY):
                 try:
                     paper = self._normalize_paper_from_xml(entry)
-
-                    # Apply year filter (arXiv API doesn't support date filtering in query)
-                    if filters.year and paper.year != filters.year:
-                        continue
-                    if filters.year_start and paper.year and paper.year < filters.year_start:
-                        continue
-                    if filters.year_end and paper.year and paper.year > filters.year_end:
-                        continue
-
                     result.add_paper(paper)
                 except Exception as e:
                     self.logger.warning(f"Failed to normalize paper: {e}")
                     continue
 
-        except ET.ParseError as e:
+        except xml_parsing.XML_PARSE_ERRORS as e:
             self.logger.error(f"Failed to parse XML response: {e}")
             raise APIError(f"Invalid XML response: {e}", database=self.database_name)
 
@@ -143,7 +170,7 @@ class ArXivClient(DatabaseClient):
         elif id_type.lower() == "arxiv":
             try:
                 # Clean arXiv ID (remove version if present for search)
-                arxiv_id = identifier.replace("arXiv:", "").split("v")[0]
+                arxiv_id = _base_arxiv_id(identifier)
 
                 params = {
                     "id_list": arxiv_id,
@@ -151,9 +178,9 @@ class ArXivClient(DatabaseClient):
                 }
 
                 response = self._make_request(self.BASE_URL, params=params)
-                root = ET.fromstring(response.text)
+                root = xml_parsing.fromstring(response.content)
 
-                entry = root.find("atom:entry", self.ATOM_NS)
+                entry = root.find(_ATOM_ENTRY)
                 if entry is not None:
                     return self._normalize_paper_from_xml(entry)
                 return None
@@ -172,26 +199,15 @@ class ArXivClient(DatabaseClient):
         if id_type.lower() == "arxiv":
             # Can fetch multiple arXiv IDs at once
             # Clean IDs
-            clean_ids = [id.replace("arXiv:", "").split("v")[0] for id in identifiers]
-
-            params = {
-                "id_list": ",".join(clean_ids),
-                "max_results": len(clean_ids),
-            }
-
-            try:
-                response = self._make_request(self.BASE_URL, params=params)
-                root = ET.fromstring(response.text)
-
-                for entry in root.findall("atom:entry", self.ATOM_NS):
-                    try:
-                        paper = self._normalize_paper_from_xml(entry)
-                        result.add_paper(paper)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to normalize paper: {e}")
-                        continue
-            except Exception as e:
-                self.logger.error(f"Failed to batch lookup: {e}")
+            clean_ids = [_base_arxiv_id(identifier) for identifier in identifiers]
+
+            # Long id_lists exceed URL length limits, so split them into chunks
+            chunks = [
+                clean_ids[start : start + self.ID_LIST_CHUNK_SIZE]
+                for start in range(0, len(clean_ids), self.ID_LIST_CHUNK_SIZE)
+            ]
+            for papers in self._map_concurrently(self._fetch_id_list, chunks):
+                result.extend(papers)
         else:
             # Fetch individually for other identifier types
             for identifier in identifiers:
@@ -201,6 +217,36 @@ class ArXivClient(DatabaseClient):
 
         return result
 
+    def _fetch_id_list(self, arxiv_ids: List[str]) -> List[Paper]:
+        """
+        Fetch the entries for one id_list request.
+
+        Args:
+            arxiv_ids: arXiv IDs without prefix or version
+
+        Returns:
+            Papers found (empty if the request fails)
+        """
+        params = {
+            "id_list": ",".join(arxiv_ids),
+            "max_results": len(arxiv_ids),
+        }
+
+        papers = []
+        try:
+            response = self._make_request(self.BASE_URL, params=params)
+
+            for entry in xml_parsing.iter_elements(response.content, _ATOM_ENTRY):
+                try:
+                    papers.append(self._normalize_paper_from_xml(entry))
+                except Exception as e:
+                    self.logger.warning(f"Failed to normalize paper: {e}")
+                    continue
+        except Exception as e:
+            self.logger.error(f"Failed to batch lookup: {e}")
+
+        return papers
+
     def _normalize_paper(self, raw_data: Dict[str, Any]) -> Paper:
         """
         Normalize arXiv data to Paper model.
@@ -220,32 +266,32 @@ class ArXivClient(DatabaseClient):
             Normalized Paper object
         """
         # Extract arXiv ID
-        id_elem = entry.find("atom:id", self.ATOM_NS)
+        id_elem = entry.find(_ATOM_ID)
         arxiv_url = id_elem.text if id_elem is not None else None
         arxiv_id = IdentifierNormalizer.extract_arxiv_id(arxiv_url) if arxiv_url else None
 
         # Extract title
-        title_elem = entry.find("atom:title", self.ATOM_NS)
+        title_elem = entry.find(_ATOM_TITLE)
         title = TextNormalizer.clean_text(
             title_elem.text if title_elem is not None else None
         ) or "Unknown"
 
         # Extract authors
         authors = []
-        for author_elem in entry.findall("atom:author", self.ATOM_NS):
-            name_elem = author_elem.find("atom:name", self.ATOM_NS)
+        for author_elem in entry.findall(_ATOM_AUTHOR):
+            name_elem = author_elem.find(_ATOM_NAME)
             if name_elem is not None and name_elem.text:
                 author = AuthorNormalizer.create_author(name=name_elem.text)
                 authors.append(author)
 
         # Extract abstract
-        summary_elem = entry.find("atom:summary", self.ATOM_NS)
+        summary_elem = entry.find(_ATOM_SUMMARY)
         abstract = TextNormalizer.clean_text(
             summary_elem.text if summary_elem is not None else None
         )
 
         # Extract publication date
-        published_elem = entry.find("atom:published", self.ATOM_NS)
+        published_elem = entry.find(_ATOM_PUBLISHED)
         year = None
         publication_date = None
         if published_elem is not None and published_elem.text:
@@ -254,38 +300,33 @@ class ArXivClient(DatabaseClient):
 
         # Extract categories (used as keywords)
         keywords = []
-        for category_elem in entry.findall("atom:category", self.ATOM_NS):
+        for category_elem in entry.findall(_ATOM_CATEGORY):
             term = category_elem.get("term")
             if term:
                 cleaned_term = TextNormalizer.clean_text(term)
                 if cleaned_term:
                     keywords.append(cleaned_term)
 
-        # Extract DOI if available
+        # Extract DOI and PDF URL in a single pass over the links
         doi = None
-        for link_elem in entry.findall("atom:link", self.ATOM_NS):
-            if link_elem.get("title") == "doi":
-                doi_url = link_elem.get("href", "")
-                if doi_url:
-                    doi = IdentifierNormalizer.clean_doi(doi_url)
-
-        # Extract PDF URL
         pdf_url = None
-        for link_elem in entry.findall("atom:link", self.ATOM_NS):
-            if link_elem.get("title") == "pdf":
+        for link_elem in entry.iterfind(_ATOM_LINK):
+            link_title = link_elem.get("title")
+            if link_title == "doi" and doi is None:
+                doi = IdentifierNormalizer.clean_doi(link_elem.get("href"))
+            elif link_title == "pdf" and pdf_url is None:
                 pdf_url = URLNormalizer.clean_url(link_elem.get("href"))
+            if doi is not None and pdf_url is not None:
                 break
 
         # Extract primary category (venue)
-        primary_category = entry.find(
-            "arxiv:primary_category", {"arxiv": "http://arxiv.org/schemas/atom"}
-        )
+        primary_category = entry.find(_ARXIV_PRIMARY_CATEGORY)
         venue = TextNormalizer.clean_text(
             primary_category.get("term") if primary_category is not None else None
         )
 
         # Construct comment field
-        comment_elem = entry.find("arxiv:comment", {"arxiv": "http://arxiv.org/schemas/atom"})
+        comment_elem = entry.find(_ARXIV_COMMENT)
         comment = TextNormalizer.clean_text(
             comment_elem.text if comment_elem is not None else None
         )
@@ -293,7 +334,9 @@ class ArXivClient(DatabaseClient):
         # Clean arXiv URL
         arxiv_url_clean = URLNormalizer.clean_url(arxiv_url)
 
-        return Paper(
+        # The Atom text is cleaned into strings, the year into an int and the
+        # authors into Author models above, so the entry needs no validation
+        return Paper.model_construct(
             doi=doi,
             title=title,
             authors=authors,
@@ -324,12 +367,8 @@ class ArXivClient(DatabaseClient):
         Returns:
             arXiv ID or None
         """
-        # arXiv DOIs typically look like: 10.48550/arXiv.YYMM.NNNNN
-        if "arxiv" in doi.lower():
-            parts = doi.split("arxiv.")
-            if len(parts) > 1:
-                return parts[1]
-        return None
+        match = _ARXIV_DOI_PATTERN.search(doi)
+        return match.group(1) if match else None
 
     def get_supported_fields(self) -> List[str]:
         """Get fields typically provided by arXiv."""
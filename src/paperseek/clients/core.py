@@ -1,10 +1,16 @@
 """CORE API client implementation."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, cast
 
 from ..core.base import DatabaseClient
 from ..core.models import Paper, Author, SearchFilters, SearchResult
 from ..core.exceptions import APIError
+from ..utils.normalization import IdentifierNormalizer
+
+
+def _doi_key(doi: str) -> str:
+    """Key for matching returned records to requested DOIs (DOIs are case-insensitive)."""
+    return (IdentifierNormalizer.clean_doi(doi) or doi).lower()
 
 
 class COREClient(DatabaseClient):
@@ -21,6 +27,9 @@ class COREClient(DatabaseClient):
     """
 
     BASE_URL = "https://api.core.ac.uk/v3"
+    MAX_REQUESTS_PER_SECOND = 10.0
+    MAX_LIMIT = 100  # Largest page CORE returns
+    BATCH_SIZE = 50  # DOIs per OR query; leaves room for duplicate records
 
     @property
     def database_name(self) -> str:
@@ -35,6 +44,7 @@ class COREClient(DatabaseClient):
         headers: Optional[Dict[str, str]] = None,
         json_data: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
+        stream: bool = False,
     ):
         """
         Make an HTTP request with CORE-specific authentication.
@@ -48,6 +58,7 @@ class COREClient(DatabaseClient):
             headers: Additional headers
             json_data: JSON data for POST requests
             timeout: Request timeout
+            stream: Defer downloading the body (see DatabaseClient._make_request)
 
         Returns:
             Response object
@@ -68,6 +79,7 @@ class COREClient(DatabaseClient):
             headers=headers,
             json_data=json_data,
             timeout=timeout,
+            stream=stream,
         )
 
     def search(self, filters: SearchFilters) -> SearchResult:
@@ -111,7 +123,7 @@ class COREClient(DatabaseClient):
         # Build request body (CORE uses POST for search)
         request_body = {
             "q": query,
-            "limit": min(filters.max_results, 100),  # Max 100 per request
+            "limit": min(filters.max_results, self.MAX_LIMIT),
             "offset": filters.offset,
         }
 
@@ -119,7 +131,7 @@ class COREClient(DatabaseClient):
         url = f"{self.BASE_URL}/search/works"
         response = self._make_request(url, method="POST", json_data=request_body)
 
-        data = response.json()
+        data = self._parse_json(response)
 
         # Parse results
         result = SearchResult(
@@ -165,26 +177,87 @@ class COREClient(DatabaseClient):
                 # Get by CORE ID
                 url = f"{self.BASE_URL}/works/{identifier}"
                 response = self._make_request(url)
-                data = response.json()
+                data = self._parse_json(response)
                 return self._normalize_paper(data)
             except APIError:
                 return None
         return None
 
     def batch_lookup(self, identifiers: List[str], id_type: str) -> SearchResult:
-        """Look up multiple papers."""
+        """
+        Look up multiple papers.
+
+        DOIs are resolved BATCH_SIZE at a time with one OR query each
+        (``doi:"a" OR doi:"b"``); other identifier types, and DOIs a batch
+        could not resolve, are looked up concurrently one by one.
+        """
         result = SearchResult(
             query_info={"identifiers": identifiers, "id_type": id_type},
             databases_queried=[self.database_name],
         )
 
-        for identifier in identifiers:
-            paper = self.get_by_identifier(identifier, id_type)
-            if paper:
-                result.add_paper(paper)
+        if id_type.lower() != "doi":
+            result.extend(
+                self._lookup_many(
+                    identifiers, lambda identifier: self.get_by_identifier(identifier, id_type)
+                )
+            )
+            return result
+
+        # Quotes and backslashes inside a DOI would break the query syntax
+        dois = [IdentifierNormalizer.clean_doi(doi) or doi for doi in identifiers]
+        batchable = [doi for doi in dois if '"' not in doi and "\\" not in doi]
+        individual = [doi for doi in dois if '"' in doi or "\\" in doi]
+
+        found: Dict[str, Paper] = {}
+        for start in range(0, len(batchable), self.BATCH_SIZE):
+            chunk = batchable[start : start + self.BATCH_SIZE]
+            try:
+                items = self._search_dois(chunk)
+            except Exception as e:
+                self.logger.warning(f"Batch lookup failed, falling back to individual: {e}")
+                individual.extend(chunk)
+                continue
+
+            for item in items:
+                try:
+                    paper = self._normalize_paper(item)
+                except Exception as e:
+                    self.logger.warning(f"Failed to normalize paper: {e}")
+                    continue
+                if paper.doi:
+                    # CORE often holds several records per DOI; keep the first
+                    found.setdefault(_doi_key(paper.doi), paper)
+
+            # A full page may have been cut short by duplicate records
+            if len(items) >= self.MAX_LIMIT:
+                individual.extend(doi for doi in chunk if _doi_key(doi) not in found)
+
+        keys = dict.fromkeys(_doi_key(doi) for doi in batchable)
+        result.extend([found[key] for key in keys if key in found])
+        result.extend(self._lookup_many(individual, self.get_by_doi))
 
         return result
 
+    def _search_dois(self, dois: List[str]) -> List[Dict[str, Any]]:
+        """
+        Find the works for several DOIs with one OR query.
+
+        Args:
+            dois: Cleaned DOIs (without quotes or backslashes)
+
+        Returns:
+            Raw work records (possibly several per DOI)
+        """
+        request_body = {
+            "q": " OR ".join(f'doi:"{doi}"' for doi in dois),
+            "limit": self.MAX_LIMIT,
+        }
+        response = self._make_request(
+            f"{self.BASE_URL}/search/works", method="POST", json_data=request_body
+        )
+        return cast(List[Dict[str, Any]], self._parse_json(response).get("results", []))
+
     def _normalize_paper(self, raw_data: Dict[str, Any]) -> Paper:
         """
         Normalize CORE data to Paper model.
@@ -195,9 +268,11 @@ class COREClient(DatabaseClient):
         Returns:
             Normalized Paper object
         """
+        get = raw_data.get
+
         # Extract authors
         authors = []
-        for author_data in raw_data.get("authors", []):
+        for author_data in get("authors") or ():
             if isinstance(author_data, dict):
                 name = author_data.get("name", "Unknown")
             else:
@@ -205,7 +280,7 @@ class COREClient(DatabaseClient):
             authors.append(Author(name=name))
 
         # Extract year
-        year = raw_data.get("yearPublished")
+        year = get("yearPublished")
         if year:
             try:
                 year = int(year)
@@ -213,46 +288,49 @@ class COREClient(DatabaseClient):
                 year = None
 
         # Extract DOI
-        doi = raw_data.get("doi")
+        doi = get("doi")
 
         # Extract abstract
-        abstract = raw_data.get("abstract")
+        abstract = get("abstract")
 
         # Extract download URL (PDF)
-        pdf_url = raw_data.get("downloadUrl")
+        pdf_url = get("downloadUrl")
 
         # Extract publisher/journal
-        publisher = raw_data.get("publisher")
-        journal = raw_data.get("journals", [])
+        publisher = get("publisher")
+        journal = get("journals")
         if journal and isinstance(journal, list):
-            journal = journal[0] if journal else None
+            journal = journal[0]
 
         # Extract subjects/topics as keywords
-        keywords = raw_data.get("topics", [])
-        if not keywords:
-            keywords = raw_data.get("subjects", [])
+        keywords = get("topics") or get("subjects") or []
+
+        extra_data: Dict[str, Any] = {
+            "core_id": get("id"),
+            "publisher": publisher,
+            "language": get("language"),
+        }
+        if self.config.keep_raw_data:
+            extra_data["raw"] = raw_data
+
+        links = get("links")
 
         return Paper(
             doi=doi,
-            title=raw_data.get("title", "Unknown"),
+            title=get("title", "Unknown"),
             authors=authors,
             abstract=abstract,
             year=year,
-            publication_date=raw_data.get("publishedDate"),
+            publication_date=get("publishedDate"),
             venue=journal or publisher,
             journal=journal,
             keywords=keywords,
-            url=raw_data.get("links", [{}])[0].get("url") if raw_data.get("links") else None,
+            url=links[0].get("url") if links else None,
             pdf_url=pdf_url,
             is_open_access=True,  # CORE only indexes open access content
             source_database=self.database_name,
-            source_id=str(raw_data.get("id")),
-            extra_data={
-                "core_id": raw_data.get("id"),
-                "publisher": publisher,
-                "language": raw_data.get("language"),
-                "raw": raw_data,
-            },
+            source_id=str(get("id")),
+            extra_data=extra_data,
         )
 
     def get_supported_fields(self) -> List[str]:
@@ -1,6 +1,6 @@
 """CrossRef API client implementation."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote
 
 from ..core.base import DatabaseClient
@@ -26,6 +26,8 @@ class CrossRefClient(DatabaseClient):
     """
 
     BASE_URL = "https://api.crossref.org"
+    BATCH_SIZE = 50
+    MAX_ROWS = 1000  # Largest page CrossRef returns
 
     def __init__(
         self,
@@ -57,47 +59,21 @@ class CrossRefClient(DatabaseClient):
         """
         self.logger.info(f"Searching CrossRef with filters: {filters}")
 
-        # Build query
-        query_parts = []
-
-        if filters.title:
-            query_parts.append(f"title:{filters.title}")
-        if filters.author:
-            query_parts.append(f"author:{filters.author}")
         if filters.doi:
             return self._search_by_doi(filters.doi, filters)
 
-        query = " ".join(query_parts) if query_parts else None
-
-        # Build request params
-        params: Dict[str, Any] = {
-            "rows": min(filters.max_results, 1000),  # CrossRef max
-            "offset": filters.offset,
-        }
-
-        if query:
-            params["query"] = query
-
-        # Add filters
-        filter_parts = []
-
-        if filters.year:
-            filter_parts.append(f"from-pub-date:{filters.year}")
-            filter_parts.append(f"until-pub-date:{filters.year}")
-        elif filters.year_start or filters.year_end:
-            if filters.year_start:
-                filter_parts.append(f"from-pub-date:{filters.year_start}")
-            if filters.year_end:
-                filter_parts.append(f"until-pub-date:{filters.year_end}")
-
-        if filter_parts:
-            params["filter"] = ",".join(filter_parts)
+        query, params = self._build_search_params(filters)
 
-        # Make request
+        # Make request(s); offset paging gets slow past the first page, so
+        # larger result sets are fetched with a deep-paging cursor instead
         url = f"{self.BASE_URL}/works"
-        response = self._make_request(url, params=params)
-
-        data = response.json()
+        if filters.max_results > self.MAX_ROWS:
+            items = self._fetch_with_cursor(url, params, filters.offset + filters.max_results)
+            items = items[filters.offset :]
+        else:
+            params["offset"] = filters.offset
+            response = self._make_request(url, params=params)
+            items = self._parse_json(response).get("message", {}).get("items", [])
 
         # Parse results
         result = SearchResult(
@@ -105,7 +81,6 @@ class CrossRefClient(DatabaseClient):
             databases_queried=[self.database_name],
         )
 
-        items = data.get("message", {}).get("items", [])
         for item in items:
             try:
                 paper = self._normalize_paper(item)
@@ -116,6 +91,71 @@ class CrossRefClient(DatabaseClient):
 
         return result
 
+    def _build_search_params(self, filters: SearchFilters) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        Build the /works query and request parameters for a search.
+
+        Args:
+            filters: Search filters (without a DOI, which is looked up directly)
+
+        Returns:
+            Tuple of (query string or None, request parameters without paging offset)
+        """
+        query_parts = []
+        if filters.title:
+            query_parts.append(f"title:{filters.title}")
+        if filters.author:
+            query_parts.append(f"author:{filters.author}")
+        query = " ".join(query_parts) or None
+
+        params: Dict[str, Any] = {"rows": min(filters.max_results, self.MAX_ROWS)}
+        if query:
+            params["query"] = query
+
+        # A single year is a range with equal bounds
+        year_start = filters.year or filters.year_start
+        year_end = filters.year or filters.year_end
+        filter_parts = []
+        if year_start:
+            filter_parts.append(f"from-pub-date:{year_start}")
+        if year_end:
+            filter_parts.append(f"until-pub-date:{year_end}")
+        if filter_parts:
+            params["filter"] = ",".join(filter_parts)
+
+        return query, params
+
+    def _fetch_with_cursor(
+        self, url: str, params: Dict[str, Any], limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch up to limit works by following CrossRef's ``next-cursor``.
+
+        Args:
+            url: Listing endpoint
+            params: Query parameters (without offset, which cursors do not allow)
+            limit: Maximum number of items to fetch
+
+        Returns:
+            Raw work items, in result order
+        """
+        items: List[Dict[str, Any]] = []
+        cursor = "*"
+
+        while len(items) < limit:
+            page_params = dict(params, cursor=cursor, rows=min(self.MAX_ROWS, limit - len(items)))
+            response = self._make_request(url, params=page_params)
+            message = self._parse_json(response).get("message", {})
+
+            page = message.get("items", [])
+            items.extend(page)
+
+            cursor = message.get("next-cursor")
+            if not page or not cursor:
+                break
+
+        return items[:limit]
+
     def get_by_doi(self, doi: str) -> Optional[Paper]:
         """
         Get paper by DOI.
@@ -129,7 +169,7 @@ class CrossRefClient(DatabaseClient):
         try:
             url = f"{self.BASE_URL}/works/{quote(doi, safe='')}"
             response = self._make_request(url)
-            data = response.json()
+            data = self._parse_json(response)
             return self._normalize_paper(data.get("message", {}))
         except APIError:
             return None
@@ -141,16 +181,51 @@ class CrossRefClient(DatabaseClient):
         return None
 
     def batch_lookup(self, identifiers: List[str], id_type: str) -> SearchResult:
-        """Look up multiple papers."""
+        """
+        Look up multiple papers.
+
+        DOIs are resolved BATCH_SIZE at a time with repeated filters
+        (``filter=doi:a,doi:b``, which CrossRef ORs together); other identifier
+        types are looked up one by one.
+        """
         result = SearchResult(
             query_info={"identifiers": identifiers, "id_type": id_type},
             databases_queried=[self.database_name],
         )
 
-        for identifier in identifiers:
-            paper = self.get_by_identifier(identifier, id_type)
-            if paper:
-                result.add_paper(paper)
+        if id_type.lower() != "doi":
+            for identifier in identifiers:
+                paper = self.get_by_identifier(identifier, id_type)
+                if paper:
+                    result.add_paper(paper)
+            return result
+
+        # Commas inside a DOI would break the filter syntax
+        dois = [IdentifierNormalizer.clean_doi(doi) or doi for doi in identifiers]
+        batchable = [doi for doi in dois if "," not in doi]
+        individual = [doi for doi in dois if "," in doi]
+
+        for start in range(0, len(batchable), self.BATCH_SIZE):
+            chunk = batchable[start : start + self.BATCH_SIZE]
+            try:
+                params: Dict[str, Any] = {
+                    "filter": ",".join(f"doi:{doi}" for doi in chunk),
+                    "rows": len(chunk),
+                }
+                response = self._make_request(f"{self.BASE_URL}/works", params=params)
+                items = self._parse_json(response).get("message", {}).get("items", [])
+            except Exception as e:
+                self.logger.warning(f"Batch lookup failed, falling back to individual: {e}")
+                individual.extend(chunk)
+                continue
+
+            for item in items:
+                try:
+                    result.add_paper(self._normalize_paper(item))
+                except Exception as e:
+                    self.logger.warning(f"Failed to normalize paper: {e}")
+
+        result.extend(self._lookup_many(individual, self.get_by_doi))
 
         return result
 
@@ -174,23 +249,22 @@ class CrossRefClient(DatabaseClient):
         Returns:
             Normalized Paper object
         """
+        get = raw_data.get
+
         # Extract authors using AuthorNormalizer
         authors = []
-        for author_data in raw_data.get("author", []):
+        for author_data in get("author") or ():
+            affiliations = author_data.get("affiliation")
             author = AuthorNormalizer.create_author(
                 given=author_data.get("given"),
                 family=author_data.get("family"),
-                affiliation=(
-                    author_data.get("affiliation", [{}])[0].get("name")
-                    if author_data.get("affiliation")
-                    else None
-                ),
-                orcid=IdentifierNormalizer.clean_doi(author_data.get("ORCID")),  # Clean ORCID
+                affiliation=affiliations[0].get("name") if affiliations else None,
+                orcid=IdentifierNormalizer.clean_orcid(author_data.get("ORCID")),
             )
             authors.append(author)
 
         # Extract year using DateNormalizer
-        pub_date = raw_data.get("published-print") or raw_data.get("published-online")
+        pub_date = get("published-print") or get("published-online")
         year = DateNormalizer.extract_year(pub_date)
         
         # Parse date parts if available
@@ -199,39 +273,36 @@ class CrossRefClient(DatabaseClient):
             publication_date = DateNormalizer.parse_date_parts(pub_date)
 
         # Extract venue/journal using VenueNormalizer
-        container_titles = raw_data.get("container-title", [])
-        venue = VenueNormalizer.extract_venue_from_list(container_titles)
+        venue = VenueNormalizer.extract_venue_from_list(get("container-title"))
 
         # Determine if conference or journal using VenueNormalizer
-        paper_type = raw_data.get("type", "")
+        paper_type = get("type", "")
         journal, conference = VenueNormalizer.classify_venue_type(
             venue=venue,
             publication_type=paper_type
         )
 
         # Extract abstract with text normalization
-        abstract = TextNormalizer.clean_text(raw_data.get("abstract"))
+        abstract = TextNormalizer.clean_text(get("abstract"))
 
-        # Extract title with text normalization
-        title_list = raw_data.get("title", [])
-        title = VenueNormalizer.extract_venue_from_list(title_list, default="Unknown")
-        title = TextNormalizer.clean_text(title) or "Unknown"
+        # Extract title (the first non-empty entry, already whitespace-cleaned)
+        title = VenueNormalizer.extract_venue_from_list(get("title")) or "Unknown"
 
         # Extract DOI
-        doi = IdentifierNormalizer.clean_doi(raw_data.get("DOI"))
+        doi = IdentifierNormalizer.clean_doi(get("DOI"))
         
         # Extract URL
-        url = URLNormalizer.clean_url(raw_data.get("URL"))
+        url = URLNormalizer.clean_url(get("URL"))
         
         # Extract PDF URL from links
-        links = raw_data.get("link", [])
+        links = get("link")
         pdf_url = URLNormalizer.extract_pdf_url(links) if links else None
 
         # Clean text fields
-        volume = TextNormalizer.clean_text(raw_data.get("volume"))
-        issue = TextNormalizer.clean_text(raw_data.get("issue"))
-        pages = TextNormalizer.clean_text(raw_data.get("page"))
-        publisher = TextNormalizer.clean_text(raw_data.get("publisher"))
+        volume = TextNormalizer.clean_text(get("volume"))
+        issue = TextNormalizer.clean_text(get("issue"))
+        pages = TextNormalizer.clean_text(get("page"))
+        publisher = TextNormalizer.clean_text(get("publisher"))
 
         return Paper(
             doi=doi,
@@ -247,8 +318,8 @@ class CrossRefClient(DatabaseClient):
             issue=issue,
             pages=pages,
             publisher=publisher,
-            citation_count=raw_data.get("is-referenced-by-count"),
-            reference_count=raw_data.get("references-count"),
+            citation_count=get("is-referenced-by-count"),
+            reference_count=get("references-count"),
             url=url,
             pdf_url=pdf_url,
             is_open_access=pdf_url is not None,  # Has PDF link = open access
@@ -256,8 +327,8 @@ class CrossRefClient(DatabaseClient):
             source_id=doi,
             extra_data={
                 "type": paper_type,
-                "issn": raw_data.get("ISSN"),
-                "subject": raw_data.get("subject"),
+                "issn": get("ISSN"),
+                "subject": get("subject"),
             },
         )
 
@@ -1,11 +1,15 @@
 """DBLP API client implementation."""
 
+import re
 from typing import Any, Dict, List, Optional
 import xml.etree.ElementTree as ET
 
+from urllib3.exceptions import HTTPError as TransportError
+
 from ..core.base import DatabaseClient
 from ..core.models import Paper, Author, SearchFilters, SearchResult
 from ..core.exceptions import APIError
+from ..utils import xml_parsing
 from ..utils.normalization import (
     TextNormalizer,
     DateNormalizer,
@@ -15,6 +19,26 @@ from ..utils.normalization import (
     VenueNormalizer,
 )
 
+# Electronic-edition links that usually point at a freely available PDF
+_PDF_HINT_PATTERN = re.compile(r"arxiv\.org|pdf")
+
+# Record elements of a dblp.org/rec/<key>.xml document
+_PUBLICATION_TAGS = (
+    "article",
+    "inproceedings",
+    "proceedings",
+    "book",
+    "incollection",
+    "phdthesis",
+    "mastersthesis",
+)
+
+# DBLP's fixed publication type labels; other types are classified by venue name
+_JOURNAL_TYPES = frozenset(
+    {"Journal Articles", "Informal Publications", "Informal and Other Publications"}
+)
+_CONFERENCE_TYPES = frozenset({"Conference and Workshop Papers"})
+
 
 class DBLPClient(DatabaseClient):
     """
@@ -31,6 +55,9 @@ class DBLPClient(DatabaseClient):
 
     BASE_URL = "https://dblp.org/search/publ/api"
 
+    # No published limit, but DBLP blocks aggressive clients
+    MAX_CONCURRENT_LOOKUPS = 5
+
     @property
     def database_name(self) -> str:
         """Return database name."""
@@ -75,8 +102,8 @@ class DBLPClient(DatabaseClient):
             "format": "xml",
         }
 
-        # Make request
-        response = self._make_request(self.BASE_URL, params=params)
+        # Make request; the body is parsed as it arrives
+        response = self._make_request(self.BASE_URL, params=params, stream=True)
 
         # Parse XML response
         result = SearchResult(
@@ -85,35 +112,38 @@ class DBLPClient(DatabaseClient):
         )
 
         try:
-            root = ET.fromstring(response.text)
-
-            # Check for hits
-            hits_elem = root.find(".//hits")
-            if hits_elem is None:
-                return result
-
-            for hit_elem in hits_elem.findall("hit"):
+            # Stream hits off the connection so processed subtrees are released
+            # as we go and normalization starts before the download finishes
+            response.raw.decode_content = True
+            for hit_elem in xml_parsing.iter_elements(response.raw, "hit"):
                 info_elem = hit_elem.find("info")
-                if info_elem is not None:
-                    try:
-                        paper = self._normalize_paper_from_xml(info_elem)
-
-                        # Apply year filter (DBLP doesn't support year filtering in query)
-                        if filters.year and paper.year != filters.year:
-                            continue
-                        if filters.year_start and paper.year and paper.year < filters.year_start:
-                            continue
-                        if filters.year_end and paper.year and paper.year > filters.year_end:
-                            continue
-
-                        result.add_paper(paper)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to normalize paper: {e}")
+                if info_elem is None:
+                    continue
+                try:
+                    paper = self._normalize_paper_from_xml(info_elem)
+
+                    # Apply year filter (DBLP doesn't support year filtering in query)
+                    if filters.year and paper.year != filters.year:
+                        continue
+                    if filters.year_start and paper.year and paper.year < filters.year_start:
                         continue
+                    if filters.year_end and paper.year and paper.year > filters.year_end:
+                        continue
+
+                    result.add_paper(paper)
+                except Exception as e:
+                    self.logger.warning(f"Failed to normalize paper: {e}")
+                    continue
 
-        except ET.ParseError as e:
+        except xml_parsing.XML_PARSE_ERRORS as e:
             self.logger.error(f"Failed to parse XML response: {e}")
             raise APIError(f"Invalid XML response: {e}", database=self.database_name)
+        except TransportError as e:
+            raise APIError(
+                f"Failed to read response: {e}", database=self.database_name
+            ) from e
+        finally:
+            response.close()
 
         return result
 
@@ -146,12 +176,10 @@ class DBLPClient(DatabaseClient):
                 url = f"https://dblp.org/rec/{identifier}.xml"
                 response = self._make_request(url)
 
-                root = ET.fromstring(response.text)
-                # Find first publication entry
-                for pub_type in ["article", "inproceedings", "proceedings", "book", "incollection", "phdthesis", "mastersthesis"]:
-                    pub_elem = root.find(f".//{pub_type}")
-                    if pub_elem is not None:
-                        return self._normalize_paper_from_xml(pub_elem)
+                # Stop parsing at the first publication entry instead of
+                # searching the whole tree once per publication type
+                for pub_elem in xml_parsing.iter_elements(response.content, _PUBLICATION_TAGS):
+                    return self._normalize_paper_from_xml(pub_elem)
                 return None
             except Exception as e:
                 self.logger.warning(f"Failed to get paper by DBLP key: {e}")
@@ -159,16 +187,17 @@ class DBLPClient(DatabaseClient):
         return None
 
     def batch_lookup(self, identifiers: List[str], id_type: str) -> SearchResult:
-        """Look up multiple papers."""
+        """Look up multiple papers (concurrently, one request each)."""
         result = SearchResult(
             query_info={"identifiers": identifiers, "id_type": id_type},
             databases_queried=[self.database_name],
         )
 
-        for identifier in identifiers:
-            paper = self.get_by_identifier(identifier, id_type)
-            if paper:
-                result.add_paper(paper)
+        result.extend(
+            self._lookup_many(
+                identifiers, lambda identifier: self.get_by_identifier(identifier, id_type)
+            )
+        )
 
         return result
 
@@ -190,71 +219,66 @@ class DBLPClient(DatabaseClient):
         Returns:
             Normalized Paper object
         """
+        # Collect the child texts in one pass instead of one find() per field;
+        # the first occurrence of a tag wins, as with find()
+        fields: Dict[str, Optional[str]] = {}
+        author_names: List[Optional[str]] = []
+        for child in info_elem:
+            tag = child.tag
+            if tag == "author":
+                author_names.append(child.text)
+            elif tag == "authors":
+                # Search results wrap authors in <authors>; records list them directly
+                author_names.extend(author_elem.text for author_elem in child)
+            elif tag not in fields:
+                fields[tag] = child.text
+
         # Extract title
-        title_elem = info_elem.find("title")
-        title = TextNormalizer.clean_text(
-            title_elem.text if title_elem is not None else None
-        ) or "Unknown"
+        title = TextNormalizer.clean_text(fields.get("title")) or "Unknown"
 
         # Extract authors
-        authors = []
-        for author_elem in info_elem.findall("author"):
-            if author_elem.text:
-                author = AuthorNormalizer.create_author(name=author_elem.text)
-                authors.append(author)
+        authors = [
+            AuthorNormalizer.create_author(name=name) for name in author_names if name
+        ]
 
         # Extract venue information
-        venue_elem = info_elem.find("venue")
-        venue = TextNormalizer.clean_text(
-            venue_elem.text if venue_elem is not None else None
-        )
-
-        # Determine if journal or conference using VenueNormalizer
-        pub_type = info_elem.find("type")
-        pub_type_str = pub_type.text if pub_type is not None else None
-        
-        # Use VenueNormalizer to classify venue
-        journal, conference = VenueNormalizer.classify_venue_type(
-            venue=venue,
-            publication_type=pub_type_str
-        )
+        venue = TextNormalizer.clean_text(fields.get("venue"))
+
+        # Determine if journal or conference; the common labels need no text scan
+        pub_type_str = fields.get("type")
+        if not venue:
+            journal, conference = None, None
+        elif pub_type_str in _CONFERENCE_TYPES:
+            journal, conference = None, venue
+        elif pub_type_str in _JOURNAL_TYPES:
+            journal, conference = venue, None
+        else:
+            journal, conference = VenueNormalizer.classify_venue_type(
+                venue=venue,
+                publication_type=pub_type_str
+            )
 
         # Extract year
-        year_elem = info_elem.find("year")
-        year = DateNormalizer.extract_year(
-            year_elem.text if year_elem is not None else None
-        )
+        year = DateNormalizer.extract_year(fields.get("year"))
 
         # Extract DOI
-        doi_elem = info_elem.find("doi")
-        doi = IdentifierNormalizer.clean_doi(
-            doi_elem.text if doi_elem is not None else None
-        )
+        doi = IdentifierNormalizer.clean_doi(fields.get("doi"))
 
         # Extract URL (DBLP page)
-        url_elem = info_elem.find("url")
-        url = URLNormalizer.clean_url(
-            url_elem.text if url_elem is not None else None
-        )
+        url = URLNormalizer.clean_url(fields.get("url"))
 
         # Extract electronic edition (ee) - often links to PDF or publisher page
-        ee_elem = info_elem.find("ee")
-        ee_url = URLNormalizer.clean_url(
-            ee_elem.text if ee_elem is not None else None
-        )
+        ee_url = URLNormalizer.clean_url(fields.get("ee"))
 
         # Extract DBLP key
-        key_elem = info_elem.find("key")
-        dblp_key = TextNormalizer.clean_text(
-            key_elem.text if key_elem is not None else None
-        )
+        dblp_key = TextNormalizer.clean_text(fields.get("key"))
 
         # Determine PDF URL
-        pdf_url = None
-        if ee_url and any(domain in ee_url for domain in ["arxiv.org", "pdf"]):
-            pdf_url = ee_url
+        pdf_url = ee_url if ee_url and _PDF_HINT_PATTERN.search(ee_url) else None
 
-        return Paper(
+        # Each <info> field was read as text and cleaned or parsed above, so
+        # the hit can be turned into a Paper without validation
+        return Paper.model_construct(
             doi=doi,
             title=title,
             authors=authors,
@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional
 from ..core.base import DatabaseClient
 from ..core.models import Paper, Author, SearchFilters, SearchResult
 from ..core.exceptions import APIError
+from ..utils.doi_cache import DOICache
 
 
 class DOIClient(DatabaseClient):
@@ -17,6 +18,9 @@ class DOIClient(DatabaseClient):
 
     BASE_URL = "https://doi.org"
 
+    # doi.org redirects every lookup to the registration agency; stay modest
+    MAX_CONCURRENT_LOOKUPS = 5
+
     @property
     def database_name(self) -> str:
         """Return database name."""
@@ -51,12 +55,20 @@ class DOIClient(DatabaseClient):
         """
         Get paper by DOI using content negotiation.
 
+        Resolved DOIs are kept in an in-memory LRU cache of CACHE_SIZE
+        entries, so repeated lookups do not go back to doi.org. Failed
+        lookups are not cached.
+
         Args:
             doi: Digital Object Identifier
 
         Returns:
             Paper object or None
         """
+        return self._cached_lookup(DOICache.normalize_doi(doi), lambda: self._resolve(doi))
+
+    def _resolve(self, doi: str) -> Optional[Paper]:
+        """Fetch and normalize the metadata of a DOI (uncached)."""
         try:
             url = f"{self.BASE_URL}/{doi}"
 
@@ -64,7 +76,7 @@ class DOIClient(DatabaseClient):
             headers = {"Accept": "application/vnd.citationstyles.csl+json"}
 
             response = self._make_request(url, headers=headers)
-            data = response.json()
+            data = self._parse_json(response)
 
             return self._normalize_paper(data)
         except APIError as e:
@@ -78,17 +90,14 @@ class DOIClient(DatabaseClient):
         return None
 
     def batch_lookup(self, identifiers: List[str], id_type: str) -> SearchResult:
-        """Look up multiple papers."""
+        """Look up multiple papers (concurrently, one request each)."""
         result = SearchResult(
             query_info={"identifiers": identifiers, "id_type": id_type},
             databases_queried=[self.database_name],
         )
 
         if id_type.lower() == "doi":
-            for doi in identifiers:
-                paper = self.get_by_doi(doi)
-                if paper:
-                    result.add_paper(paper)
+            result.extend(self._lookup_many(identifiers, self.get_by_doi))
 
         return result
 
@@ -104,7 +113,7 @@ class DOIClient(DatabaseClient):
         """
         # Extract authors
         authors = []
-        for author_data in raw_data.get("author", []):
+        for author_data in raw_data.get("author") or ():
             # CSL format uses "family" and "given" names
             name_parts = []
             if "given" in author_data:
@@ -163,6 +172,14 @@ class DOIClient(DatabaseClient):
         if isinstance(title, list):
             title = title[0] if title else "Unknown"
 
+        extra_data: Dict[str, Any] = {
+            "type": raw_data.get("type"),
+            "issn": raw_data.get("ISSN"),
+            "isbn": raw_data.get("ISBN"),
+        }
+        if self.config.keep_raw_data:
+            extra_data["raw"] = raw_data
+
         return Paper(
             doi=doi,
             title=title,
@@ -179,12 +196,7 @@ class DOIClient(DatabaseClient):
             url=url,
             source_database=self.database_name,
             source_id=doi,
-            extra_data={
-                "type": raw_data.get("type"),
-                "issn": raw_data.get("ISSN"),
-                "isbn": raw_data.get("ISBN"),
-                "raw": raw_data,
-            },
+            extra_data=extra_data,
         )
 
     def get_supported_fields(self) -> List[str]:
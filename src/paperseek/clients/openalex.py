@@ -1,10 +1,15 @@
 """OpenAlex API client implementation."""
 
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, cast
+
+import requests
+from urllib3.exceptions import HTTPError as TransportError
 
 from ..core.base import DatabaseClient
 from ..core.models import Paper, Author, SearchFilters, SearchResult
 from ..core.exceptions import APIError
+from ..utils import serialization
 from ..utils.normalization import (
     TextNormalizer,
     DateNormalizer,
@@ -14,6 +19,10 @@ from ..utils.normalization import (
     VenueNormalizer,
 )
 
+# Shared read-only stand-in for missing nested objects, so lookups on absent
+# sections do not allocate a fresh dict per paper
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 
 class OpenAlexClient(DatabaseClient):
     """
@@ -29,6 +38,15 @@ class OpenAlexClient(DatabaseClient):
 
     BASE_URL = "https://api.openalex.org"
 
+    # Maximum number of values OpenAlex accepts in one OR filter
+    BATCH_SIZE = 50
+
+    # Polite pool allows ~10 requests/second
+    MAX_CONCURRENT_LOOKUPS = 10
+
+    # Result pages larger than this are decoded incrementally when ijson is installed
+    STREAM_THRESHOLD_BYTES = 1_000_000
+
     @property
     def database_name(self) -> str:
         """Return database name."""
@@ -42,6 +60,7 @@ class OpenAlexClient(DatabaseClient):
         headers: Optional[Dict[str, str]] = None,
         json_data: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
+        stream: bool = False,
     ):
         """
         Make an HTTP request with OpenAlex-specific polite pool support.
@@ -56,6 +75,7 @@ class OpenAlexClient(DatabaseClient):
             headers: Additional headers
             json_data: JSON data for POST requests
             timeout: Request timeout
+            stream: Defer downloading the body (see DatabaseClient._make_request)
 
         Returns:
             Response object
@@ -79,6 +99,7 @@ class OpenAlexClient(DatabaseClient):
             headers=headers,
             json_data=json_data,
             timeout=timeout,
+            stream=stream,
         )
 
     def search(self, filters: SearchFilters) -> SearchResult:
@@ -127,26 +148,51 @@ class OpenAlexClient(DatabaseClient):
 
         # Make request
         url = f"{self.BASE_URL}/works"
-        response = self._make_request(url, params=params)
-
-        data = response.json()
+        response = self._make_request(url, params=params, stream=True)
 
         # Parse results
         result = SearchResult(
             query_info={"filters": filters.model_dump()}, databases_queried=[self.database_name]
         )
 
-        results = data.get("results", [])
-        for item in results:
-            try:
-                paper = self._normalize_paper(item)
-                result.add_paper(paper)
-            except Exception as e:
-                self.logger.warning(f"Failed to normalize paper: {e}")
-                continue
+        try:
+            for item in self._iter_results(response):
+                try:
+                    paper = self._normalize_paper(item)
+                    result.add_paper(paper)
+                except Exception as e:
+                    self.logger.warning(f"Failed to normalize paper: {e}")
+                    continue
+        except serialization.JSON_DECODE_ERRORS as e:
+            raise APIError(f"Invalid JSON response: {e}", database=self.database_name) from e
+        except TransportError as e:
+            raise APIError(f"Failed to read response: {e}", database=self.database_name) from e
+        finally:
+            response.close()
 
         return result
 
+    def _iter_results(self, response: requests.Response) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the works of a result page.
+
+        Pages above STREAM_THRESHOLD_BYTES are decoded one work at a time
+        straight from the connection when ijson is installed, so the raw
+        records never all sit in memory at once; smaller pages are decoded
+        in one go, which is faster.
+
+        Args:
+            response: Streamed response of a /works request
+
+        Returns:
+            Iterator over raw work records
+        """
+        size = response.headers.get("Content-Length")
+        if serialization.IJSON_AVAILABLE and size and int(size) > self.STREAM_THRESHOLD_BYTES:
+            response.raw.decode_content = True
+            return serialization.iter_items(response.raw, "results.item")
+        return iter(self._parse_json(response).get("results", []))
+
     def get_by_doi(self, doi: str) -> Optional[Paper]:
         """
         Get paper by DOI.
@@ -161,7 +207,7 @@ class OpenAlexClient(DatabaseClient):
             # OpenAlex uses DOI URLs as IDs
             url = f"{self.BASE_URL}/works/https://doi.org/{doi}"
             response = self._make_request(url)
-            data = response.json()
+            data = self._parse_json(response)
             return self._normalize_paper(data)
         except APIError:
             return None
@@ -174,26 +220,77 @@ class OpenAlexClient(DatabaseClient):
             try:
                 url = f"{self.BASE_URL}/works/{identifier}"
                 response = self._make_request(url)
-                data = response.json()
+                data = self._parse_json(response)
                 return self._normalize_paper(data)
             except APIError:
                 return None
         return None
 
     def batch_lookup(self, identifiers: List[str], id_type: str) -> SearchResult:
-        """Look up multiple papers."""
+        """
+        Look up multiple papers.
+
+        DOIs are resolved BATCH_SIZE at a time with an OR filter
+        (``filter=doi:a|b|c``), several batches in flight at once; other
+        identifier types, and DOIs a batch could not resolve, are looked up
+        concurrently one by one.
+        """
         result = SearchResult(
             query_info={"identifiers": identifiers, "id_type": id_type},
             databases_queried=[self.database_name],
         )
 
-        for identifier in identifiers:
-            paper = self.get_by_identifier(identifier, id_type)
-            if paper:
-                result.add_paper(paper)
+        if id_type.lower() != "doi":
+            result.extend(
+                self._lookup_many(
+                    identifiers, lambda identifier: self.get_by_identifier(identifier, id_type)
+                )
+            )
+            return result
+
+        # Separators inside a DOI would break the filter syntax
+        dois = [IdentifierNormalizer.clean_doi(doi) or doi for doi in identifiers]
+        batchable = [doi for doi in dois if "|" not in doi and "," not in doi]
+        individual = [doi for doi in dois if "|" in doi or "," in doi]
+
+        # Chunks are independent requests, so their round trips overlap
+        chunks = [
+            batchable[start : start + self.BATCH_SIZE]
+            for start in range(0, len(batchable), self.BATCH_SIZE)
+        ]
+        for chunk, items in zip(chunks, self._map_concurrently(self._fetch_dois, chunks)):
+            if items is None:
+                individual.extend(chunk)
+                continue
+
+            for item in items:
+                try:
+                    result.add_paper(self._normalize_paper(item))
+                except Exception as e:
+                    self.logger.warning(f"Failed to normalize paper: {e}")
+
+        result.extend(self._lookup_many(individual, self.get_by_doi))
 
         return result
 
+    def _fetch_dois(self, dois: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch the works for several DOIs with one OR-filtered request.
+
+        Args:
+            dois: Cleaned DOIs (without "|" or ",")
+
+        Returns:
+            Raw work records, or None if the request failed
+        """
+        params: Dict[str, Any] = {"filter": "doi:" + "|".join(dois), "per-page": len(dois)}
+        try:
+            response = self._make_request(f"{self.BASE_URL}/works", params=params)
+            return cast(List[Dict[str, Any]], self._parse_json(response).get("results", []))
+        except Exception as e:
+            self.logger.warning(f"Batch lookup failed, falling back to individual: {e}")
+            return None
+
     def _normalize_paper(self, raw_data: Dict[str, Any]) -> Paper:
         """
         Normalize OpenAlex data to Paper model.
@@ -204,34 +301,34 @@ class OpenAlexClient(DatabaseClient):
         Returns:
             Normalized Paper object
         """
+        get = raw_data.get
+
         # Extract authors
         authors = []
-        for authorship in raw_data.get("authorships", []):
-            author_info = authorship.get("author", {})
+        for authorship in get("authorships") or ():
+            author_info = authorship.get("author") or _EMPTY
             name = author_info.get("display_name", "Unknown")
 
             # Get affiliation
-            institutions = authorship.get("institutions", [])
+            institutions = authorship.get("institutions")
             affiliation = institutions[0].get("display_name") if institutions else None
 
             # Get ORCID
-            orcid = author_info.get("orcid")
-            if orcid:
-                orcid = orcid.replace("https://orcid.org/", "")
+            orcid = IdentifierNormalizer.clean_orcid(author_info.get("orcid"))
 
             authors.append(Author(name=name, affiliation=affiliation, orcid=orcid))
 
         # Extract year
-        year = raw_data.get("publication_year")
+        year = get("publication_year")
 
         # Extract venue information
-        host_venue = raw_data.get("host_venue") or raw_data.get("primary_location", {}).get(
-            "source", {}
+        host_venue = (
+            get("host_venue") or (get("primary_location") or _EMPTY).get("source") or _EMPTY
         )
-        venue = host_venue.get("display_name") if host_venue else None
+        venue = host_venue.get("display_name")
 
         # Determine if conference or journal
-        venue_type = host_venue.get("type") if host_venue else None
+        venue_type = host_venue.get("type")
         conference = None
         journal = None
         if venue_type == "conference":
@@ -244,51 +341,51 @@ class OpenAlexClient(DatabaseClient):
 
         # Extract abstract (inverted index format)
         abstract = None
-        abstract_inverted = raw_data.get("abstract_inverted_index")
+        abstract_inverted = get("abstract_inverted_index")
         if abstract_inverted:
             abstract = self._reconstruct_abstract(abstract_inverted)
 
         # Extract DOI
-        doi = raw_data.get("doi")
-        if doi:
-            doi = doi.replace("https://doi.org/", "")
+        doi = IdentifierNormalizer.clean_doi(get("doi"))
 
         # Get PDF URL
-        pdf_url = None
-        if raw_data.get("open_access", {}).get("oa_url"):
-            pdf_url = raw_data["open_access"]["oa_url"]
+        open_access = get("open_access") or _EMPTY
+        pdf_url = open_access.get("oa_url") or None
 
         # Extract keywords (concepts)
         keywords = [
             concept.get("display_name")
-            for concept in raw_data.get("concepts", [])
+            for concept in get("concepts") or ()
             if concept.get("score", 0) > 0.3  # Only high-confidence concepts
         ]
 
+        extra_data: Dict[str, Any] = {
+            "openalex_id": get("id"),
+            "type": get("type"),
+            "biblio": get("biblio"),
+        }
+        if self.config.keep_raw_data:
+            extra_data["raw"] = raw_data
+
         return Paper(
             doi=doi,
-            title=raw_data.get("display_name") or raw_data.get("title", "Unknown"),
+            title=get("display_name") or get("title", "Unknown"),
             authors=authors,
             abstract=abstract,
             year=year,
-            publication_date=raw_data.get("publication_date"),
+            publication_date=get("publication_date"),
             venue=venue,
             journal=journal,
             conference=conference,
             keywords=keywords,
-            citation_count=raw_data.get("cited_by_count"),
-            reference_count=len(raw_data.get("referenced_works", [])),
-            url=raw_data.get("doi"),
+            citation_count=get("cited_by_count"),
+            reference_count=len(get("referenced_works") or ()),
+            url=get("doi"),
             pdf_url=pdf_url,
-            is_open_access=raw_data.get("open_access", {}).get("is_oa", False),
+            is_open_access=open_access.get("is_oa", False),
             source_database=self.database_name,
-            source_id=raw_data.get("id"),
-            extra_data={
-                "openalex_id": raw_data.get("id"),
-                "type": raw_data.get("type"),
-                "biblio": raw_data.get("biblio"),
-                "raw": raw_data,
-            },
+            source_id=get("id"),
+            extra_data=extra_data,
         )
 
     def _reconstruct_abstract(self, inverted_index: Dict[str, List[int]]) -> str:
@@ -301,13 +398,27 @@ class OpenAlexClient(DatabaseClient):
         Returns:
             Reconstructed abstract text
         """
-        # Create list of (position, word) tuples
-        word_positions = []
-        for word, positions in inverted_index.items():
-            for pos in positions:
-                word_positions.append((pos, word))
-
-        # Sort by position and join
+        count = sum(len(positions) for positions in inverted_index.values())
+        non_empty = [positions for positions in inverted_index.values() if positions]
+        min_pos = min((min(positions) for positions in non_empty), default=0)
+        max_pos = max((max(positions) for positions in non_empty), default=-1)
+
+        # Positions are small dense integers, so place each word directly
+        # instead of sorting (position, word) pairs. Sparse indexes fall back
+        # to sorting rather than allocating a huge list, and so do negative or
+        # shared positions, which the sort keeps in order instead of dropping
+        if min_pos >= 0 and max_pos < 2 * count:
+            slots: List[Optional[str]] = [None] * (max_pos + 1)
+            for word, positions in inverted_index.items():
+                for pos in positions:
+                    slots[pos] = word
+            words = [word for word in slots if word is not None]
+            if len(words) == count:
+                return " ".join(words)
+
+        word_positions = [
+            (pos, word) for word, positions in inverted_index.items() for pos in positions
+        ]
         word_positions.sort(key=lambda x: x[0])
         return " ".join(word for _, word in word_positions)
 
@@ -3,18 +3,29 @@
 from typing import Any, Dict, List, Optional
 import xml.etree.ElementTree as ET
 
+from urllib3.exceptions import HTTPError as TransportError
+
 from ..core.base import DatabaseClient
 from ..core.models import Paper, Author, SearchFilters, SearchResult
 from ..core.exceptions import APIError
+from ..utils import xml_parsing
+from ..utils.doi_cache import DOICache
 from ..utils.normalization import (
     TextNormalizer,
     DateNormalizer,
     AuthorNormalizer,
     IdentifierNormalizer,
-    URLNormalizer,
 )
 
 
+def _children_by_tag(element: Any) -> Dict[str, Any]:
+    """Map each child tag to its first occurrence, in one pass over the children."""
+    children: Dict[str, Any] = {}
+    for child in element:
+        children.setdefault(child.tag, child)
+    return children
+
+
 class PubMedClient(DatabaseClient):
     """
     Client for PubMed E-utilities API.
@@ -30,6 +41,10 @@ class PubMedClient(DatabaseClient):
     """
 
     BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+    FETCH_BATCH_SIZE = 200  # PMIDs per efetch request (NCBI recommendation)
+
+    # NCBI asks for no more than three concurrent connections
+    MAX_CONCURRENT_LOOKUPS = 3
 
     @property
     def database_name(self) -> str:
@@ -44,6 +59,7 @@ class PubMedClient(DatabaseClient):
         headers: Optional[Dict[str, str]] = None,
         json_data: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
+        stream: bool = False,
     ):
         """
         Make an HTTP request with PubMed-specific parameters.
@@ -57,6 +73,7 @@ class PubMedClient(DatabaseClient):
             headers: Additional headers
             json_data: JSON data for POST requests
             timeout: Request timeout
+            stream: Defer downloading the body (see DatabaseClient._make_request)
 
         Returns:
             Response object
@@ -80,6 +97,7 @@ class PubMedClient(DatabaseClient):
             headers=headers,
             json_data=json_data,
             timeout=timeout,
+            stream=stream,
         )
 
     def search(self, filters: SearchFilters) -> SearchResult:
@@ -121,20 +139,21 @@ class PubMedClient(DatabaseClient):
 
         query = " AND ".join(query_parts)
 
-        # Step 1: Search for PMIDs
+        # Step 1: Search for PMIDs, keeping the result set on the history server
         search_params = {
             "db": "pubmed",
             "term": query,
             "retmax": min(filters.max_results, 10000),  # PubMed max
             "retstart": filters.offset,
             "retmode": "json",
+            "usehistory": "y",
         }
 
         search_url = f"{self.BASE_URL}/esearch.fcgi"
         search_response = self._make_request(search_url, params=search_params)
-        search_data = search_response.json()
+        search_data = self._parse_json(search_response).get("esearchresult", {})
 
-        pmids = search_data.get("esearchresult", {}).get("idlist", [])
+        pmids = search_data.get("idlist", [])
 
         if not pmids:
             return SearchResult(
@@ -148,45 +167,114 @@ class PubMedClient(DatabaseClient):
             databases_queried=[self.database_name],
         )
 
-        # Fetch in batches of 200 (PubMed recommendation)
-        batch_size = 200
-        for i in range(0, len(pmids), batch_size):
-            batch_pmids = pmids[i : i + batch_size]
-            fetch_params = {
-                "db": "pubmed",
-                "id": ",".join(batch_pmids),
-                "retmode": "xml",
-            }
+        # Fetch the batches concurrently, keeping the search order. With a
+        # history entry each efetch names a slice of it instead of its PMIDs.
+        web_env = search_data.get("webenv")
+        query_key = search_data.get("querykey")
+        if web_env and query_key:
+            pages = [
+                {
+                    "WebEnv": web_env,
+                    "query_key": query_key,
+                    "retstart": filters.offset + start,
+                    "retmax": min(self.FETCH_BATCH_SIZE, len(pmids) - start),
+                }
+                for start in range(0, len(pmids), self.FETCH_BATCH_SIZE)
+            ]
+            batches = self._map_concurrently(self._efetch, pages)
+        else:
+            batches = self._map_concurrently(self._fetch_articles, self._fetch_batches(pmids))
 
-            fetch_url = f"{self.BASE_URL}/efetch.fcgi"
-            fetch_response = self._make_request(fetch_url, params=fetch_params)
-
-            # Parse XML response
-            try:
-                root = ET.fromstring(fetch_response.text)
-                for article_elem in root.findall(".//PubmedArticle"):
-                    try:
-                        paper = self._normalize_paper_from_xml(article_elem)
-                        result.add_paper(paper)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to normalize paper: {e}")
-                        continue
-            except ET.ParseError as e:
-                self.logger.error(f"Failed to parse XML response: {e}")
-                raise APIError(f"Invalid XML response: {e}", database=self.database_name)
+        for papers in batches:
+            result.extend(papers)
 
         return result
 
+    def _fetch_batches(self, pmids: List[str]) -> List[List[str]]:
+        """Split PMIDs into efetch-sized batches."""
+        return [
+            pmids[start : start + self.FETCH_BATCH_SIZE]
+            for start in range(0, len(pmids), self.FETCH_BATCH_SIZE)
+        ]
+
+    def _fetch_articles(self, pmids: List[str]) -> List[Paper]:
+        """
+        Fetch and normalize the articles for a batch of PMIDs with one efetch request.
+
+        Args:
+            pmids: PubMed IDs (at most FETCH_BATCH_SIZE)
+
+        Returns:
+            Papers, in the order efetch returns them
+
+        Raises:
+            APIError: If the request fails or the response is not valid XML
+        """
+        return self._efetch({"id": ",".join(pmids)})
+
+    def _efetch(self, selection: Dict[str, Any]) -> List[Paper]:
+        """
+        Fetch and normalize the articles selected by one efetch request.
+
+        Args:
+            selection: efetch parameters choosing the articles, either "id" or a
+                history slice ("WebEnv", "query_key", "retstart", "retmax")
+
+        Returns:
+            Papers, in the order efetch returns them
+
+        Raises:
+            APIError: If the request fails or the response is not valid XML
+        """
+        fetch_params = {
+            "db": "pubmed",
+            "retmode": "xml",
+            **selection,
+        }
+
+        fetch_url = f"{self.BASE_URL}/efetch.fcgi"
+        fetch_response = self._make_request(fetch_url, params=fetch_params, stream=True)
+
+        papers = []
+        try:
+            # Parse articles off the connection, so normalization overlaps the download
+            fetch_response.raw.decode_content = True
+            for article_elem in xml_parsing.iter_elements(fetch_response.raw, "PubmedArticle"):
+                try:
+                    papers.append(self._normalize_paper_from_xml(article_elem))
+                except Exception as e:
+                    self.logger.warning(f"Failed to normalize paper: {e}")
+                    continue
+        except xml_parsing.XML_PARSE_ERRORS as e:
+            self.logger.error(f"Failed to parse XML response: {e}")
+            raise APIError(f"Invalid XML response: {e}", database=self.database_name)
+        except TransportError as e:
+            raise APIError(
+                f"Failed to read response: {e}", database=self.database_name
+            ) from e
+        finally:
+            fetch_response.close()
+
+        return papers
+
     def get_by_doi(self, doi: str) -> Optional[Paper]:
         """
         Get paper by DOI.
 
+        Found papers are cached in memory (see DatabaseClient._cached_lookup).
+
         Args:
             doi: Digital Object Identifier
 
         Returns:
             Paper object or None
         """
+        return self._cached_lookup(
+            ("doi", DOICache.normalize_doi(doi)), lambda: self._search_doi(doi)
+        )
+
+    def _search_doi(self, doi: str) -> Optional[Paper]:
+        """Find the paper for a DOI with an esearch/efetch round trip (uncached)."""
         try:
             filters = SearchFilters(doi=doi, max_results=1)
             result = self.search(filters)
@@ -196,31 +284,23 @@ class PubMedClient(DatabaseClient):
             return None
 
     def get_by_identifier(self, identifier: str, id_type: str) -> Optional[Paper]:
-        """Get paper by identifier."""
+        """Get paper by identifier (found papers are cached in memory)."""
         if id_type.lower() == "doi":
             return self.get_by_doi(identifier)
         elif id_type.lower() in ["pmid", "pubmed"]:
-            try:
-                fetch_params = {
-                    "db": "pubmed",
-                    "id": identifier,
-                    "retmode": "xml",
-                }
-
-                fetch_url = f"{self.BASE_URL}/efetch.fcgi"
-                fetch_response = self._make_request(fetch_url, params=fetch_params)
-
-                # Parse XML response
-                root = ET.fromstring(fetch_response.text)
-                article_elem = root.find(".//PubmedArticle")
-                if article_elem is not None:
-                    return self._normalize_paper_from_xml(article_elem)
-                return None
-            except Exception as e:
-                self.logger.warning(f"Failed to get paper by PMID: {e}")
-                return None
+            pmid = identifier.strip()
+            return self._cached_lookup(("pmid", pmid), lambda: self._fetch_article(pmid))
         return None
 
+    def _fetch_article(self, pmid: str) -> Optional[Paper]:
+        """Fetch the article for one PMID (uncached)."""
+        try:
+            papers = self._fetch_articles([pmid])
+            return papers[0] if papers else None
+        except Exception as e:
+            self.logger.warning(f"Failed to get paper by PMID: {e}")
+            return None
+
     def batch_lookup(self, identifiers: List[str], id_type: str) -> SearchResult:
         """Look up multiple papers."""
         result = SearchResult(
@@ -230,31 +310,22 @@ class PubMedClient(DatabaseClient):
 
         if id_type.lower() in ["pmid", "pubmed"]:
             # Can fetch multiple PMIDs at once
-            fetch_params = {
-                "db": "pubmed",
-                "id": ",".join(identifiers),
-                "retmode": "xml",
-            }
-
-            fetch_url = f"{self.BASE_URL}/efetch.fcgi"
             try:
-                fetch_response = self._make_request(fetch_url, params=fetch_params)
-                root = ET.fromstring(fetch_response.text)
-                for article_elem in root.findall(".//PubmedArticle"):
-                    try:
-                        paper = self._normalize_paper_from_xml(article_elem)
-                        result.add_paper(paper)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to normalize paper: {e}")
-                        continue
+                batches = self._map_concurrently(
+                    self._fetch_articles, self._fetch_batches(identifiers)
+                )
             except Exception as e:
                 self.logger.error(f"Failed to batch lookup: {e}")
+            else:
+                for papers in batches:
+                    result.extend(papers)
         else:
-            # Fetch individually for other identifier types
-            for identifier in identifiers:
-                paper = self.get_by_identifier(identifier, id_type)
-                if paper:
-                    result.add_paper(paper)
+            # Fetch concurrently one by one for other identifier types
+            result.extend(
+                self._lookup_many(
+                    identifiers, lambda identifier: self.get_by_identifier(identifier, id_type)
+                )
+            )
 
         return result
 
@@ -272,7 +343,7 @@ class PubMedClient(DatabaseClient):
         Normalize PubMed XML data to Paper model.
 
         Args:
-            article_elem: PubmedArticle XML element
+            article_elem: PubmedArticle XML element (stdlib or lxml)
 
         Returns:
             Normalized Paper object
@@ -281,35 +352,51 @@ class PubMedClient(DatabaseClient):
         if medline_citation is None:
             raise ValueError("Invalid PubMed article: missing MedlineCitation")
 
-        article = medline_citation.find("Article")
+        # Collect the sections once instead of searching for each field
+        citation_parts = _children_by_tag(medline_citation)
+        article = citation_parts.get("Article")
         if article is None:
             raise ValueError("Invalid PubMed article: missing Article")
+        article_parts = _children_by_tag(article)
+
+        # Index the article IDs by type; reversed so the first of each type wins
+        article_ids: Dict[Optional[str], Optional[str]] = {}
+        article_id_list = article_elem.find("PubmedData/ArticleIdList")
+        if article_id_list is not None:
+            article_ids = {
+                article_id.get("IdType"): article_id.text
+                for article_id in reversed(article_id_list.findall("ArticleId"))
+            }
 
-        # Extract PMID
-        pmid_elem = medline_citation.find("PMID")
+        # Extract PMID, falling back to the article ID list
+        pmid_elem = citation_parts.get("PMID")
         pmid = IdentifierNormalizer.extract_pmid(
-            pmid_elem.text if pmid_elem is not None else None
+            pmid_elem.text if pmid_elem is not None else article_ids.get("pubmed")
         )
 
         # Extract title with text normalization
-        title_elem = article.find("ArticleTitle")
+        title_elem = article_parts.get("ArticleTitle")
         title = TextNormalizer.clean_text(
             title_elem.text if title_elem is not None else None
         ) or "Unknown"
 
         # Extract authors using AuthorNormalizer
         authors = []
-        author_list = article.find("AuthorList")
+        author_list = article_parts.get("AuthorList")
         if author_list is not None:
             for author_elem in author_list.findall("Author"):
-                last_name = author_elem.findtext("LastName", "")
-                fore_name = author_elem.findtext("ForeName", "")
-                
-                # Get affiliation
-                affiliation_elem = author_elem.find(".//Affiliation")
-                affiliation = TextNormalizer.clean_text(
-                    affiliation_elem.text if affiliation_elem is not None else None
-                )
+                # One pass over the author's children; the first affiliation wins
+                last_name = fore_name = ""
+                affiliation_text = None
+                for child in author_elem:
+                    tag = child.tag
+                    if tag == "LastName":
+                        last_name = child.text or ""
+                    elif tag == "ForeName":
+                        fore_name = child.text or ""
+                    elif tag == "AffiliationInfo" and affiliation_text is None:
+                        affiliation_text = child.findtext("Affiliation")
+                affiliation = TextNormalizer.clean_text(affiliation_text)
 
                 author = AuthorNormalizer.create_author(
                     given=fore_name,
@@ -319,50 +406,39 @@ class PubMedClient(DatabaseClient):
                 authors.append(author)
 
         # Extract abstract with text normalization
-        abstract_elem = article.find("Abstract/AbstractText")
+        abstract_section = article_parts.get("Abstract")
         abstract = TextNormalizer.clean_text(
-            abstract_elem.text if abstract_elem is not None else None
+            abstract_section.findtext("AbstractText") if abstract_section is not None else None
         )
 
-        # Extract year using DateNormalizer
+        # Extract year (DateNormalizer) and journal (text normalization)
         year = None
-        pub_date = article.find(".//PubDate")
-        if pub_date is not None:
-            year_elem = pub_date.find("Year")
+        journal = None
+        journal_section = article_parts.get("Journal")
+        if journal_section is not None:
             year = DateNormalizer.extract_year(
-                year_elem.text if year_elem is not None else None
+                journal_section.findtext("JournalIssue/PubDate/Year")
             )
-
-        # Extract journal with text normalization
-        journal_elem = article.find(".//Journal/Title")
-        journal = TextNormalizer.clean_text(
-            journal_elem.text if journal_elem is not None else None
-        )
+            journal = TextNormalizer.clean_text(journal_section.findtext("Title"))
 
         # Extract DOI
-        doi = None
-        article_id_list = article_elem.find(".//PubmedData/ArticleIdList")
-        if article_id_list is not None:
-            for article_id in article_id_list.findall("ArticleId"):
-                if article_id.get("IdType") == "doi":
-                    doi = IdentifierNormalizer.clean_doi(article_id.text)
-                    break
+        doi = IdentifierNormalizer.clean_doi(article_ids.get("doi"))
 
         # Extract keywords with text normalization
         keywords = []
-        keyword_list = medline_citation.find("KeywordList")
+        keyword_list = citation_parts.get("KeywordList")
         if keyword_list is not None:
-            for keyword_elem in keyword_list.findall(".//Keyword"):
-                if keyword_elem.text:
-                    cleaned_keyword = TextNormalizer.clean_text(keyword_elem.text)
-                    if cleaned_keyword:
-                        keywords.append(cleaned_keyword)
+            cleaned_keywords = map(
+                TextNormalizer.clean_text, [elem.text for elem in keyword_list.findall("Keyword")]
+            )
+            keywords = [keyword for keyword in cleaned_keywords if keyword]
 
-        # Construct URL
+        # Construct URL (PMIDs are digits only, so it needs no validation)
         url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/" if pmid else None
-        url = URLNormalizer.clean_url(url)
 
-        return Paper(
+        # The MEDLINE fields were parsed into their final types above (the
+        # year as an int, the authors as Author models), so skip validation
+        return Paper.model_construct(
             doi=doi,
             title=title,
             authors=authors,
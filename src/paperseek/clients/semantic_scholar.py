@@ -6,6 +6,7 @@ from ..core.base import DatabaseClient
 from ..core.models import Paper, Author, SearchFilters, SearchResult
 from ..core.config import DatabaseConfig
 from ..core.exceptions import APIError
+from ..utils.doi_cache import DOICache
 from ..utils.normalization import (
     TextNormalizer,
     DateNormalizer,
@@ -25,6 +26,30 @@ class SemanticScholarClient(DatabaseClient):
 
     BASE_URL = "https://api.semanticscholar.org/graph/v1"
 
+    # Maximum number of IDs accepted by the /paper/batch endpoint
+    BATCH_SIZE = 500
+
+    # Paper fields requested from every endpoint
+    FIELDS_PARAM = ",".join(
+        [
+            "paperId",
+            "externalIds",
+            "title",
+            "abstract",
+            "year",
+            "authors",
+            "venue",
+            "publicationDate",
+            "citationCount",
+            "referenceCount",
+            "isOpenAccess",
+            "openAccessPdf",
+            "fieldsOfStudy",
+            "s2FieldsOfStudy",
+            "publicationTypes",
+        ]
+    )
+
     def __init__(
         self,
         config: DatabaseConfig,
@@ -104,7 +129,7 @@ class SemanticScholarClient(DatabaseClient):
         
         response = self._make_request(url, params=params)
 
-        data = response.json()
+        data = self._parse_json(response)
 
         # Parse results
         result = SearchResult(
@@ -127,40 +152,50 @@ class SemanticScholarClient(DatabaseClient):
         """
         Get paper by DOI.
 
+        Found papers are cached in memory (see DatabaseClient._cached_lookup).
+
         Args:
             doi: Digital Object Identifier
 
         Returns:
             Paper object or None
         """
-        try:
-            url = f"{self.BASE_URL}/paper/DOI:{doi}"
-            params = {"fields": self._get_fields_param()}
-            response = self._make_request(url, params=params)
-            data = response.json()
-            return self._normalize_paper(data)
-        except APIError:
-            return None
+        return self._cached_lookup(
+            f"DOI:{DOICache.normalize_doi(doi)}", lambda: self._get_paper(f"DOI:{doi}")
+        )
 
     def get_by_identifier(self, identifier: str, id_type: str) -> Optional[Paper]:
-        """Get paper by identifier."""
-        try:
-            id_type_lower = id_type.lower()
-
-            if id_type_lower == "doi":
-                return self.get_by_doi(identifier)
-            elif id_type_lower in ["arxiv", "arxiv_id"]:
-                url = f"{self.BASE_URL}/paper/ARXIV:{identifier}"
-            elif id_type_lower == "pmid":
-                url = f"{self.BASE_URL}/paper/PMID:{identifier}"
-            elif id_type_lower in ["s2", "semantic_scholar"]:
-                url = f"{self.BASE_URL}/paper/{identifier}"
-            else:
-                return None
+        """Get paper by identifier (found papers are cached in memory)."""
+        id_type_lower = id_type.lower()
+
+        if id_type_lower == "doi":
+            return self.get_by_doi(identifier)
+        elif id_type_lower in ["arxiv", "arxiv_id"]:
+            paper_id = f"ARXIV:{identifier}"
+        elif id_type_lower == "pmid":
+            paper_id = f"PMID:{identifier}"
+        elif id_type_lower in ["s2", "semantic_scholar"]:
+            paper_id = identifier
+        else:
+            return None
+
+        return self._cached_lookup(paper_id, lambda: self._get_paper(paper_id))
+
+    def _get_paper(self, paper_id: str) -> Optional[Paper]:
+        """
+        Fetch one paper from the /paper endpoint (uncached).
 
+        Args:
+            paper_id: Semantic Scholar paper ID, optionally prefixed (e.g. "ARXIV:2101.00001")
+
+        Returns:
+            Paper object or None
+        """
+        try:
+            url = f"{self.BASE_URL}/paper/{paper_id}"
             params = {"fields": self._get_fields_param()}
             response = self._make_request(url, params=params)
-            data = response.json()
+            data = self._parse_json(response)
             return self._normalize_paper(data)
         except APIError:
             return None
@@ -169,6 +204,9 @@ class SemanticScholarClient(DatabaseClient):
         """
         Look up multiple papers (supports batch API).
 
+        Identifiers are sent to the batch endpoint in chunks of BATCH_SIZE;
+        a chunk whose request fails falls back to individual lookups.
+
         Args:
             identifiers: List of identifiers
             id_type: Type of identifier
@@ -181,50 +219,44 @@ class SemanticScholarClient(DatabaseClient):
             databases_queried=[self.database_name],
         )
 
-        # S2 supports batch lookup via POST
-        if len(identifiers) <= 500:  # Batch limit
-            try:
-                url = f"{self.BASE_URL}/paper/batch"
-
-                # Format IDs based on type
-                id_type_lower = id_type.lower()
-                if id_type_lower == "doi":
-                    formatted_ids = [f"DOI:{id}" for id in identifiers]
-                elif id_type_lower in ["arxiv", "arxiv_id"]:
-                    formatted_ids = [f"ARXIV:{id}" for id in identifiers]
-                elif id_type_lower == "pmid":
-                    formatted_ids = [f"PMID:{id}" for id in identifiers]
-                else:
-                    formatted_ids = identifiers
-
-                params = {"fields": self._get_fields_param()}
-                json_data = {"ids": formatted_ids}
+        # Format IDs based on type
+        id_type_lower = id_type.lower()
+        if id_type_lower == "doi":
+            id_prefix = "DOI:"
+        elif id_type_lower in ["arxiv", "arxiv_id"]:
+            id_prefix = "ARXIV:"
+        elif id_type_lower == "pmid":
+            id_prefix = "PMID:"
+        else:
+            id_prefix = ""
+
+        url = f"{self.BASE_URL}/paper/batch"
+        params = {"fields": self._get_fields_param()}
 
+        for start in range(0, len(identifiers), self.BATCH_SIZE):
+            chunk = identifiers[start : start + self.BATCH_SIZE]
+            try:
+                json_data = {"ids": [f"{id_prefix}{id}" for id in chunk]}
                 response = self._make_request(
                     url, method="POST", params=params, json_data=json_data
                 )
-                data = response.json()
-
-                for item in data:
-                    if item:  # Some may be None if not found
-                        try:
-                            paper = self._normalize_paper(item)
-                            result.add_paper(paper)
-                        except Exception as e:
-                            self.logger.warning(f"Failed to normalize paper: {e}")
+                data = self._parse_json(response)
             except Exception as e:
                 self.logger.warning(f"Batch lookup failed, falling back to individual: {e}")
-                # Fallback to individual lookups
-                for identifier in identifiers:
-                    paper = self.get_by_identifier(identifier, id_type)
-                    if paper:
+                result.extend(
+                    self._lookup_many(
+                        chunk, lambda identifier: self.get_by_identifier(identifier, id_type)
+                    )
+                )
+                continue
+
+            for item in data:
+                if item:  # Some may be None if not found
+                    try:
+                        paper = self._normalize_paper(item)
                         result.add_paper(paper)
-        else:
-            # Too many for batch, do individual lookups
-            for identifier in identifiers:
-                paper = self.get_by_identifier(identifier, id_type)
-                if paper:
-                    result.add_paper(paper)
+                    except Exception as e:
+                        self.logger.warning(f"Failed to normalize paper: {e}")
 
         return result
 
@@ -240,24 +272,7 @@ class SemanticScholarClient(DatabaseClient):
 
     def _get_fields_param(self) -> str:
         """Get the fields parameter for API requests."""
-        fields = [
-            "paperId",
-            "externalIds",
-            "title",
-            "abstract",
-            "year",
-            "authors",
-            "venue",
-            "publicationDate",
-            "citationCount",
-            "referenceCount",
-            "isOpenAccess",
-            "openAccessPdf",
-            "fieldsOfStudy",
-            "s2FieldsOfStudy",
-            "publicationTypes",
-        ]
-        return ",".join(fields)
+        return self.FIELDS_PARAM
 
     def _normalize_paper(self, raw_data: Dict[str, Any]) -> Paper:
         """
@@ -43,6 +43,7 @@ class UnpaywallClient(DatabaseClient):
         headers: Optional[Dict[str, str]] = None,
         json_data: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
+        stream: bool = False,
     ):
         """
         Make an HTTP request with Unpaywall-specific email parameter.
@@ -56,6 +57,7 @@ class UnpaywallClient(DatabaseClient):
             headers: Additional headers
             json_data: JSON data for POST requests
             timeout: Request timeout
+            stream: Defer downloading the body (see DatabaseClient._make_request)
 
         Returns:
             Response object
@@ -78,6 +80,7 @@ class UnpaywallClient(DatabaseClient):
             headers=headers,
             json_data=json_data,
             timeout=timeout,
+            stream=stream,
         )
 
     def search(self, filters: SearchFilters) -> SearchResult:
@@ -121,7 +124,7 @@ class UnpaywallClient(DatabaseClient):
         """
         try:
             # Clean DOI
-            doi = doi.strip().replace("https://doi.org/", "").replace("http://dx.doi.org/", "")
+            doi = IdentifierNormalizer.clean_doi(doi) or ""
 
             url = f"{self.BASE_URL}/{doi}"
             response = self._make_request(url)
@@ -170,16 +173,14 @@ class UnpaywallClient(DatabaseClient):
         """
         # Extract authors from z_authors field
         authors = []
-        z_authors = raw_data.get("z_authors", [])
-        if z_authors:
-            for author_data in z_authors:
-                if isinstance(author_data, dict):
-                    name = author_data.get("family", "")
-                    given = author_data.get("given", "")
-                    full_name = f"{given} {name}".strip() or "Unknown"
-                    authors.append(Author(name=full_name))
-                else:
-                    authors.append(Author(name=str(author_data)))
+        for author_data in raw_data.get("z_authors") or ():
+            if isinstance(author_data, dict):
+                name = author_data.get("family", "")
+                given = author_data.get("given", "")
+                full_name = f"{given} {name}".strip() or "Unknown"
+                authors.append(Author(name=full_name))
+            else:
+                authors.append(Author(name=str(author_data)))
 
         # Extract year
         year = raw_data.get("year")
@@ -193,9 +194,12 @@ class UnpaywallClient(DatabaseClient):
         doi = raw_data.get("doi")
 
         # Extract best OA location
-        best_oa_location = raw_data.get("best_oa_location", {})
-        pdf_url = best_oa_location.get("url_for_pdf") if best_oa_location else None
-        landing_page_url = best_oa_location.get("url") if best_oa_location else None
+        best_oa_location = raw_data.get("best_oa_location")
+        if best_oa_location:
+            pdf_url = best_oa_location.get("url_for_pdf")
+            landing_page_url = best_oa_location.get("url")
+        else:
+            pdf_url = landing_page_url = None
 
         # Determine if open access
         is_oa = raw_data.get("is_oa", False)
@@ -212,6 +216,16 @@ class UnpaywallClient(DatabaseClient):
         # Get OA status
         oa_status = raw_data.get("oa_status")
 
+        extra_data: Dict[str, Any] = {
+            "oa_status": oa_status,
+            "publisher": publisher,
+            "genre": raw_data.get("genre"),
+            "best_oa_location": best_oa_location,
+            "oa_locations": raw_data.get("oa_locations", []),
+        }
+        if self.config.keep_raw_data:
+            extra_data["raw"] = raw_data
+
         return Paper(
             doi=doi,
             title=title,
@@ -224,14 +238,7 @@ class UnpaywallClient(DatabaseClient):
             is_open_access=is_oa,
             source_database=self.database_name,
             source_id=doi,
-            extra_data={
-                "oa_status": oa_status,
-                "publisher": publisher,
-                "genre": raw_data.get("genre"),
-                "best_oa_location": best_oa_location,
-                "oa_locations": raw_data.get("oa_locations", []),
-                "raw": raw_data,
-            },
+            extra_data=extra_data,
         )
 
     def get_supported_fields(self) -> List[str]:
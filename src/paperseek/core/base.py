@@ -1,7 +1,10 @@
 """Base class for database clients."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Dict, Hashable, List, Optional, Any, Sequence, TypeVar
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -9,10 +12,14 @@ from urllib3.util.retry import Retry
 from .models import Paper, SearchFilters, SearchResult
 from .config import DatabaseConfig
 from .exceptions import APIError, RateLimitError, TimeoutError, AuthenticationError
-from ..utils.rate_limiter import RateLimiter
+from ..utils import http_cache, serialization
+from ..utils.rate_limiter import RateLimiter, get_shared_limiter
 from ..utils.logging import get_logger
 from ..utils.session_pool import SessionPool
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 class DatabaseClient(ABC):
     """
@@ -21,6 +28,19 @@ class DatabaseClient(ABC):
     All database clients must implement the abstract methods.
     """
 
+    # Connection pool sizing for the shared per-database session
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 20
+
+    # Single-identifier lookups kept in flight by _lookup_many
+    MAX_CONCURRENT_LOOKUPS = 8
+
+    # Documented request rate of the API; configured rates above it are capped
+    MAX_REQUESTS_PER_SECOND: Optional[float] = None
+
+    # Papers kept in memory by _cached_lookup (least recently used evicted)
+    CACHE_SIZE = 4096
+
     def __init__(
         self,
         config: DatabaseConfig,
@@ -40,45 +60,58 @@ class DatabaseClient(ABC):
         self.user_agent = user_agent
         self.logger = get_logger(self.__class__.__name__)
 
-        # Set up rate limiter
-        self.rate_limiter = RateLimiter(
-            requests_per_second=config.rate_limit_per_second,
+        # Set up rate limiter, shared with other clients of this database so
+        # separate instances cannot together exceed the API's limit
+        requests_per_second = config.rate_limit_per_second
+        if self.MAX_REQUESTS_PER_SECOND is not None:
+            requests_per_second = min(requests_per_second, self.MAX_REQUESTS_PER_SECOND)
+        self.rate_limiter = get_shared_limiter(
+            self.database_name,
+            requests_per_second=requests_per_second,
             requests_per_minute=config.rate_limit_per_minute,
         )
 
-        # Get shared session from pool
+        # Get shared session from pool (cached sessions are private to the client)
+        self._owns_session = bool(config.http_cache_path)
         self.session = self._get_or_create_session()
 
+        self._cache: "OrderedDict[Hashable, Paper]" = OrderedDict()
+        self._cache_lock = Lock()
+
     def _get_or_create_session(self) -> requests.Session:
         """
         Get session from pool or create a new one with retry configuration.
         
-        Uses SessionPool for better connection reuse and memory efficiency.
-        """
-        # Get shared session from pool
-        session = SessionPool.get_session(
-            database=self.database_name,
-            pool_connections=10,
-            pool_maxsize=20,
-            max_retries=0,  # We handle retries via HTTPAdapter below
+        Uses SessionPool for better connection reuse and memory efficiency,
+        unless config.http_cache_path asks for an on-disk response cache.
+        """
+        retry_strategy = Retry(
+            total=self.config.max_retries,
+            backoff_factor=self.config.retry_delay,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "POST", "HEAD"],
         )
 
-        # Configure retry strategy if not already configured
-        # Check if session already has our retry adapter
-        if not hasattr(session, '_retry_configured'):
-            retry_strategy = Retry(
-                total=self.config.max_retries,
-                backoff_factor=self.config.retry_delay,
-                status_forcelist=[429, 500, 502, 503, 504],
-                allowed_methods=["GET", "POST", "HEAD"],
+        if self.config.http_cache_path:
+            session = http_cache.create_cached_session(
+                self.config.http_cache_path,
+                ttl_days=self.config.http_cache_ttl_days,
+                adapter=HTTPAdapter(
+                    pool_connections=self.POOL_CONNECTIONS,
+                    pool_maxsize=self.POOL_MAXSIZE,
+                    max_retries=retry_strategy,
+                ),
+            )
+        else:
+            # The pool mounts its adapter (and the retry strategy) once, under its
+            # lock, when the first client of this database is created; later
+            # clients share that adapter and its keep-alive connections
+            session = SessionPool.get_session(
+                database=self.database_name,
+                pool_connections=self.POOL_CONNECTIONS,
+                pool_maxsize=self.POOL_MAXSIZE,
+                max_retries=retry_strategy,
             )
-
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            session.mount("http://", adapter)
-            session.mount("https://", adapter)
-            
-            # Mark as configured to avoid reconfiguration
-            session._retry_configured = True  # type: ignore
 
         # Update headers (this is safe to do multiple times)
         session.headers.update({"User-Agent": self._get_user_agent()})
@@ -102,7 +135,11 @@ class DatabaseClient(ABC):
             allowed_methods=["GET", "POST", "HEAD"],
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=retry_strategy,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
@@ -126,6 +163,7 @@ class DatabaseClient(ABC):
         headers: Optional[Dict[str, str]] = None,
         json_data: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
+        stream: bool = False,
     ) -> requests.Response:
         """
         Make an HTTP request with rate limiting and error handling.
@@ -137,6 +175,8 @@ class DatabaseClient(ABC):
             headers: Additional headers
             json_data: JSON data for POST requests
             timeout: Request timeout
+            stream: Return before the body is downloaded, so it can be read
+                incrementally from response.raw (the caller must close the response)
 
         Returns:
             Response object
@@ -164,10 +204,16 @@ class DatabaseClient(ABC):
                 headers=headers,
                 json=json_data,
                 timeout=timeout,
+                stream=stream,
             )
 
             # Handle response
-            self._check_response(response)
+            try:
+                self._check_response(response)
+            except Exception:
+                # Release the connection of a streamed response nobody will read
+                response.close()
+                raise
 
             return response
 
@@ -209,6 +255,24 @@ class DatabaseClient(ABC):
                 status_code=response.status_code,
             )
 
+    def _parse_json(self, response: requests.Response) -> Any:
+        """
+        Decode a JSON response body.
+
+        Uses orjson when it is installed, which is several times faster than
+        response.json() on large result pages.
+
+        Args:
+            response: Response object
+
+        Returns:
+            Decoded JSON document
+
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        return serialization.loads(response.content)
+
     @property
     @abstractmethod
     def database_name(self) -> str:
@@ -269,6 +333,78 @@ class DatabaseClient(ABC):
         """
         pass
 
+    def _cached_lookup(
+        self, key: Hashable, lookup: Callable[[], Optional[Paper]]
+    ) -> Optional[Paper]:
+        """
+        Resolve a single paper through the client's in-memory LRU cache.
+
+        Papers found by lookup are kept under key (up to CACHE_SIZE entries),
+        so repeated lookups of the same identifier do not go back to the API.
+        Misses (None) are not cached.
+
+        Args:
+            key: Normalized identifier of the paper
+            lookup: Function fetching the paper when it is not cached
+
+        Returns:
+            A copy of the paper (Papers are mutable), or None
+        """
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached.model_copy(deep=True)
+
+        paper = lookup()
+        if paper is None:
+            return None
+
+        with self._cache_lock:
+            self._cache[key] = paper
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        return paper.model_copy(deep=True)
+
+    def _lookup_many(
+        self, identifiers: List[str], lookup: Callable[[str], Optional[Paper]]
+    ) -> List[Paper]:
+        """
+        Run single-identifier lookups concurrently.
+
+        Round trips overlap on up to MAX_CONCURRENT_LOOKUPS threads, while every
+        request still passes through the client's thread-safe rate limiter.
+
+        Args:
+            identifiers: Identifiers to look up
+            lookup: Function resolving one identifier (e.g. self.get_by_doi)
+
+        Returns:
+            Papers found, in the order of the identifiers
+        """
+        papers = self._map_concurrently(lookup, identifiers)
+        return [paper for paper in papers if paper is not None]
+
+    def _map_concurrently(self, func: Callable[[T], R], items: Sequence[T]) -> List[R]:
+        """
+        Apply func to every item on up to MAX_CONCURRENT_LOOKUPS threads.
+
+        Args:
+            func: Function issuing the request(s) for one item
+            items: Items to process
+
+        Returns:
+            Results, in the order of the items
+        """
+        workers = min(self.MAX_CONCURRENT_LOOKUPS, len(items))
+        if workers <= 1:
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items))
+
     @abstractmethod
     def _normalize_paper(self, raw_data: Dict[str, Any]) -> Paper:
         """
@@ -321,10 +457,12 @@ class DatabaseClient(ABC):
         
         Note: Since we use SessionPool, we don't actually close the session
         as it's shared. The session will be closed when SessionPool.close_all_sessions()
-        is called during application shutdown.
+        is called during application shutdown. Cached sessions (http_cache_path)
+        belong to this client and are closed here.
         """
         # Don't close the session as it's shared via SessionPool
-        pass
+        if self._owns_session:
+            self.session.close()
 
     def __enter__(self) -> "DatabaseClient":
         """Context manager entry."""
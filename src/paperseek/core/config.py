@@ -1,7 +1,9 @@
 """Configuration management for academic search."""
 
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from threading import Lock
+from typing import Any, Dict, Hashable, Optional, cast
 import yaml
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -17,6 +19,16 @@ class DatabaseConfig(BaseSettings):
     max_retries: int = Field(default=3, ge=0)
     retry_delay: float = Field(default=1.0, gt=0)
     enabled: bool = True
+    keep_raw_data: bool = Field(
+        default=False, description="Keep the full API record in Paper.extra_data['raw']"
+    )
+    http_cache_path: Optional[str] = Field(
+        default=None,
+        description="Path to a SQLite file caching GET responses (requires paperseek[cache])",
+    )
+    http_cache_ttl_days: float = Field(
+        default=7.0, gt=0, description="Days before a cached HTTP response expires"
+    )
 
     model_config = SettingsConfigDict(frozen=False)
 
@@ -58,6 +70,24 @@ class AcademicSearchConfig(BaseSettings):
         default=False, description="If True, stop on first error; otherwise try all databases"
     )
 
+    # Caching
+    doi_cache_path: Optional[str] = Field(
+        default=None, description="Path to a SQLite file for caching DOI lookups across sessions"
+    )
+    doi_cache_ttl_days: float = Field(
+        default=90.0, gt=0, description="Days before a cached DOI lookup expires"
+    )
+    doi_cache_ttl_days_by_database: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-database overrides of doi_cache_ttl_days (e.g. {'crossref': 7})",
+    )
+    search_cache_path: Optional[str] = Field(
+        default=None, description="Path to a SQLite file for caching search results across runs"
+    )
+    search_cache_ttl_days: float = Field(
+        default=7.0, gt=0, description="Days before a cached search result expires"
+    )
+
     model_config = SettingsConfigDict(
         env_prefix="ACADEMIC_SEARCH_", env_nested_delimiter="__", frozen=False
     )
@@ -171,6 +201,55 @@ class AcademicSearchConfig(BaseSettings):
         return self.user_agent
 
 
+# Validated configurations keyed by their inputs (see _config_cache_key)
+_CONFIG_CACHE: Dict[Hashable, AcademicSearchConfig] = {}
+_CONFIG_CACHE_SIZE = 32
+_config_cache_lock = Lock()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Recursively convert dicts and lists into hashable tuples."""
+    if isinstance(value, dict):
+        return ("dict", frozenset((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return ("list", tuple(_freeze(v) for v in value))
+    hash(value)  # Raise TypeError early for unhashable values
+    return cast(Hashable, value)
+
+
+def _config_cache_key(
+    config_file: Optional[str], config_dict: Optional[Dict[str, Any]], use_env: bool
+) -> Optional[Hashable]:
+    """
+    Build a cache key for load_config, or None if the inputs cannot be cached.
+
+    The key covers the config file's modification time and every environment
+    variable pydantic-settings may read, so edits to either invalidate it.
+    """
+    file_key = None
+    if config_file:
+        try:
+            stat = Path(config_file).stat()
+        except OSError:
+            return None
+        file_key = (str(Path(config_file).resolve()), stat.st_mtime_ns, stat.st_size)
+
+    try:
+        dict_key = _freeze(config_dict or {})
+    except TypeError:
+        return None
+
+    db_fields = {name.upper() for name in DatabaseConfig.model_fields}
+    env_key = tuple(
+        sorted(
+            (name, value)
+            for name, value in os.environ.items()
+            if name.upper().startswith("ACADEMIC_SEARCH_") or name.upper() in db_fields
+        )
+    )
+    return (file_key, dict_key, env_key, use_env)
+
+
 def load_config(
     config_file: Optional[str] = None,
     config_dict: Optional[Dict[str, Any]] = None,
@@ -184,6 +263,9 @@ def load_config(
     2. config_file (YAML file)
     3. Environment variables (if use_env=True)
 
+    Validated configurations are cached by their inputs; each call returns
+    an independent copy, so mutating the result does not affect later calls.
+
     Args:
         config_file: Path to YAML configuration file
         config_dict: Configuration dictionary
@@ -192,6 +274,30 @@ def load_config(
     Returns:
         AcademicSearchConfig instance
     """
+    key = _config_cache_key(config_file, config_dict, use_env)
+    if key is not None:
+        with _config_cache_lock:
+            cached = _CONFIG_CACHE.get(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+    config = _build_config(config_file, config_dict, use_env)
+
+    if key is not None:
+        with _config_cache_lock:
+            if len(_CONFIG_CACHE) >= _CONFIG_CACHE_SIZE:
+                _CONFIG_CACHE.pop(next(iter(_CONFIG_CACHE)))
+            _CONFIG_CACHE[key] = config.model_copy(deep=True)
+
+    return config
+
+
+def _build_config(
+    config_file: Optional[str],
+    config_dict: Optional[Dict[str, Any]],
+    use_env: bool,
+) -> AcademicSearchConfig:
+    """Merge and validate configuration sources (uncached)."""
     # Collect all config sources and merge them
     configs = []
 
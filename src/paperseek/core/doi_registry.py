@@ -0,0 +1,111 @@
+"""Routing of DOI lookups to the databases that can resolve them.
+
+A DOI prefix identifies the registrant (e.g. ``10.48550`` is arXiv), and some
+registrants are only indexed by a subset of the supported databases. Routing
+lookups by prefix avoids sending requests that are bound to fail, such as
+asking CrossRef or PubMed about an arXiv DataCite DOI.
+"""
+
+from threading import Lock
+from typing import Dict, FrozenSet, List, Optional
+
+from ..utils.normalization import IdentifierNormalizer
+
+
+class DOIRegistry:
+    """
+    Maps DOI prefixes to the databases that index them.
+
+    Prefixes listed in KNOWN_PREFIXES are restricted to their database set,
+    in the caller's order. Unknown prefixes are routed to every database;
+    successful lookups are recorded so that databases which resolved a prefix
+    before can be tried first.
+
+    Example:
+        >>> registry = DOIRegistry()
+        >>> registry.route("10.48550/arXiv.1706.03762", ["crossref", "arxiv", "pubmed"])
+        ['arxiv']
+    """
+
+    # DataCite-registered prefixes are not indexed by CrossRef or Unpaywall,
+    # and preprint/data repositories are not indexed by PubMed.
+    KNOWN_PREFIXES: Dict[str, FrozenSet[str]] = {
+        # arXiv
+        "10.48550": frozenset({"arxiv", "semantic_scholar", "openalex", "doi", "core", "dblp"}),
+        # Zenodo
+        "10.5281": frozenset({"openalex", "doi", "core"}),
+        # figshare
+        "10.6084": frozenset({"openalex", "doi", "core"}),
+    }
+
+    def __init__(self) -> None:
+        """Initialize DOI registry."""
+        self._learned: Dict[str, List[str]] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def get_prefix(doi: str) -> Optional[str]:
+        """
+        Extract the registrant prefix from a DOI.
+
+        Args:
+            doi: Digital Object Identifier (with or without URL prefix)
+
+        Returns:
+            Prefix such as "10.1038", or None if the DOI is malformed
+        """
+        cleaned = IdentifierNormalizer.clean_doi(doi)
+        if not cleaned or "/" not in cleaned:
+            return None
+        prefix = cleaned.split("/", 1)[0]
+        return prefix if prefix.startswith("10.") else None
+
+    def route(self, doi: str, databases: List[str], prefer_learned: bool = True) -> List[str]:
+        """
+        Select and order the databases to query for a DOI.
+
+        Args:
+            doi: Digital Object Identifier
+            databases: Candidate databases in preferred order
+            prefer_learned: Move databases that resolved an unknown prefix before
+                to the front (pass False to keep an explicit database order)
+
+        Returns:
+            Databases to query, in the order they should be tried
+        """
+        prefix = self.get_prefix(doi)
+        if prefix is None:
+            return list(databases)
+
+        allowed = self.KNOWN_PREFIXES.get(prefix)
+        if allowed is not None:
+            return [db for db in databases if db in allowed]
+
+        candidates = list(databases)
+        if not prefer_learned:
+            return candidates
+
+        with self._lock:
+            learned = self._learned.get(prefix)
+            if not learned:
+                return candidates
+            preferred = [db for db in learned if db in candidates]
+
+        return preferred + [db for db in candidates if db not in preferred]
+
+    def record(self, doi: str, database: str) -> None:
+        """
+        Record that a database resolved a DOI.
+
+        Args:
+            doi: Digital Object Identifier that was found
+            database: Database that returned it
+        """
+        prefix = self.get_prefix(doi)
+        if prefix is None:
+            return
+
+        with self._lock:
+            learned = self._learned.setdefault(prefix, [])
+            if database not in learned:
+                learned.append(database)
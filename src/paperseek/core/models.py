@@ -1,9 +1,15 @@
 """Data models for academic search results."""
 
+from collections import Counter
 from datetime import datetime
+from itertools import chain
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, overload
 from pydantic import BaseModel, Field, ConfigDict
 
+# Bookkeeping fields that are always set and not part of coverage statistics
+_UNTRACKED_FIELDS = frozenset({"extra_data", "retrieved_at", "source_database"})
+
 
 class Author(BaseModel):
     """Represents a paper author."""
@@ -80,16 +86,18 @@ class Paper(BaseModel):
 
     def get_available_fields(self) -> List[str]:
         """Get list of fields that have non-None values."""
+        # Read attributes directly; model_dump() would serialize every nested
+        # author just to check for None.
         available = []
-        for field_name, field_value in self.model_dump().items():
-            if field_name in ["extra_data", "retrieved_at", "source_database"]:
+        for field_name in type(self).model_fields:
+            if field_name in _UNTRACKED_FIELDS:
+                continue
+            field_value = getattr(self, field_name)
+            if field_value is None:
+                continue
+            if isinstance(field_value, (list, dict)) and not field_value:
                 continue
-            if field_value is not None:
-                if isinstance(field_value, (list, dict)):
-                    if field_value:  # Not empty
-                        available.append(field_name)
-                else:
-                    available.append(field_name)
+            available.append(field_name)
         return available
 
 
@@ -202,7 +210,7 @@ class SearchResult(BaseModel):
         """Filter results to only include papers with all required fields."""
         filtered_papers = []
         for paper in self.papers:
-            available = paper.get_available_fields()
+            available = set(paper.get_available_fields())
             if all(field in available for field in required_fields):
                 filtered_papers.append(paper)
 
@@ -215,6 +223,34 @@ class SearchResult(BaseModel):
         )
         return result
 
+    def papers_with_pdf(self, only_open_access: bool = False) -> List[Paper]:
+        """
+        Get papers that have a PDF URL.
+
+        Args:
+            only_open_access: Also require the paper to be marked as open access
+
+        Returns:
+            Papers with a PDF URL, in result order
+        """
+        if only_open_access:
+            return [p for p in self.papers if p.pdf_url and p.is_open_access]
+        return [p for p in self.papers if p.pdf_url]
+
+    def counts_by(self, field_name: str, missing: Any = "Unknown") -> "Counter[Any]":
+        """
+        Count papers by the value of a field.
+
+        Args:
+            field_name: Paper attribute to group by (e.g. "year", "source_database")
+            missing: Key used for papers where the field is None
+
+        Returns:
+            Counter mapping field values to number of papers
+        """
+        getter = attrgetter(field_name)
+        return Counter(missing if value is None else value for value in map(getter, self.papers))
+
     def field_statistics(self) -> Dict[str, FieldStatistics]:
         """
         Calculate statistics about field availability across all papers.
@@ -225,22 +261,17 @@ class SearchResult(BaseModel):
         if not self.papers:
             return {}
 
-        # Count field availability
-        field_counts: Dict[str, int] = {}
-        all_fields = set()
-
-        for paper in self.papers:
-            available_fields = paper.get_available_fields()
-            all_fields.update(available_fields)
-            for field in available_fields:
-                field_counts[field] = field_counts.get(field, 0) + 1
+        # Count field availability in a single pass
+        field_counts = Counter(
+            chain.from_iterable(paper.get_available_fields() for paper in self.papers)
+        )
 
         total = len(self.papers)
 
         # Create statistics objects
         stats = {}
-        for field in sorted(all_fields):
-            count = field_counts.get(field, 0)
+        for field in sorted(field_counts):
+            count = field_counts[field]
             stats[field] = FieldStatistics(
                 field_name=field,
                 available_count=count,
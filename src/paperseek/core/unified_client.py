@@ -1,22 +1,48 @@
 """Unified client for searching across multiple databases."""
 
+import asyncio
+import functools
+import importlib
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Type, cast
 
 from .base import DatabaseClient
 from .models import SearchFilters, SearchResult, Paper
 from .config import AcademicSearchConfig, load_config
+from .doi_registry import DOIRegistry
 from .exceptions import SearchError, ConfigurationError
-from ..clients.crossref import CrossRefClient
-from ..clients.openalex import OpenAlexClient
-from ..clients.semantic_scholar import SemanticScholarClient
-from ..clients.doi import DOIClient
-from ..clients.pubmed import PubMedClient
-from ..clients.arxiv import ArXivClient
-from ..clients.core import COREClient
-from ..clients.unpaywall import UnpaywallClient
-from ..clients.dblp import DBLPClient
+from ..utils.doi_cache import DOICache
+from ..utils.search_cache import SearchCache
 from ..utils.logging import get_logger
+from ..utils.normalization import IdentifierNormalizer, TextNormalizer
+
+# Database name -> (module, class name); clients are imported on first use so that
+# only the backends a client is configured for are loaded
+CLIENT_REGISTRY: Dict[str, Tuple[str, str]] = {
+    "crossref": ("paperseek.clients.crossref", "CrossRefClient"),
+    "openalex": ("paperseek.clients.openalex", "OpenAlexClient"),
+    "semantic_scholar": ("paperseek.clients.semantic_scholar", "SemanticScholarClient"),
+    "doi": ("paperseek.clients.doi", "DOIClient"),
+    "pubmed": ("paperseek.clients.pubmed", "PubMedClient"),
+    "arxiv": ("paperseek.clients.arxiv", "ArXivClient"),
+    "core": ("paperseek.clients.core", "COREClient"),
+    "unpaywall": ("paperseek.clients.unpaywall", "UnpaywallClient"),
+    "dblp": ("paperseek.clients.dblp", "DBLPClient"),
+}
+
+
+def load_client_class(database: str) -> Type[DatabaseClient]:
+    """
+    Import and return the client class for a database.
+
+    Args:
+        database: Database name (a key of CLIENT_REGISTRY)
+
+    Returns:
+        DatabaseClient subclass
+    """
+    module_name, class_name = CLIENT_REGISTRY[database]
+    return cast(Type[DatabaseClient], getattr(importlib.import_module(module_name), class_name))
 
 
 class UnifiedSearchClient:
@@ -99,20 +125,27 @@ class UnifiedSearchClient:
         if not self.clients:
             raise ConfigurationError("No database clients are enabled")
 
+        # DOI prefix routing to skip databases that cannot resolve a DOI
+        self.doi_registry = DOIRegistry()
+
+        # Optional persistent cache for DOI lookups
+        self.doi_cache: Optional[DOICache] = None
+        if self.config.doi_cache_path:
+            self.doi_cache = DOICache(
+                self.config.doi_cache_path,
+                ttl_days=self.config.doi_cache_ttl_days,
+                source_ttl_days=self.config.doi_cache_ttl_days_by_database,
+            )
+
+        # Optional persistent cache for search results
+        self.search_cache: Optional[SearchCache] = None
+        if self.config.search_cache_path:
+            self.search_cache = SearchCache(
+                self.config.search_cache_path, ttl_days=self.config.search_cache_ttl_days
+            )
+
     def _init_clients(self, databases: Optional[List[str]] = None) -> None:
         """Initialize database clients based on configuration."""
-        available_clients = {
-            "crossref": CrossRefClient,
-            "openalex": OpenAlexClient,
-            "semantic_scholar": SemanticScholarClient,
-            "doi": DOIClient,
-            "pubmed": PubMedClient,
-            "arxiv": ArXivClient,
-            "core": COREClient,
-            "unpaywall": UnpaywallClient,
-            "dblp": DBLPClient,
-        }
-
         # Determine which databases to use
         if databases:
             db_list = [db.lower() for db in databases]
@@ -120,13 +153,13 @@ class UnifiedSearchClient:
             # Use all enabled databases
             db_list = [
                 name
-                for name in available_clients.keys()
+                for name in CLIENT_REGISTRY.keys()
                 if self.config.get_database_config(name).enabled
             ]
 
         # Initialize clients
         for db_name in db_list:
-            if db_name not in available_clients:
+            if db_name not in CLIENT_REGISTRY:
                 self.logger.warning(f"Unknown database: {db_name}")
                 continue
 
@@ -136,7 +169,7 @@ class UnifiedSearchClient:
                 continue
 
             try:
-                client_class = available_clients[db_name]
+                client_class = load_client_class(db_name)
                 self.clients[db_name] = client_class(
                     config=db_config, email=self.config.email, user_agent=self.config.user_agent
                 )
@@ -238,47 +271,88 @@ class UnifiedSearchClient:
             for key, value in kwargs.items():
                 if hasattr(search_filters, key):
                     setattr(search_filters, key, value)
-        
-        # Handle mode override
-        original_mode = self.fallback_mode
-        if mode is not None:
-            self.fallback_mode = mode
-        
-        try:
-            return self.search_with_filters(search_filters)
-        finally:
-            # Restore original mode
-            if mode is not None:
-                self.fallback_mode = original_mode
 
-    def search_with_filters(self, filters: SearchFilters) -> SearchResult:
+        return self.search_with_filters(search_filters, mode)
+
+    async def search_async(
+        self, filters: Optional[SearchFilters] = None, **kwargs: Any
+    ) -> SearchResult:
+        """
+        Search across configured databases without blocking the event loop.
+
+        The search runs in the default executor; in parallel mode the database
+        requests themselves are still fanned out over a thread pool.
+
+        Args:
+            filters: SearchFilters object
+            **kwargs: Same keyword arguments as search()
+
+        Returns:
+            SearchResult object with combined results
+
+        Example:
+            >>> results = await client.search_async(venue="ICML", year=2023)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self.search, filters, **kwargs))
+
+    def search_with_filters(
+        self, filters: SearchFilters, mode: Optional[str] = None
+    ) -> SearchResult:
         """
         Search with a SearchFilters object.
 
         Args:
             filters: SearchFilters object
+            mode: Search mode for this call only (default: the client's fallback_mode)
 
         Returns:
             SearchResult object
         """
-        self.logger.info(
-            f"Searching with mode '{self.fallback_mode}' " f"across {len(self.clients)} databases"
-        )
-
-        if self.fallback_mode == "parallel":
-            return self._search_parallel(filters)
-        elif self.fallback_mode == "sequential":
-            return self._search_sequential(filters)
-        elif self.fallback_mode == "first":
-            return self._search_first(filters)
+        mode = mode or self.fallback_mode
+        self.logger.info(f"Searching with mode '{mode}' " f"across {len(self.clients)} databases")
+
+        if mode not in ("parallel", "sequential", "first"):
+            raise ConfigurationError(f"Invalid fallback_mode: {mode}")
+
+        cache_key = None
+        if self.search_cache is not None:
+            cache_key = SearchCache.make_key(filters, list(self.clients), mode)
+            cached = self.search_cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(f"Serving {len(cached)} results from search cache")
+                return cached
+
+        failed: List[str] = []
+        if mode == "parallel":
+            results, failed = self._search_parallel(filters)
+        elif mode == "sequential":
+            results, failed = self._search_sequential(filters)
         else:
-            raise ConfigurationError(f"Invalid fallback_mode: {self.fallback_mode}")
+            results = self._search_first(filters)
+
+        # Don't cache searches where a database failed; it would otherwise be
+        # missing from every later run until the entry expires
+        complete = bool(results.databases_queried) and not failed
+        if self.search_cache is not None and cache_key is not None and complete:
+            self.search_cache.set(cache_key, results)
+
+        return results
 
-    def _search_parallel(self, filters: SearchFilters) -> SearchResult:
-        """Search all databases in parallel and merge results."""
+    def _search_parallel(self, filters: SearchFilters) -> Tuple[SearchResult, List[str]]:
+        """
+        Search all databases in parallel and merge results.
+
+        Returns:
+            Tuple of (merged SearchResult, names of databases whose search failed)
+        """
         results = SearchResult(query_info={"filters": filters.model_dump()}, databases_queried=[])
+        failed: List[str] = []
+        if not self.clients:
+            return results, failed
 
         # Execute searches in parallel
+        db_results: Dict[str, SearchResult] = {}
         with ThreadPoolExecutor(max_workers=len(self.clients)) as executor:
             future_to_db = {
                 executor.submit(client.search, filters): db_name
@@ -288,14 +362,22 @@ class UnifiedSearchClient:
             for future in as_completed(future_to_db):
                 db_name = future_to_db[future]
                 try:
-                    db_result = future.result()
-                    results.databases_queried.append(db_name)
-                    results.extend(db_result.papers)
-                    self.logger.info(f"Got {len(db_result.papers)} results from {db_name}")
+                    db_results[db_name] = future.result()
+                    self.logger.info(
+                        f"Got {len(db_results[db_name].papers)} results from {db_name}"
+                    )
                 except Exception as e:
                     self.logger.error(f"Search failed for {db_name}: {e}")
                     if self.config.fail_fast:
                         raise SearchError(f"Search failed for {db_name}: {e}")
+                    failed.append(db_name)
+
+        # Merge in configured database order so deduplication keeps the same
+        # record regardless of which database answered first
+        for db_name in self.clients:
+            if db_name in db_results:
+                results.databases_queried.append(db_name)
+                results.extend(db_results[db_name].papers)
 
         # Deduplicate by DOI
         results = self._deduplicate_results(results)
@@ -304,11 +386,17 @@ class UnifiedSearchClient:
         if filters.required_fields:
             results = results.filter_by_required_fields(filters.required_fields)
 
-        return results
+        return results, failed
 
-    def _search_sequential(self, filters: SearchFilters) -> SearchResult:
-        """Search databases sequentially with fallback."""
+    def _search_sequential(self, filters: SearchFilters) -> Tuple[SearchResult, List[str]]:
+        """
+        Search databases sequentially with fallback.
+
+        Returns:
+            Tuple of (merged SearchResult, names of databases whose search failed)
+        """
         results = SearchResult(query_info={"filters": filters.model_dump()}, databases_queried=[])
+        failed: List[str] = []
 
         for db_name, client in self.clients.items():
             try:
@@ -327,6 +415,7 @@ class UnifiedSearchClient:
                 self.logger.error(f"Search failed for {db_name}: {e}")
                 if self.config.fail_fast:
                     raise SearchError(f"Search failed for {db_name}: {e}")
+                failed.append(db_name)
                 # Continue to next database
 
         # Deduplicate
@@ -336,7 +425,7 @@ class UnifiedSearchClient:
         if filters.required_fields:
             results = results.filter_by_required_fields(filters.required_fields)
 
-        return results
+        return results, failed
 
     def _search_first(self, filters: SearchFilters) -> SearchResult:
         """Search only the first database."""
@@ -363,38 +452,79 @@ class UnifiedSearchClient:
         """
         Deduplicate papers by DOI and other identifiers.
 
+        Papers are matched by normalized DOI, PMID or arXiv ID, falling back to
+        normalized title and year. Title matches are not merged when both papers
+        carry different DOIs. When duplicates are found, the record with the most
+        available fields is kept at the position of the first occurrence.
+
         Args:
             results: SearchResult with potentially duplicate papers
 
         Returns:
             Deduplicated SearchResult
         """
-        seen_ids = set()
-        unique_papers = []
+        index: Dict[tuple, int] = {}
+        unique_papers: List[Paper] = []
+        unique_dois: List[Optional[str]] = []
 
         for paper in results.papers:
-            # Create identifier tuple
-            paper_id = (
-                paper.doi or "",
-                paper.pmid or "",
-                paper.arxiv_id or "",
-                paper.title.lower() if paper.title else "",
-            )
+            id_keys, title_key = self._dedup_keys(paper)
+            if not id_keys and title_key is None:
+                continue
 
-            # Check if we've seen this paper
-            if paper_id not in seen_ids and any(paper_id):
-                seen_ids.add(paper_id)
+            doi = id_keys[0][1] if id_keys and id_keys[0][0] == "doi" else None
+            position = next((index[key] for key in id_keys if key in index), None)
+            if position is None and title_key in index:
+                candidate = index[title_key]
+                if doi is None or unique_dois[candidate] in (None, doi):
+                    position = candidate
+
+            if position is None:
+                position = len(unique_papers)
                 unique_papers.append(paper)
+                unique_dois.append(doi)
+            else:
+                if len(paper.get_available_fields()) > len(
+                    unique_papers[position].get_available_fields()
+                ):
+                    unique_papers[position] = paper
+                unique_dois[position] = unique_dois[position] or doi
+
+            for key in id_keys:
+                index.setdefault(key, position)
+            if title_key is not None:
+                index.setdefault(title_key, position)
 
         results.papers = unique_papers
         results.total_results = len(unique_papers)
 
         self.logger.info(
-            f"Deduplicated {len(results.papers)} papers " f"from {len(seen_ids)} unique identifiers"
+            f"Deduplicated {len(results.papers)} papers " f"from {len(index)} unique identifiers"
         )
 
         return results
 
+    @staticmethod
+    def _dedup_keys(paper: Paper) -> Tuple[List[tuple], Optional[tuple]]:
+        """
+        Build hashable deduplication keys for a paper.
+
+        Returns:
+            Tuple of (identifier keys, title key); the DOI key comes first when present
+        """
+        id_keys: List[tuple] = []
+        doi = IdentifierNormalizer.clean_doi(paper.doi)
+        if doi:
+            id_keys.append(("doi", doi.lower()))
+        if paper.pmid:
+            id_keys.append(("pmid", paper.pmid.strip()))
+        if paper.arxiv_id:
+            id_keys.append(("arxiv", paper.arxiv_id.strip().lower()))
+
+        title = TextNormalizer.normalize_title(paper.title)
+        title_key = ("title", title, paper.year) if title else None
+        return id_keys, title_key
+
     def get_by_doi(self, doi: str, databases: Optional[List[str]] = None) -> Optional[Paper]:
         """
         Get a paper by DOI from specified databases.
@@ -406,16 +536,26 @@ class UnifiedSearchClient:
         Returns:
             Paper object or None
         """
-        db_list = databases or list(self.clients.keys())
+        db_list = [db for db in (databases or list(self.clients.keys())) if db in self.clients]
+        # Learned routing only reorders the default list, never an explicit one
+        db_list = self.doi_registry.route(doi, db_list, prefer_learned=databases is None)
+
+        # Serve from the persistent cache first, honouring database order
+        if self.doi_cache is not None:
+            for db_name in db_list:
+                cached = self.doi_cache.get(db_name, doi)
+                if cached:
+                    self.logger.info(f"Found paper with DOI {doi} in cache ({db_name})")
+                    return cached
 
         for db_name in db_list:
-            if db_name not in self.clients:
-                continue
-
             try:
                 paper = self.clients[db_name].get_by_doi(doi)
                 if paper:
                     self.logger.info(f"Found paper with DOI {doi} in {db_name}")
+                    self.doi_registry.record(doi, db_name)
+                    if self.doi_cache is not None:
+                        self.doi_cache.set(db_name, doi, paper)
                     return paper
             except Exception as e:
                 self.logger.warning(f"Failed to get DOI {doi} from {db_name}: {e}")
@@ -446,10 +586,24 @@ class UnifiedSearchClient:
             if db_name not in self.clients:
                 continue
 
+            db_identifiers = identifiers
+            if id_type.lower() == "doi":
+                # Only send DOIs whose prefix this database can resolve
+                db_identifiers = [
+                    doi for doi in identifiers if self.doi_registry.route(doi, [db_name])
+                ]
+                if not db_identifiers:
+                    self.logger.debug(f"Skipping {db_name}: no routable DOIs")
+                    continue
+
             try:
-                db_result = self.clients[db_name].batch_lookup(identifiers, id_type)
+                db_result = self._batch_lookup_cached(db_name, db_identifiers, id_type)
                 results.databases_queried.append(db_name)
                 results.extend(db_result.papers)
+                if id_type.lower() == "doi":
+                    for paper in db_result.papers:
+                        if paper.doi:
+                            self.doi_registry.record(paper.doi, db_name)
                 self.logger.info(f"Got {len(db_result.papers)} results from {db_name}")
             except Exception as e:
                 self.logger.error(f"Batch lookup failed for {db_name}: {e}")
@@ -459,6 +613,42 @@ class UnifiedSearchClient:
 
         return results
 
+    def _batch_lookup_cached(
+        self, db_name: str, identifiers: List[str], id_type: str
+    ) -> SearchResult:
+        """
+        Run a batch lookup against one database, using the DOI cache when enabled.
+
+        Cached DOIs are fetched in a single query; only the misses are sent to
+        the database, and the papers it returns are written back to the cache.
+        """
+        client = self.clients[db_name]
+        if self.doi_cache is None or id_type.lower() != "doi":
+            return client.batch_lookup(identifiers, id_type)
+
+        hits = self.doi_cache.get_many(db_name, identifiers)
+        misses = [
+            identifier
+            for identifier in identifiers
+            if DOICache.normalize_doi(identifier) not in hits
+        ]
+        self.logger.debug(f"DOI cache for {db_name}: {len(hits)} hits, {len(misses)} misses")
+
+        if misses:
+            db_result = client.batch_lookup(misses, id_type)
+            self.doi_cache.set_many(
+                db_name, [(paper.doi, paper) for paper in db_result.papers if paper.doi]
+            )
+        else:
+            db_result = SearchResult(
+                query_info={"identifiers": identifiers, "id_type": id_type},
+                databases_queried=[db_name],
+            )
+
+        db_result.papers = list(hits.values()) + db_result.papers
+        db_result.total_results = len(db_result.papers)
+        return db_result
+
     def get_client(self, database: str) -> Optional[DatabaseClient]:
         """
         Get a specific database client.
@@ -479,6 +669,14 @@ class UnifiedSearchClient:
             except Exception as e:
                 self.logger.error(f"Error closing client: {e}")
 
+        if self.doi_cache is not None:
+            self.doi_cache.close()
+            self.doi_cache = None
+
+        if self.search_cache is not None:
+            self.search_cache.close()
+            self.search_cache = None
+
     def __enter__(self) -> "UnifiedSearchClient":
         """Context manager entry."""
         return self
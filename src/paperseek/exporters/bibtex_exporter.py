@@ -7,6 +7,25 @@ from ..core.models import SearchResult, Paper, Author
 from ..core.exceptions import ExportError
 from ..utils.logging import get_logger
 
+# BibTeX special characters and their escaped forms
+_BIBTEX_ESCAPES = {
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+    "\\": r"\textbackslash{}",
+}
+_BIBTEX_ESCAPE_PATTERN = re.compile("|".join(re.escape(char) for char in _BIBTEX_ESCAPES))
+
+# Title words skipped when generating citation keys
+_KEY_STOP_WORDS = frozenset({"a", "an", "the", "of", "in", "on", "at", "to", "for", "and", "or"})
+_NON_ALNUM_PATTERN = re.compile(r"[^a-zA-Z0-9]")
+
 
 class BibTeXExporter:
     """Export search results to BibTeX format."""
@@ -157,10 +176,9 @@ class BibTeXExporter:
         if paper.title:
             title_words = paper.title.lower().split()
             # Skip common words
-            stop_words = {"a", "an", "the", "of", "in", "on", "at", "to", "for", "and", "or"}
             for word in title_words:
-                word_clean = re.sub(r"[^a-zA-Z0-9]", "", word)
-                if word_clean and word_clean not in stop_words:
+                word_clean = _NON_ALNUM_PATTERN.sub("", word)
+                if word_clean and word_clean not in _KEY_STOP_WORDS:
                     parts.append(word_clean[:10])  # Limit length
                     break
 
@@ -192,25 +210,8 @@ class BibTeXExporter:
         if not text:
             return ""
 
-        # BibTeX special characters
-        replacements = {
-            "&": r"\&",
-            "%": r"\%",
-            "$": r"\$",
-            "#": r"\#",
-            "_": r"\_",
-            "{": r"\{",
-            "}": r"\}",
-            "~": r"\textasciitilde{}",
-            "^": r"\textasciicircum{}",
-            "\\": r"\textbackslash{}",
-        }
-
-        result = text
-        for char, replacement in replacements.items():
-            result = result.replace(char, replacement)
-
-        return result
+        # Single pass, so inserted backslashes and braces are never re-escaped
+        return _BIBTEX_ESCAPE_PATTERN.sub(lambda match: _BIBTEX_ESCAPES[match.group(0)], text)
 
 
 class StreamingBibTeXExporter:
@@ -3,13 +3,51 @@
 import csv
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Iterable, Iterator, List, Optional
 
 from ..core.models import SearchResult, Paper
 from ..core.exceptions import ExportError
 from ..utils.logging import get_logger
 
 
+def _format_authors(paper: Paper) -> str:
+    """Format authors as "Name1; Name2; Name3"."""
+    return "; ".join(author.name for author in paper.authors)
+
+
+def _format_keywords(paper: Paper) -> str:
+    """Format keywords as comma-separated."""
+    return ", ".join(paper.keywords) if paper.keywords else ""
+
+
+def _column_getter(column: str) -> Callable[[Paper], Any]:
+    """Build a function that extracts one CSV cell from a Paper."""
+    if column == "authors":
+        return _format_authors
+    if column == "keywords":
+        return _format_keywords
+    if column in Paper.model_fields:
+
+        def get_value(paper: Paper) -> Any:
+            value = getattr(paper, column)
+            # Convert None to empty string
+            return value if value is not None else ""
+
+        return get_value
+    return lambda paper: ""
+
+
+def _iter_row_values(papers: Iterable[Paper], columns: List[str]) -> Iterator[List[Any]]:
+    """
+    Lazily convert papers to CSV rows (lists in column order).
+
+    Column handling is resolved once per export rather than once per cell.
+    """
+    getters = [_column_getter(column) for column in columns]
+    for paper in papers:
+        yield [get(paper) for get in getters]
+
+
 class CSVExporter:
     """Export search results to CSV format."""
 
@@ -51,13 +89,10 @@ class CSVExporter:
                 if include_metadata:
                     self._write_metadata(f, results)
 
-                # Write CSV data
-                writer = csv.DictWriter(f, fieldnames=columns)
-                writer.writeheader()
-
-                for paper in results.papers:
-                    row = self._paper_to_row(paper, columns)
-                    writer.writerow(row)
+                # Write CSV data, streaming rows so no intermediate list is built
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                writer.writerows(_iter_row_values(results.papers, columns))
 
             self.logger.info(f"Successfully exported to {filename}")
 
@@ -127,26 +162,6 @@ class CSVExporter:
         ]
         return columns
 
-    def _paper_to_row(self, paper: Paper, columns: List[str]) -> dict:
-        """Convert Paper object to CSV row dictionary."""
-        row = {}
-
-        for col in columns:
-            if col == "authors":
-                # Format authors as "Name1; Name2; Name3"
-                row[col] = "; ".join(author.name for author in paper.authors)
-            elif col == "keywords":
-                # Format keywords as comma-separated
-                row[col] = ", ".join(paper.keywords) if paper.keywords else ""
-            elif hasattr(paper, col):
-                value = getattr(paper, col)
-                # Convert None to empty string
-                row[col] = value if value is not None else ""
-            else:
-                row[col] = ""
-
-        return row
-
 
 class StreamingCSVExporter:
     """
@@ -172,8 +187,9 @@ class StreamingCSVExporter:
 
         # Open file and write header
         self.file = open(filename, "w", newline="", encoding="utf-8")
-        self.writer = csv.DictWriter(self.file, fieldnames=self.columns)
-        self.writer.writeheader()
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(self.columns)
+        self._getters = [_column_getter(column) for column in self.columns]
 
         self.count = 0
 
@@ -201,23 +217,11 @@ class StreamingCSVExporter:
         Args:
             paper: Paper object to write
         """
-        row = {}
-        for col in self.columns:
-            if col == "authors":
-                row[col] = "; ".join(author.name for author in paper.authors)
-            elif col == "keywords":
-                row[col] = ", ".join(paper.keywords) if paper.keywords else ""
-            elif hasattr(paper, col):
-                value = getattr(paper, col)
-                row[col] = value if value is not None else ""
-            else:
-                row[col] = ""
-
-        self.writer.writerow(row)
+        self.writer.writerow([get(paper) for get in self._getters])
         self.count += 1
 
-    def write_papers(self, papers: List[Paper]) -> None:
-        """Write multiple papers."""
+    def write_papers(self, papers: Iterable[Paper]) -> None:
+        """Write multiple papers (any iterable, consumed lazily)."""
         for paper in papers:
             self.write_paper(paper)
 
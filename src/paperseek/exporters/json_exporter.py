@@ -1,13 +1,16 @@
 """JSON exporter for search results."""
 
-import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Iterator
 
 from ..core.models import SearchResult, Paper
 from ..core.exceptions import ExportError
+from ..utils import serialization
 from ..utils.logging import get_logger
 
+# Paper fields written by the exporter (everything except extra_data)
+_EXPORTED_PAPER_FIELDS = frozenset(Paper.model_fields) - {"extra_data"}
+
 
 class JSONExporter:
     """Export search results to JSON format."""
@@ -37,15 +40,11 @@ class JSONExporter:
             # Create output directory if needed
             Path(filename).parent.mkdir(parents=True, exist_ok=True)
 
-            # Convert to dictionary
-            data = self._results_to_dict(results, include_raw=include_raw)
-
-            # Write to file
-            with open(filename, "w", encoding="utf-8") as f:
-                if pretty:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(data, f, ensure_ascii=False)
+            # Write papers one at a time instead of building the whole document
+            with open(filename, "wb") as f:
+                f.writelines(
+                    self._iter_json_chunks(results, pretty=pretty, include_raw=include_raw)
+                )
 
             self.logger.info(f"Successfully exported to {filename}")
 
@@ -69,17 +68,55 @@ class JSONExporter:
 
             Path(filename).parent.mkdir(parents=True, exist_ok=True)
 
-            with open(filename, "w", encoding="utf-8") as f:
-                for paper in results.papers:
-                    paper_dict = self._paper_to_dict(paper, include_raw=include_raw)
-                    f.write(json.dumps(paper_dict, ensure_ascii=False) + "\n")
+            with open(filename, "wb") as f:
+                f.writelines(self._iter_jsonl_lines(results.papers, include_raw=include_raw))
 
             self.logger.info(f"Successfully exported to {filename}")
 
         except Exception as e:
             raise ExportError(f"Failed to export to JSONL: {e}") from e
 
-    def _results_to_dict(self, results: SearchResult, include_raw: bool = False) -> Dict[str, Any]:
+    def _iter_jsonl_lines(
+        self, papers: Iterable[Paper], include_raw: bool = False
+    ) -> Iterator[bytes]:
+        """Lazily serialize papers to UTF-8 encoded JSONL lines."""
+        for paper in papers:
+            yield self._paper_to_json(paper, include_raw=include_raw) + b"\n"
+
+    def _iter_json_chunks(
+        self, results: SearchResult, pretty: bool = True, include_raw: bool = False
+    ) -> Iterator[bytes]:
+        """
+        Lazily serialize SearchResult to a UTF-8 encoded JSON document.
+
+        The output is identical to serializing _results_to_dict() in one go,
+        but only one paper is held in serialized form at a time.
+        """
+        # "papers" is the last key, so its empty list is the last "[]" in the output
+        envelope = self._results_to_dict(results, include_raw=include_raw, include_papers=False)
+        head, _, tail = serialization.dumps(envelope, pretty=pretty).rpartition(b"[]")
+
+        if not results.papers:
+            yield head + b"[]" + tail
+            return
+
+        if pretty:
+            # Papers sit two levels deep in the indented document
+            start, separator, end = b"[\n    ", b",\n    ", b"\n  ]"
+        else:
+            start, separator, end = b"[", b",", b"]"
+
+        yield head + start
+        for i, paper in enumerate(results.papers):
+            if i:
+                yield separator
+            item = self._paper_to_json(paper, include_raw=include_raw, pretty=pretty)
+            yield item.replace(b"\n", b"\n    ") if pretty else item
+        yield end + tail
+
+    def _results_to_dict(
+        self, results: SearchResult, include_raw: bool = False, include_papers: bool = True
+    ) -> Dict[str, Any]:
         """Convert SearchResult to dictionary."""
         return {
             "metadata": {
@@ -96,11 +133,27 @@ class JSONExporter:
                 }
                 for name, stat in results.field_statistics().items()
             },
-            "papers": [
-                self._paper_to_dict(paper, include_raw=include_raw) for paper in results.papers
-            ],
+            "papers": (
+                [self._paper_to_dict(paper, include_raw=include_raw) for paper in results.papers]
+                if include_papers
+                else []
+            ),
         }
 
+    def _paper_to_json(
+        self, paper: Paper, include_raw: bool = False, pretty: bool = False
+    ) -> bytes:
+        """
+        Serialize Paper to UTF-8 encoded JSON.
+
+        Produces the same fields as _paper_to_dict, but lets pydantic-core write
+        the JSON directly instead of building an intermediate dictionary.
+        """
+        include = set(_EXPORTED_PAPER_FIELDS)
+        if include_raw and paper.extra_data:
+            include.add("extra_data")
+        return paper.model_dump_json(include=include, indent=2 if pretty else None).encode("utf-8")
+
     def _paper_to_dict(self, paper: Paper, include_raw: bool = False) -> Dict[str, Any]:
         """Convert Paper to dictionary."""
         data = {
@@ -130,7 +183,6 @@ class JSONExporter:
             "is_open_access": paper.is_open_access,
             "source_database": paper.source_database,
             "source_id": paper.source_id,
-            "retrieved_at": paper.retrieved_at.isoformat(),
         }
 
         # Add extra data if requested
@@ -139,6 +191,9 @@ class JSONExporter:
             extra = {k: v for k, v in paper.extra_data.items() if k != "raw" or include_raw}
             data["extra_data"] = extra
 
+        # Same key order as the Paper model (and _paper_to_json)
+        data["retrieved_at"] = paper.retrieved_at.isoformat()
+
         return data
 
 
@@ -162,9 +217,10 @@ class StreamingJSONLExporter:
         # Create output directory
         Path(filename).parent.mkdir(parents=True, exist_ok=True)
 
-        # Open file
-        self.file = open(filename, "w", encoding="utf-8")
+        # Open file (serialization.dumps returns UTF-8 bytes)
+        self.file = open(filename, "wb")
         self.count = 0
+        self._exporter = JSONExporter()
 
     def write_paper(self, paper: Paper, include_raw: bool = False) -> None:
         """
@@ -174,12 +230,10 @@ class StreamingJSONLExporter:
             paper: Paper object to write
             include_raw: Include raw API data
         """
-        exporter = JSONExporter()
-        paper_dict = exporter._paper_to_dict(paper, include_raw=include_raw)
-        self.file.write(json.dumps(paper_dict, ensure_ascii=False) + "\n")
+        self.file.write(self._exporter._paper_to_json(paper, include_raw=include_raw) + b"\n")
         self.count += 1
 
-    def write_papers(self, papers: list, include_raw: bool = False) -> None:
+    def write_papers(self, papers: Iterable[Paper], include_raw: bool = False) -> None:
         """Write multiple papers."""
         for paper in papers:
             self.write_paper(paper, include_raw=include_raw)
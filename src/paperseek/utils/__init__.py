@@ -1,6 +1,8 @@
 """Utility modules for academic search."""
 
 from .pdf_downloader import PDFDownloader
+from .doi_cache import DOICache
+from .search_cache import SearchCache
 from .normalization import (
     AuthorNormalizer,
     DateNormalizer,
@@ -12,6 +14,8 @@ from .normalization import (
 
 __all__ = [
     "PDFDownloader",
+    "DOICache",
+    "SearchCache",
     "AuthorNormalizer",
     "DateNormalizer",
     "IdentifierNormalizer",
@@ -0,0 +1,122 @@
+"""Near-duplicate detection for paper titles.
+
+The same paper is sometimes indexed under slightly different titles by
+different databases (e.g. CrossRef vs. Semantic Scholar). Fuzzy matching uses
+rapidfuzz when it is installed (``pip install paperseek[fuzzy]``).
+"""
+
+from typing import List, Sequence
+
+# Try to import rapidfuzz, but make it optional
+try:
+    from rapidfuzz import process
+    from rapidfuzz.distance import JaroWinkler, Levenshtein
+
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+
+def unique_title_indices(titles: Sequence[str], threshold: float = 0.92) -> List[int]:
+    """
+    Find one representative for each group of near-identical titles.
+
+    Titles are compared pairwise with Jaro-Winkler similarity; pairs scoring
+    at or above the threshold are grouped together (transitively). The first
+    title of each group is kept, so earlier entries take precedence.
+
+    Args:
+        titles: Titles to compare, ideally normalized with
+            TextNormalizer.normalize_title
+        threshold: Minimum Jaro-Winkler similarity (0-1) to treat two titles
+            as the same paper
+
+    Returns:
+        Sorted indices of the titles to keep
+
+    Raises:
+        ImportError: If rapidfuzz is not installed
+    """
+    if not RAPIDFUZZ_AVAILABLE:
+        raise ImportError(
+            "rapidfuzz is required for fuzzy title matching. "
+            "Install it with: pip install paperseek[fuzzy]"
+        )
+
+    parent = list(range(len(titles)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # process.extract scores one title against all others in C; unlike cdist
+    # it returns plain tuples, so numpy is not needed
+    for i, title in enumerate(titles):
+        matches = process.extract(
+            title,
+            titles,
+            scorer=JaroWinkler.similarity,
+            score_cutoff=threshold,
+            limit=None,
+        )
+        for _, _, j in matches:
+            if j <= i:
+                continue
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                # The lower index stays the representative
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    return [i for i in range(len(titles)) if parent[i] == i]
+
+
+def within_k(a: str, b: str, k: int) -> bool:
+    """
+    Check whether two strings are at most k edits (Levenshtein) apart.
+
+    Only the diagonal band |i - j| <= k of the edit-distance matrix is filled,
+    and the comparison stops as soon as a whole row exceeds k, so the cost is
+    O(k * min(len(a), len(b))) rather than O(len(a) * len(b)). rapidfuzz's
+    bounded Levenshtein.distance is used instead when it is installed.
+
+    Args:
+        a: First string
+        b: Second string
+        k: Maximum number of insertions, deletions and substitutions
+
+    Returns:
+        True if the edit distance is at most k
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        return Levenshtein.distance(a, b, score_cutoff=k) <= k
+
+    if len(a) > len(b):
+        a, b = b, a
+    if len(b) - len(a) > k:
+        return False
+
+    # Cells outside the band hold k + 1 ("too far")
+    too_far = k + 1
+    previous = [j if j <= k else too_far for j in range(len(b) + 1)]
+
+    for i in range(1, len(a) + 1):
+        current = [too_far] * (len(b) + 1)
+        if i <= k:
+            current[0] = i
+        row_min = current[0]
+        char = a[i - 1]
+
+        for j in range(max(1, i - k), min(len(b), i + k) + 1):
+            cost = 0 if char == b[j - 1] else 1
+            value = min(previous[j - 1] + cost, previous[j] + 1, current[j - 1] + 1)
+            current[j] = value
+            if value < row_min:
+                row_min = value
+
+        if row_min > k:
+            return False
+        previous = current
+
+    return previous[len(b)] <= k
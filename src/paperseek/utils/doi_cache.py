@@ -0,0 +1,218 @@
+"""Persistent on-disk cache for DOI lookups.
+
+Repeated runs of a script tend to resolve the same DOIs against the same
+databases. This module stores normalized Paper objects in a small SQLite
+database keyed by (source database, DOI) so that later lookups are served
+from disk instead of the network.
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from types import TracebackType
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+
+from ..core.models import Paper
+from .normalization import IdentifierNormalizer
+
+# SQLite limits the number of bound parameters per statement (999 on older builds)
+_MAX_SQL_PARAMS = 900
+
+
+class DOICache:
+    """
+    Thread-safe SQLite-backed cache of Paper objects keyed by (source, DOI).
+
+    Papers are stored as JSON produced by Pydantic, so cached entries survive
+    across sessions and package upgrades that keep the Paper schema compatible.
+    Entries older than the configured TTL are treated as misses; the TTL can
+    be overridden per source for databases whose records change more or less
+    often than the default assumes.
+
+    Example:
+        >>> cache = DOICache("~/.cache/paperseek/doi_cache.sqlite")
+        >>> paper = cache.get("crossref", "10.1038/nature14539")
+        >>> if paper is None:
+        ...     paper = crossref_client.get_by_doi("10.1038/nature14539")
+        ...     cache.set("crossref", "10.1038/nature14539", paper)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_days: float = 90.0,
+        source_ttl_days: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Initialize DOI cache.
+
+        Args:
+            path: Path to the SQLite database file (created if missing)
+            ttl_days: Number of days before a cached entry expires
+            source_ttl_days: Per-source overrides of ttl_days
+                (e.g. {"crossref": 7, "arxiv": 30})
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.source_ttl_seconds = {
+            source: days * 24 * 60 * 60 for source, days in (source_ttl_days or {}).items()
+        }
+
+        self._lock = Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS doi_cache ("
+                "source TEXT NOT NULL, "
+                "doi TEXT NOT NULL, "
+                "fetched_at INTEGER NOT NULL, "
+                "payload BLOB NOT NULL, "
+                "PRIMARY KEY (source, doi))"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def normalize_doi(doi: str) -> str:
+        """Normalize a DOI for use as a cache key (DOIs are case-insensitive)."""
+        return (IdentifierNormalizer.clean_doi(doi) or "").lower()
+
+    def _min_fetched_at(self, source: str) -> int:
+        """Oldest fetch timestamp that is still considered fresh for a source."""
+        return int(time.time() - self.source_ttl_seconds.get(source, self.ttl_seconds))
+
+    def get(self, source: str, doi: str) -> Optional[Paper]:
+        """
+        Get a cached paper.
+
+        Args:
+            source: Database the paper was retrieved from
+            doi: Digital Object Identifier
+
+        Returns:
+            Cached Paper or None on a miss or expired entry
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM doi_cache WHERE source = ? AND doi = ? AND fetched_at >= ?",
+                (source, self.normalize_doi(doi), self._min_fetched_at(source)),
+            ).fetchone()
+
+        if row is None:
+            return None
+        return Paper.model_validate_json(row[0])
+
+    def get_many(self, source: str, dois: Iterable[str]) -> Dict[str, Paper]:
+        """
+        Get all cached papers for a list of DOIs from one source.
+
+        Args:
+            source: Database the papers were retrieved from
+            dois: DOIs to look up
+
+        Returns:
+            Dictionary mapping normalized DOI to cached Paper (hits only)
+        """
+        keys = list(dict.fromkeys(self.normalize_doi(doi) for doi in dois))
+        hits: Dict[str, Paper] = {}
+        min_fetched_at = self._min_fetched_at(source)
+
+        for start in range(0, len(keys), _MAX_SQL_PARAMS):
+            chunk = keys[start : start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT doi, payload FROM doi_cache "
+                    f"WHERE source = ? AND fetched_at >= ? AND doi IN ({placeholders})",
+                    (source, min_fetched_at, *chunk),
+                ).fetchall()
+            for doi, payload in rows:
+                hits[doi] = Paper.model_validate_json(payload)
+
+        return hits
+
+    def set(self, source: str, doi: str, paper: Paper) -> None:
+        """
+        Store a paper in the cache.
+
+        Args:
+            source: Database the paper was retrieved from
+            doi: Digital Object Identifier
+            paper: Paper to cache
+        """
+        self.set_many(source, [(doi, paper)])
+
+    def set_many(self, source: str, items: List[Tuple[str, Paper]]) -> None:
+        """
+        Store multiple papers in the cache in a single transaction.
+
+        Args:
+            source: Database the papers were retrieved from
+            items: List of (doi, paper) tuples
+        """
+        if not items:
+            return
+
+        now = int(time.time())
+        rows = [
+            (source, self.normalize_doi(doi), now, paper.model_dump_json()) for doi, paper in items
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO doi_cache (source, doi, fetched_at, payload) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired entries.
+
+        Returns:
+            Number of deleted entries
+        """
+        overridden = list(self.source_ttl_seconds)
+        placeholders = ",".join("?" * len(overridden))
+        with self._lock:
+            deleted = self._conn.execute(
+                f"DELETE FROM doi_cache WHERE fetched_at < ? AND source NOT IN ({placeholders})",
+                (int(time.time() - self.ttl_seconds), *overridden),
+            ).rowcount
+            for source in overridden:
+                deleted += self._conn.execute(
+                    "DELETE FROM doi_cache WHERE source = ? AND fetched_at < ?",
+                    (source, self._min_fetched_at(source)),
+                ).rowcount
+            self._conn.commit()
+            return deleted
+
+    def clear(self) -> None:
+        """Delete all cached entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM doi_cache")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries (including expired ones)."""
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM doi_cache").fetchone()[0])
+
+    def __enter__(self) -> "DOICache":
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Context manager exit."""
+        self.close()
@@ -0,0 +1,63 @@
+"""Optional on-disk HTTP response cache for database clients.
+
+When a database's ``http_cache_path`` is configured, its client sends requests
+through a requests-cache session (``pip install paperseek[cache]``) that
+stores GET responses in SQLite, so repeated lookups and searches are answered
+from disk instead of the network. Cache-Control and ETag headers sent by the
+API are honoured.
+"""
+
+from datetime import timedelta
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Try to import requests-cache, but make it optional
+try:
+    import requests_cache
+
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+
+def create_cached_session(path: str, ttl_days: float, adapter: HTTPAdapter) -> requests.Session:
+    """
+    Create a session whose GET responses are cached in a SQLite file.
+
+    Query parameters (including mailto/api_key) are part of the cache key, as
+    is the Accept header, so DOI content negotiation for different formats
+    does not collide.
+
+    Args:
+        path: Path to the SQLite cache file (created if missing)
+        ttl_days: Number of days before a cached response expires
+        adapter: HTTP adapter (connection pool and retry strategy) to mount
+
+    Returns:
+        Cached requests.Session
+
+    Raises:
+        ImportError: If requests-cache is not installed
+    """
+    if not REQUESTS_CACHE_AVAILABLE:
+        raise ImportError(
+            "requests-cache is required for http_cache_path. "
+            "Install it with: pip install paperseek[cache]"
+        )
+
+    cache_path = Path(path).expanduser()
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+    session = requests_cache.CachedSession(
+        cache_name=str(cache_path),
+        backend="sqlite",
+        expire_after=timedelta(days=ttl_days),
+        allowable_methods=("GET",),
+        match_headers=["Accept"],
+        cache_control=True,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
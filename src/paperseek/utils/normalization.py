@@ -6,12 +6,43 @@ extracting DOIs, etc.) are similar and can be shared.
 """
 
 import re
+import unicodedata
+from functools import lru_cache
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
 from ..core.models import Author
 
+# Letters and digits (underscore counts as punctuation for titles)
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+
+# Identifier patterns (compiled once, used for every paper)
+_DOI_PREFIX_PATTERN = re.compile(r"^(?:doi:|https?://(?:dx\.)?doi\.org/)", re.IGNORECASE)
+_ORCID_PREFIX_PATTERN = re.compile(r"^https?://orcid\.org/", re.IGNORECASE)
+_ARXIV_PREFIX_PATTERN = re.compile(r"^arxiv:", re.IGNORECASE)
+_ARXIV_URL_ID_PATTERN = re.compile(r"(?:abs|pdf)/(\d{4}\.\d{4,5}(?:v\d+)?)")
+_ARXIV_ID_PATTERN = re.compile(r"\b(\d{4}\.\d{4,5}(?:v\d+)?)\b")
+_PMID_URL_PATTERN = re.compile(r"/(\d+)/?")
+_PMID_PATTERN = re.compile(r"\b(\d{7,8})\b")
+_YEAR_PATTERN = re.compile(r"\b(19|20)\d{2}\b")
+
+# Normalized titles kept by TextNormalizer.normalize_title
+_TITLE_CACHE_SIZE = 8192
+
+# Keyword tables for venue classification (built once, used for every paper)
+_CONFERENCE_TYPE_WORDS = ("proceedings", "conference", "symposium", "workshop")
+_JOURNAL_TYPE_WORDS = ("journal", "article")
+_CONFERENCE_KEYWORDS = (
+    "conference",
+    "symposium",
+    "workshop",
+    "proceedings",
+    "congress",
+    "summit",
+)
+_JOURNAL_KEYWORDS = ("journal", "transactions", "letters", "review", "magazine")
+
 
 class TextNormalizer:
     """Utilities for cleaning and normalizing text fields."""
@@ -30,11 +61,9 @@ class TextNormalizer:
         if not text:
             return None
 
-        # Strip whitespace
-        cleaned = text.strip()
-
-        # Remove excessive whitespace
-        cleaned = re.sub(r"\s+", " ", cleaned)
+        # Strip and collapse whitespace runs to single spaces; split() without
+        # arguments uses the same whitespace definition as \s, without a regex
+        cleaned = " ".join(text.split())
 
         return cleaned if cleaned else None
 
@@ -62,6 +91,30 @@ class TextNormalizer:
 
         return cleaned
 
+    @staticmethod
+    @lru_cache(maxsize=_TITLE_CACHE_SIZE)
+    def normalize_title(title: Optional[str]) -> str:
+        """
+        Normalize a title for duplicate detection.
+
+        Applies Unicode compatibility decomposition, strips accents, case folds,
+        and drops punctuation so that "Attention Is All You Need." and
+        "attention is all you need" compare equal. Results are memoized, so
+        repeated dedup passes over the same papers only normalize each title once.
+
+        Args:
+            title: Raw title
+
+        Returns:
+            Normalized title ("" if the title is empty)
+        """
+        if not title:
+            return ""
+
+        decomposed = unicodedata.normalize("NFKD", title).casefold()
+        stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+        return " ".join(_WORD_PATTERN.findall(stripped))
+
 
 class DateNormalizer:
     """Utilities for parsing and normalizing dates."""
@@ -96,6 +149,11 @@ class DateNormalizer:
 
         # String that might be a year or date
         if isinstance(date_input, str):
+            # Bare year (the common case); same range the pattern below accepts
+            if len(date_input) == 4 and date_input.isdigit() and date_input.isascii():
+                value = int(date_input)
+                return value if 1900 <= value <= 2099 else None
+
             # Try to extract year from ISO date
             try:
                 date_obj = datetime.fromisoformat(date_input.replace("Z", "+00:00"))
@@ -104,7 +162,7 @@ class DateNormalizer:
                 pass
 
             # Try to extract just the year
-            match = re.search(r"\b(19|20)\d{2}\b", date_input)
+            match = _YEAR_PATTERN.search(date_input)
             if match:
                 return int(match.group(0))
 
@@ -236,7 +294,8 @@ class AuthorNormalizer:
             given=given, family=family, full_name=name
         )
 
-        return Author(
+        # Every field is already a cleaned str (or None), so skip validation
+        return Author.model_construct(
             name=normalized_name,
             affiliation=TextNormalizer.clean_text(affiliation),
             orcid=TextNormalizer.clean_text(orcid),
@@ -262,25 +321,35 @@ class IdentifierNormalizer:
         if not doi:
             return None
 
-        doi = doi.strip()
+        # Bare DOIs (the common case) carry no prefix to remove
+        if doi.startswith("10."):
+            return doi.rstrip()
 
         # Remove common prefixes
-        prefixes = [
-            "doi:",
-            "DOI:",
-            "https://doi.org/",
-            "http://doi.org/",
-            "https://dx.doi.org/",
-            "http://dx.doi.org/",
-        ]
-
-        for prefix in prefixes:
-            if doi.lower().startswith(prefix.lower()):
-                doi = doi[len(prefix) :]
-                break
+        doi = _DOI_PREFIX_PATTERN.sub("", doi.strip(), count=1)
 
         return doi.strip() if doi else None
 
+    @staticmethod
+    def clean_orcid(orcid: Optional[str]) -> Optional[str]:
+        """
+        Clean and normalize an ORCID iD.
+
+        Removes the "https://orcid.org/" URL prefix that most APIs include.
+
+        Args:
+            orcid: Raw ORCID iD or URL
+
+        Returns:
+            Bare ORCID iD (e.g. "0000-0002-1825-0097") or None
+        """
+        if not orcid:
+            return None
+
+        orcid = _ORCID_PREFIX_PATTERN.sub("", orcid.strip(), count=1)
+
+        return orcid.strip() if orcid else None
+
     @staticmethod
     def extract_arxiv_id(text: Optional[str]) -> Optional[str]:
         """
@@ -296,16 +365,16 @@ class IdentifierNormalizer:
             return None
 
         # Remove arXiv: prefix
-        text = text.replace("arXiv:", "").replace("arxiv:", "")
+        text = _ARXIV_PREFIX_PATTERN.sub("", text.strip(), count=1)
 
         # Extract from URL
         if "arxiv.org" in text:
-            match = re.search(r"(?:abs|pdf)/(\d{4}\.\d{4,5}(?:v\d+)?)", text)
+            match = _ARXIV_URL_ID_PATTERN.search(text)
             if match:
                 return match.group(1)
 
         # Direct ID pattern
-        match = re.search(r"\b(\d{4}\.\d{4,5}(?:v\d+)?)\b", text)
+        match = _ARXIV_ID_PATTERN.search(text)
         if match:
             return match.group(1)
 
@@ -327,12 +396,12 @@ class IdentifierNormalizer:
 
         # Extract from URL
         if "pubmed" in text.lower():
-            match = re.search(r"/(\d+)/?", text)
+            match = _PMID_URL_PATTERN.search(text)
             if match:
                 return match.group(1)
 
         # Direct ID pattern (numeric only)
-        match = re.search(r"\b(\d{7,8})\b", text)
+        match = _PMID_PATTERN.search(text)
         if match:
             return match.group(1)
 
@@ -430,29 +499,16 @@ class VenueNormalizer:
         # Check publication type first
         if publication_type:
             pub_type_lower = publication_type.lower()
-            if any(
-                word in pub_type_lower
-                for word in ["proceedings", "conference", "symposium", "workshop"]
-            ):
+            if any(word in pub_type_lower for word in _CONFERENCE_TYPE_WORDS):
                 return None, venue
-            if any(word in pub_type_lower for word in ["journal", "article"]):
+            if any(word in pub_type_lower for word in _JOURNAL_TYPE_WORDS):
                 return venue, None
 
         # Check venue name for keywords
         venue_lower = venue.lower()
-        conference_keywords = [
-            "conference",
-            "symposium",
-            "workshop",
-            "proceedings",
-            "congress",
-            "summit",
-        ]
-        journal_keywords = ["journal", "transactions", "letters", "review", "magazine"]
-
-        if any(keyword in venue_lower for keyword in conference_keywords):
+        if any(keyword in venue_lower for keyword in _CONFERENCE_KEYWORDS):
             return None, venue
-        if any(keyword in venue_lower for keyword in journal_keywords):
+        if any(keyword in venue_lower for keyword in _JOURNAL_KEYWORDS):
             return venue, None
 
         # Default to journal if unclear
@@ -7,8 +7,10 @@ with polite, conservative rate limiting and proper error handling.
 
 import time
 import hashlib
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional, List, Dict
+from threading import Lock
+from typing import Optional, List, Dict, Set, Tuple
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -30,6 +32,7 @@ class PDFDownloader:
     - Resume capability
     - Progress tracking
     - Duplicate detection
+    - Optional bounded concurrency (request starts stay rate limited)
     """
 
     def __init__(
@@ -42,6 +45,8 @@ class PDFDownloader:
         email: Optional[str] = None,
         overwrite: bool = False,
         verify_ssl: bool = True,
+        max_concurrent_downloads: int = 1,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize PDF downloader.
@@ -55,6 +60,10 @@ class PDFDownloader:
             email: Email for polite requests
             overwrite: Whether to overwrite existing files
             verify_ssl: Whether to verify SSL certificates
+            max_concurrent_downloads: Number of downloads allowed in flight at once.
+                Request starts are still spaced by rate_limit_seconds.
+            session: Existing requests.Session to reuse (e.g. one shared with other
+                HTTP code). It is left open by close(); the caller owns it.
         """
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(parents=True, exist_ok=True)
@@ -64,6 +73,7 @@ class PDFDownloader:
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
         self.overwrite = overwrite
         self.verify_ssl = verify_ssl
+        self.max_concurrent_downloads = max(1, max_concurrent_downloads)
 
         self.logger = get_logger(self.__class__.__name__)
 
@@ -75,9 +85,18 @@ class PDFDownloader:
 
         # Track last download time for rate limiting
         self.last_download_time = 0.0
+        self._rate_lock = Lock()
+        self._stats_lock = Lock()
 
-        # Initialize session with retry logic
-        self.session = self._create_session()
+        # Headers are also sent per request so a shared session is not modified
+        self.request_headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "application/pdf,application/octet-stream,*/*",
+        }
+
+        # Initialize session with retry logic, or reuse the caller's session
+        self._owns_session = session is None
+        self.session = session if session is not None else self._create_session()
 
         # Statistics
         self.stats = {
@@ -100,28 +119,39 @@ class PDFDownloader:
             allowed_methods=["GET", "HEAD"],
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Keep one pooled connection per concurrent download
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_maxsize=max(10, self.max_concurrent_downloads),
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
         # Set default headers
-        session.headers.update(
-            {
-                "User-Agent": self.user_agent,
-                "Accept": "application/pdf,application/octet-stream,*/*",
-            }
-        )
+        session.headers.update(self.request_headers)
 
         return session
 
     def _wait_for_rate_limit(self) -> None:
-        """Wait if needed to respect rate limiting."""
-        if self.last_download_time > 0:
-            elapsed = time.time() - self.last_download_time
-            if elapsed < self.rate_limit_seconds:
-                wait_time = self.rate_limit_seconds - elapsed
-                self.logger.debug(f"Rate limiting: waiting {wait_time:.2f} seconds")
-                time.sleep(wait_time)
+        """
+        Wait if needed to respect rate limiting.
+
+        The lock is held while sleeping so that concurrent downloads start
+        one at a time, at least rate_limit_seconds apart.
+        """
+        with self._rate_lock:
+            if self.last_download_time > 0:
+                elapsed = time.time() - self.last_download_time
+                if elapsed < self.rate_limit_seconds:
+                    wait_time = self.rate_limit_seconds - elapsed
+                    self.logger.debug(f"Rate limiting: waiting {wait_time:.2f} seconds")
+                    time.sleep(wait_time)
+            self.last_download_time = time.time()
+
+    def _increment_stat(self, name: str, amount: int = 1) -> None:
+        """Thread-safe increment of a download statistic."""
+        with self._stats_lock:
+            self.stats[name] += amount
 
     def _generate_filename(self, paper: Paper, url: str) -> str:
         """
@@ -211,12 +241,12 @@ class PDFDownloader:
         Returns:
             Path to downloaded file, or None if download failed
         """
-        self.stats["attempted"] += 1
+        self._increment_stat("attempted")
 
         # Check if paper has PDF URL
         if not paper.pdf_url:
             self.logger.debug(f"No PDF URL for paper: {paper.title[:50]}")
-            self.stats["skipped"] += 1
+            self._increment_stat("skipped")
             return None
 
         # Determine output directory
@@ -234,7 +264,7 @@ class PDFDownloader:
         # Check if file already exists
         if self._check_existing_file(filepath):
             self.logger.info(f"File already exists: {filepath}")
-            self.stats["skipped"] += 1
+            self._increment_stat("skipped")
             return filepath
 
         # Wait for rate limiting
@@ -247,11 +277,21 @@ class PDFDownloader:
             # First, do a HEAD request to check file size and content type
             head_response = self.session.head(
                 paper.pdf_url,
+                headers=self.request_headers,
                 timeout=self.timeout,
                 allow_redirects=True,
                 verify=self.verify_ssl,
             )
 
+            # A missing resource can be rejected without requesting the body. Other
+            # HEAD errors are ignored since some servers only reject the method.
+            if head_response.status_code in (404, 410):
+                self.logger.warning(
+                    f"PDF not found (HTTP {head_response.status_code}): {paper.pdf_url}"
+                )
+                self._increment_stat("failed")
+                return None
+
             # Check content type
             content_type = head_response.headers.get("Content-Type", "")
             if "pdf" not in content_type.lower() and "octet-stream" not in content_type.lower():
@@ -259,29 +299,30 @@ class PDFDownloader:
                 # Continue anyway - some servers don't set correct content type
 
             # Check file size
-            content_length = head_response.headers.get("Content-Length")
-            if content_length:
-                file_size = int(content_length)
-                if file_size > self.max_file_size_bytes:
-                    self.logger.warning(
-                        f"File too large: {file_size / 1024 / 1024:.2f} MB "
-                        f"(max: {self.max_file_size_bytes / 1024 / 1024:.2f} MB)"
-                    )
-                    self.stats["failed"] += 1
-                    return None
+            if self._exceeds_size_limit(head_response):
+                self._increment_stat("failed")
+                return None
 
             # Now download the actual file
             response = self.session.get(
                 paper.pdf_url,
+                headers=self.request_headers,
                 timeout=self.timeout,
                 stream=True,
                 verify=self.verify_ssl,
             )
             response.raise_for_status()
 
+            # Servers that omit Content-Length on HEAD often send it on GET;
+            # the body has not been read yet, so rejecting here costs nothing
+            if self._exceeds_size_limit(response):
+                response.close()
+                self._increment_stat("failed")
+                return None
+
             # Download with progress tracking
             downloaded_size = 0
-            chunk_size = 8192  # 8KB chunks
+            chunk_size = 1 << 16  # 64KB chunks
 
             with open(filepath, "wb") as f:
                 for chunk in response.iter_content(chunk_size=chunk_size):
@@ -294,8 +335,9 @@ class PDFDownloader:
                             self.logger.warning(
                                 f"File exceeds size limit during download, stopping"
                             )
+                            response.close()
                             filepath.unlink()  # Remove partial file
-                            self.stats["failed"] += 1
+                            self._increment_stat("failed")
                             return None
 
             # Verify PDF content
@@ -304,13 +346,12 @@ class PDFDownloader:
                 if not self._verify_pdf_content(content_start):
                     self.logger.warning(f"Downloaded file is not a valid PDF")
                     filepath.unlink()  # Remove invalid file
-                    self.stats["failed"] += 1
+                    self._increment_stat("failed")
                     return None
 
             # Success
-            self.stats["successful"] += 1
-            self.stats["total_bytes"] += downloaded_size
-            self.last_download_time = time.time()
+            self._increment_stat("successful")
+            self._increment_stat("total_bytes", downloaded_size)
 
             self.logger.info(
                 f"Successfully downloaded: {filepath.name} " f"({downloaded_size / 1024:.2f} KB)"
@@ -320,21 +361,48 @@ class PDFDownloader:
 
         except requests.exceptions.HTTPError as e:
             self.logger.warning(f"HTTP error downloading {paper.pdf_url}: {e}")
-            self.stats["failed"] += 1
+            self._increment_stat("failed")
             return None
         except requests.exceptions.Timeout:
             self.logger.warning(f"Timeout downloading {paper.pdf_url}")
-            self.stats["failed"] += 1
+            self._increment_stat("failed")
             return None
         except requests.exceptions.RequestException as e:
             self.logger.warning(f"Error downloading {paper.pdf_url}: {e}")
-            self.stats["failed"] += 1
+            self._increment_stat("failed")
             return None
         except Exception as e:
             self.logger.error(f"Unexpected error downloading {paper.pdf_url}: {e}")
-            self.stats["failed"] += 1
+            self._increment_stat("failed")
             return None
 
+    def _exceeds_size_limit(self, response: requests.Response) -> bool:
+        """
+        Check a response's Content-Length header against max_file_size_mb.
+
+        Args:
+            response: HEAD or streamed GET response
+
+        Returns:
+            True if the declared size is over the limit (False if unknown)
+        """
+        content_length = response.headers.get("Content-Length")
+        if content_length is None:
+            return False
+
+        try:
+            file_size = int(content_length)
+        except ValueError:
+            return False
+
+        if file_size > self.max_file_size_bytes:
+            self.logger.warning(
+                f"File too large: {file_size / 1024 / 1024:.2f} MB "
+                f"(max: {self.max_file_size_bytes / 1024 / 1024:.2f} MB)"
+            )
+            return True
+        return False
+
     def download_papers(
         self,
         papers: List[Paper],
@@ -352,6 +420,9 @@ class PDFDownloader:
         Returns:
             Dictionary mapping paper titles to downloaded file paths
         """
+        if self.max_concurrent_downloads > 1:
+            return self._download_papers_concurrently(papers, subdirectory, max_downloads)
+
         results = {}
         downloaded_count = 0
 
@@ -371,6 +442,60 @@ class PDFDownloader:
 
         return results
 
+    def _download_papers_concurrently(
+        self,
+        papers: List[Paper],
+        subdirectory: Optional[str] = None,
+        max_downloads: Optional[int] = None,
+    ) -> Dict[str, Path]:
+        """
+        Download PDFs with up to max_concurrent_downloads transfers in flight.
+
+        New downloads are only submitted while the number of successful plus
+        in-flight downloads is below max_downloads, so the limit is never exceeded.
+        """
+        results: Dict[str, Path] = {}
+        in_flight: Set[Future] = set()
+        future_to_paper: Dict[Future, Paper] = {}
+
+        def collect(done: Set[Future]) -> None:
+            for future in done:
+                paper = future_to_paper.pop(future)
+                filepath = future.result()
+                if filepath:
+                    results[paper.title] = filepath
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_downloads) as executor:
+            for i, paper in enumerate(papers, 1):
+                # Wait for a free slot, or for enough results to decide on the limit
+                while in_flight and (
+                    len(in_flight) >= self.max_concurrent_downloads
+                    or (max_downloads and len(results) + len(in_flight) >= max_downloads)
+                ):
+                    done, in_flight = self._wait_first(in_flight)
+                    collect(done)
+
+                if max_downloads and len(results) >= max_downloads:
+                    self.logger.info(f"Reached maximum download limit: {max_downloads}")
+                    break
+
+                self.logger.info(f"Processing paper {i}/{len(papers)}")
+                future = executor.submit(self.download_paper, paper, subdirectory=subdirectory)
+                future_to_paper[future] = paper
+                in_flight.add(future)
+
+            while in_flight:
+                done, in_flight = self._wait_first(in_flight)
+                collect(done)
+
+        return results
+
+    @staticmethod
+    def _wait_first(futures: Set[Future]) -> Tuple[Set[Future], Set[Future]]:
+        """Wait until at least one future completes."""
+        done, pending = wait(futures, return_when=FIRST_COMPLETED)
+        return set(done), set(pending)
+
     def download_search_results(
         self,
         search_result: SearchResult,
@@ -391,18 +516,7 @@ class PDFDownloader:
             Dictionary mapping paper titles to downloaded file paths
         """
         # Filter papers
-        papers_to_download = []
-
-        for paper in search_result.papers:
-            # Check if has PDF URL
-            if not paper.pdf_url:
-                continue
-
-            # Check open access filter
-            if only_open_access and not paper.is_open_access:
-                continue
-
-            papers_to_download.append(paper)
+        papers_to_download = search_result.papers_with_pdf(only_open_access=only_open_access)
 
         self.logger.info(
             f"Found {len(papers_to_download)} papers with PDF URLs "
@@ -453,8 +567,8 @@ class PDFDownloader:
         print("=" * 60)
 
     def close(self) -> None:
-        """Close the downloader session."""
-        if self.session:
+        """Close the downloader session (a session passed in by the caller is left open)."""
+        if self.session and self._owns_session:
             self.session.close()
 
     def __enter__(self) -> "PDFDownloader":
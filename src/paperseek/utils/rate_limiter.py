@@ -94,6 +94,50 @@ class DatabaseRateLimiter:
         with self._lock:
             return self._limiters.get(database)
 
+    def get_or_add(
+        self,
+        database: str,
+        requests_per_second: Optional[float] = None,
+        requests_per_minute: Optional[float] = None,
+    ) -> RateLimiter:
+        """
+        Get the rate limiter for a database, adding it if needed.
+
+        The existing limiter is returned when it enforces the same limits, so
+        every caller asking for those limits draws from one budget; otherwise
+        a new limiter replaces it.
+
+        Args:
+            database: Database name
+            requests_per_second: Maximum requests per second
+            requests_per_minute: Maximum requests per minute
+
+        Returns:
+            Rate limiter for the database
+        """
+        with self._lock:
+            limiter = self._limiters.get(database)
+            if limiter is None or (
+                limiter.requests_per_second,
+                limiter.requests_per_minute,
+            ) != (requests_per_second, requests_per_minute):
+                limiter = RateLimiter(
+                    requests_per_second=requests_per_second,
+                    requests_per_minute=requests_per_minute,
+                )
+                self._limiters[database] = limiter
+            return limiter
+
+    def reset(self) -> None:
+        """
+        Forget all rate limiters (mainly for testing).
+
+        Clients created afterwards start with a fresh request budget; existing
+        clients keep the limiter they already hold.
+        """
+        with self._lock:
+            self._limiters.clear()
+
 
 class SimpleRateLimiter:
     """
@@ -105,6 +149,9 @@ class SimpleRateLimiter:
     Uses a simple sliding window approach without external dependencies.
     Tracks request timestamps in deques and enforces limits by checking
     window sizes before allowing new requests.
+
+    Per-second rates below one (e.g. arXiv's 1 request per 3 seconds) are
+    enforced over a longer window rather than rounded up to one per second.
     """
 
     def __init__(
@@ -122,6 +169,14 @@ class SimpleRateLimiter:
         self.requests_per_second = requests_per_second
         self.requests_per_minute = requests_per_minute
 
+        # Window holding at least one request: rate r allows max(1, floor(r))
+        # requests per max(1, floor(r)) / r seconds
+        self._second_capacity = 0
+        self._second_period = 1.0
+        if requests_per_second:
+            self._second_capacity = max(1, int(requests_per_second))
+            self._second_period = self._second_capacity / requests_per_second
+
         self._second_window: deque = deque()
         self._minute_window: deque = deque()
         self._lock = Lock()
@@ -133,7 +188,7 @@ class SimpleRateLimiter:
 
             # Clean old entries
             if self.requests_per_second:
-                self._clean_window(self._second_window, now, 1.0)
+                self._clean_window(self._second_window, now, self._second_period)
             if self.requests_per_minute:
                 self._clean_window(self._minute_window, now, 60.0)
 
@@ -141,9 +196,9 @@ class SimpleRateLimiter:
             wait_time = 0.0
 
             if self.requests_per_second:
-                if len(self._second_window) >= self.requests_per_second:
+                if len(self._second_window) >= self._second_capacity:
                     oldest = self._second_window[0]
-                    wait_time = max(wait_time, 1.0 - (now - oldest))
+                    wait_time = max(wait_time, self._second_period - (now - oldest))
 
             if self.requests_per_minute:
                 if len(self._minute_window) >= self.requests_per_minute:
@@ -164,3 +219,34 @@ class SimpleRateLimiter:
         """Remove old entries from window."""
         while window and (now - window[0]) > window_size:
             window.popleft()
+
+
+# Process-wide limiters, so client instances for the same database share one budget
+_shared_limiters = DatabaseRateLimiter()
+
+
+def get_shared_limiter(
+    database: str,
+    requests_per_second: Optional[float] = None,
+    requests_per_minute: Optional[float] = None,
+) -> RateLimiter:
+    """
+    Get the process-wide rate limiter for a database.
+
+    This is a shorthand for DatabaseRateLimiter.get_or_add on a shared instance.
+
+    Args:
+        database: Database name
+        requests_per_second: Maximum requests per second
+        requests_per_minute: Maximum requests per minute
+
+    Returns:
+        Rate limiter shared by all callers with the same database and limits
+    """
+    return _shared_limiters.get_or_add(database, requests_per_second, requests_per_minute)
+
+
+def reset_shared_limiters() -> None:
+    """Reset the process-wide rate limiters (mainly for testing)."""
+    _shared_limiters.reset()
+
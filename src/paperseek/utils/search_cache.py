@@ -0,0 +1,175 @@
+"""Persistent on-disk cache for search results.
+
+Scripts that repeatedly search the same venue and year spend most of their
+time on rate-limited HTTP requests. This module stores complete SearchResult
+objects in a small SQLite database keyed by a stable hash of the search
+filters, the queried databases and the search mode, so that repeat runs are
+served from disk.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from threading import Lock
+from types import TracebackType
+from typing import List, Optional, Type
+
+from ..core.models import SearchFilters, SearchResult
+
+
+def _package_version() -> str:
+    """Installed paperseek version (cached results from other versions are ignored)."""
+    try:
+        return version("paperseek")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class SearchCache:
+    """
+    Thread-safe SQLite-backed cache of SearchResult objects.
+
+    Results are stored as JSON produced by Pydantic together with the
+    paperseek version that created them. Entries older than the configured
+    TTL, or written by a different paperseek version, are treated as misses.
+
+    Example:
+        >>> cache = SearchCache("~/.cache/paperseek/search_cache.sqlite")
+        >>> key = cache.make_key(filters, ["dblp", "openalex"], "parallel")
+        >>> results = cache.get(key)
+        >>> if results is None:
+        ...     results = client.search(filters=filters)
+        ...     cache.set(key, results)
+    """
+
+    def __init__(self, path: str, ttl_days: float = 7.0):
+        """
+        Initialize search cache.
+
+        Args:
+            path: Path to the SQLite database file (created if missing)
+            ttl_days: Number of days before a cached result expires
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.version = _package_version()
+
+        self._lock = Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache ("
+                "key TEXT PRIMARY KEY, "
+                "version TEXT NOT NULL, "
+                "fetched_at INTEGER NOT NULL, "
+                "payload BLOB NOT NULL)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(filters: SearchFilters, databases: List[str], mode: str) -> str:
+        """
+        Build a stable cache key for a search.
+
+        Args:
+            filters: Search filters
+            databases: Databases queried, in order (order affects deduplication)
+            mode: Search mode ('sequential', 'parallel' or 'first')
+
+        Returns:
+            Hex digest identifying the search
+        """
+        payload = json.dumps(
+            {
+                "filters": filters.model_dump(mode="json"),
+                "databases": list(databases),
+                "mode": mode,
+            },
+            sort_keys=True,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+    def get(self, key: str) -> Optional[SearchResult]:
+        """
+        Get a cached search result.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached SearchResult or None on a miss, expired or outdated entry
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM search_cache "
+                "WHERE key = ? AND version = ? AND fetched_at >= ?",
+                (key, self.version, int(time.time() - self.ttl_seconds)),
+            ).fetchone()
+
+        if row is None:
+            return None
+        return SearchResult.model_validate_json(row[0])
+
+    def set(self, key: str, result: SearchResult) -> None:
+        """
+        Store a search result in the cache.
+
+        Args:
+            key: Key from make_key()
+            result: SearchResult to cache
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, version, fetched_at, payload) "
+                "VALUES (?, ?, ?, ?)",
+                (key, self.version, int(time.time()), result.model_dump_json()),
+            )
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired entries and entries from other paperseek versions.
+
+        Returns:
+            Number of deleted entries
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM search_cache WHERE fetched_at < ? OR version != ?",
+                (int(time.time() - self.ttl_seconds), self.version),
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        """Delete all cached entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM search_cache")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries (including expired ones)."""
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0])
+
+    def __enter__(self) -> "SearchCache":
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Context manager exit."""
+        self.close()
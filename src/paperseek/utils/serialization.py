@@ -0,0 +1,94 @@
+"""JSON serialization helpers with optional orjson acceleration.
+
+orjson is used when it is installed (``pip install paperseek[fast]``);
+otherwise the standard library json module is used with equivalent output
+settings (UTF-8, no ASCII escaping, compact separators, two-space
+indentation when pretty). Incremental decoding of large documents needs
+ijson (``pip install paperseek[streaming]``).
+"""
+
+import json
+from typing import Any, BinaryIO, Iterator, Tuple, Type, Union, cast
+
+# Try to import orjson, but fall back to the standard library if unavailable
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import ijson, but make it optional
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+    # Errors raised for malformed or truncated documents by loads() and iter_items()
+    JSON_DECODE_ERRORS: Tuple[Type[Exception], ...] = (ValueError, ijson.JSONError)
+except ImportError:
+    IJSON_AVAILABLE = False
+    JSON_DECODE_ERRORS = (ValueError,)
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: JSON-serializable object
+        pretty: Indent output with two spaces
+
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Deserialize JSON from a string or bytes.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Deserialized Python object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def iter_items(source: BinaryIO, prefix: str) -> Iterator[Any]:
+    """
+    Stream the elements of a JSON array without decoding the whole document.
+
+    Each element is decoded as it is read, so only one is held in memory at
+    a time.
+
+    Args:
+        source: Binary file-like object to read the document from
+        prefix: ijson path of the array elements (e.g. "results.item")
+
+    Yields:
+        Decoded elements, in document order (numbers with a fraction as float)
+
+    Raises:
+        ImportError: If ijson is not installed
+        One of JSON_DECODE_ERRORS (while iterating) if the document is malformed
+            or ends early
+    """
+    if not IJSON_AVAILABLE:
+        raise ImportError(
+            "ijson is required for streaming JSON decoding. "
+            "Install it with: pip install paperseek[streaming]"
+        )
+    return cast(Iterator[Any], ijson.items(source, prefix, use_float=True))
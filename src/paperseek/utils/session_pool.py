@@ -9,7 +9,9 @@ the pool.
 import requests
 from requests.adapters import HTTPAdapter
 from threading import Lock
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
+
+from urllib3.util.retry import Retry
 
 
 class SessionPool:
@@ -49,7 +51,7 @@ class SessionPool:
         database: str,
         pool_connections: int = 10,
         pool_maxsize: int = 20,
-        max_retries: int = 0,
+        max_retries: Union[int, Retry] = 0,
     ) -> requests.Session:
         """
         Get or create a session for the specified database.
@@ -63,7 +65,8 @@ class SessionPool:
             database: Database identifier (e.g., "arxiv", "pubmed", "crossref")
             pool_connections: Number of connection pools to cache
             pool_maxsize: Maximum number of connections in each pool
-            max_retries: Number of retries (0 = no retries, handled elsewhere)
+            max_retries: Number of retries, or a Retry strategy for the adapter
+                (0 = no retries, handled elsewhere)
 
         Returns:
             Configured requests.Session object
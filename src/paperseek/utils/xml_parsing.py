@@ -0,0 +1,106 @@
+"""XML parsing helpers with optional lxml acceleration.
+
+lxml (a C tree builder on top of libxml2) is used when it is installed
+(``pip install paperseek[fast]``); otherwise the standard library ElementTree
+is used. Both return elements with the find/findall/get/text API the clients
+rely on.
+"""
+
+import io
+import threading
+import xml.etree.ElementTree as ET
+from typing import Any, Iterator, Protocol, Sequence, Tuple, Type, Union
+
+# Try to import lxml, but fall back to the standard library if unavailable
+try:
+    from lxml import etree as lxml_etree
+
+    LXML_AVAILABLE = True
+    XML_PARSE_ERRORS: Tuple[Type[Exception], ...] = (ET.ParseError, lxml_etree.XMLSyntaxError)
+except ImportError:
+    LXML_AVAILABLE = False
+    XML_PARSE_ERRORS = (ET.ParseError,)
+
+# lxml parser objects must not be shared between threads
+_local = threading.local()
+
+
+class _BinaryStream(Protocol):
+    """Readable binary stream, e.g. an open file or a streamed ``response.raw``."""
+
+    def read(self, __size: int = ...) -> bytes: ...
+
+
+def _lxml_parser() -> Any:
+    """Per-thread lxml parser that never resolves entities or touches the network."""
+    parser = getattr(_local, "parser", None)
+    if parser is None:
+        parser = lxml_etree.XMLParser(resolve_entities=False, no_network=True)
+        _local.parser = parser
+    return parser
+
+
+def fromstring(data: Union[str, bytes]) -> Any:
+    """
+    Parse an XML document.
+
+    Args:
+        data: XML document; pass the raw response bytes where possible so the
+            encoding declaration is honoured (str input is encoded as UTF-8)
+
+    Returns:
+        Root element
+
+    Raises:
+        One of XML_PARSE_ERRORS if the document is not well-formed
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    if LXML_AVAILABLE:
+        return lxml_etree.fromstring(data, parser=_lxml_parser())
+    return ET.fromstring(data)
+
+
+def iter_elements(
+    data: Union[str, bytes, _BinaryStream], tag: Union[str, Sequence[str]]
+) -> Iterator[Any]:
+    """
+    Stream the elements with a given tag out of an XML document.
+
+    The document is parsed incrementally and each yielded element is cleared
+    (together with already processed siblings when lxml is used) once the
+    caller moves on, so the full tree is never held in memory. Callers must
+    copy what they need out of an element before requesting the next one.
+
+    Args:
+        data: XML document, or a binary file-like object to read it from
+        tag: Tag to yield, in Clark notation (e.g. "{http://www.w3.org/2005/Atom}entry"),
+            or a sequence of such tags
+
+    Yields:
+        Matching elements, in document order
+
+    Raises:
+        One of XML_PARSE_ERRORS if the document is not well-formed
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    source = io.BytesIO(data) if isinstance(data, bytes) else data
+    tags = (tag,) if isinstance(tag, str) else tuple(tag)
+
+    if LXML_AVAILABLE:
+        events = lxml_etree.iterparse(
+            source, events=("end",), tag=tags, resolve_entities=False, no_network=True
+        )
+        for _, element in events:
+            yield element
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+        return
+
+    for _, element in ET.iterparse(source, events=("end",)):
+        if element.tag in tags:
+            yield element
+            element.clear()
@@ -60,6 +60,47 @@ class TestArXivClient:
         client = ArXivClient(config=config)
         assert client.database_name == "arxiv"
 
+    def test_rate_limit_capped_to_documented_limit(self, client):
+        """Test that configured rates above 1 request per 3 seconds are capped."""
+        assert client.rate_limiter.requests_per_second == pytest.approx(1 / 3)
+
+    def test_extract_arxiv_id_from_doi(self, client):
+        """Test extracting arXiv IDs from arXiv DOIs, case-insensitively."""
+        assert client._extract_arxiv_id_from_doi("10.48550/arXiv.2301.00001") == "2301.00001"
+        assert (
+            client._extract_arxiv_id_from_doi("https://doi.org/10.48550/arxiv.2301.00001")
+            == "2301.00001"
+        )
+        assert client._extract_arxiv_id_from_doi("10.1234/test.doi") is None
+
+    @patch("paperseek.clients.arxiv.ArXivClient._make_request")
+    def test_batch_lookup_strips_prefix_and_version(self, mock_request, client):
+        """Test that only the prefix and version suffix are removed from IDs."""
+        mock_response = Mock()
+        mock_response.content = b'<feed xmlns="http://www.w3.org/2005/Atom"/>'
+        mock_request.return_value = mock_response
+
+        client.batch_lookup(["arXiv:2301.00001v2", "solv-int/9901001v1"], "arxiv")
+
+        params = mock_request.call_args.kwargs["params"]
+        assert params["id_list"] == "2301.00001,solv-int/9901001"
+
+    @patch("paperseek.clients.arxiv.ArXivClient._make_request")
+    def test_batch_lookup_chunks_id_list(self, mock_request, client, sample_arxiv_entry):
+        """Test that long identifier lists are split into id_list chunks."""
+        mock_response = Mock()
+        mock_response.content = f"""<feed xmlns="http://www.w3.org/2005/Atom">
+            {sample_arxiv_entry}
+        </feed>"""
+        mock_request.return_value = mock_response
+        client.ID_LIST_CHUNK_SIZE = 2
+
+        result = client.batch_lookup([f"2301.0000{i}" for i in range(5)], "arxiv")
+
+        id_lists = sorted(call.kwargs["params"]["id_list"] for call in mock_request.call_args_list)
+        assert id_lists == ["2301.00000,2301.00001", "2301.00002,2301.00003", "2301.00004"]
+        assert len(result.papers) == 3
+
     def test_database_name(self, client):
         """Test database name property."""
         assert client.database_name == "arxiv"
@@ -68,7 +109,7 @@ class TestArXivClient:
     def test_search_by_title(self, mock_request, client, sample_arxiv_entry):
         """Test search by title."""
         mock_response = Mock()
-        mock_response.text = f"""<?xml version="1.0" encoding="UTF-8"?>
+        mock_response.content = f"""<?xml version="1.0" encoding="UTF-8"?>
         <feed xmlns="http://www.w3.org/2005/Atom">
             <title>ArXiv Query</title>
             <opensearch:totalResults xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">1</opensearch:totalResults>
@@ -86,7 +127,7 @@ class TestArXivClient:
     def test_search_empty_results(self, mock_request, client):
         """Test search with no results."""
         mock_response = Mock()
-        mock_response.text = """<?xml version="1.0" encoding="UTF-8"?>
+        mock_response.content = """<?xml version="1.0" encoding="UTF-8"?>
         <feed xmlns="http://www.w3.org/2005/Atom">
             <title>ArXiv Query</title>
             <opensearch:totalResults xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">0</opensearch:totalResults>
@@ -109,7 +150,7 @@ class TestArXivClient:
     def test_search_by_author(self, mock_request, client, sample_arxiv_entry):
         """Test search by author."""
         mock_response = Mock()
-        mock_response.text = f"""<?xml version="1.0" encoding="UTF-8"?>
+        mock_response.content = f"""<?xml version="1.0" encoding="UTF-8"?>
         <feed xmlns="http://www.w3.org/2005/Atom">
             <opensearch:totalResults xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">1</opensearch:totalResults>
             {sample_arxiv_entry}
@@ -126,7 +167,7 @@ class TestArXivClient:
     def test_search_by_year_range(self, mock_request, client, sample_arxiv_entry):
         """Test search with year range."""
         mock_response = Mock()
-        mock_response.text = f"""<?xml version="1.0" encoding="UTF-8"?>
+        mock_response.content = f"""<?xml version="1.0" encoding="UTF-8"?>
         <feed xmlns="http://www.w3.org/2005/Atom">
             <opensearch:totalResults xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">1</opensearch:totalResults>
             {sample_arxiv_entry}
@@ -139,11 +180,26 @@ class TestArXivClient:
 
         assert result is not None
 
+    @patch("paperseek.clients.arxiv.ArXivClient._make_request")
+    def test_search_filters_dates_server_side(self, mock_request, client):
+        """Test that year filters become a submittedDate range in the query."""
+        mock_response = Mock()
+        mock_response.content = b'<feed xmlns="http://www.w3.org/2005/Atom"/>'
+        mock_request.return_value = mock_response
+
+        client.search(SearchFilters(title="test", year_start=2020, year_end=2022))
+        query = mock_request.call_args.kwargs["params"]["search_query"]
+        assert query == 'ti:"test" AND submittedDate:[202001010000 TO 202212312359]'
+
+        client.search(SearchFilters(year=2023))
+        query = mock_request.call_args.kwargs["params"]["search_query"]
+        assert query == "submittedDate:[202301010000 TO 202312312359]"
+
     @patch("paperseek.clients.arxiv.ArXivClient._make_request")
     def test_get_by_identifier(self, mock_request, client, sample_arxiv_entry):
         """Test getting paper by arXiv ID."""
         mock_response = Mock()
-        mock_response.text = f"""<?xml version="1.0" encoding="UTF-8"?>
+        mock_response.content = f"""<?xml version="1.0" encoding="UTF-8"?>
         <feed xmlns="http://www.w3.org/2005/Atom">
             <opensearch:totalResults xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">1</opensearch:totalResults>
             {sample_arxiv_entry}
@@ -159,7 +215,7 @@ class TestArXivClient:
     def test_normalize_paper(self, mock_request, client, sample_arxiv_entry):
         """Test paper normalization."""
         mock_response = Mock()
-        mock_response.text = f"""<?xml version="1.0" encoding="UTF-8"?>
+        mock_response.content = f"""<?xml version="1.0" encoding="UTF-8"?>
         <feed xmlns="http://www.w3.org/2005/Atom">
             <opensearch:totalResults xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">1</opensearch:totalResults>
             {sample_arxiv_entry}
@@ -173,13 +229,52 @@ class TestArXivClient:
         # Check that papers are normalized
         assert result is not None
 
+    def test_normalize_paper_from_xml_fields(self, client):
+        """Test that all extracted fields are populated from one entry."""
+        from paperseek.utils import xml_parsing
+
+        entry = xml_parsing.fromstring(
+            """<entry xmlns="http://www.w3.org/2005/Atom"
+                      xmlns:arxiv="http://arxiv.org/schemas/atom">
+                <id>http://arxiv.org/abs/2301.00001v1</id>
+                <title>Test Paper Title</title>
+                <summary>Abstract text.</summary>
+                <published>2023-01-01T00:00:00Z</published>
+                <author><name>John Doe</name></author>
+                <author><name>Jane Smith</name></author>
+                <link href="http://arxiv.org/abs/2301.00001v1" rel="alternate"/>
+                <link title="doi" href="http://dx.doi.org/10.1234/test.doi" rel="related"/>
+                <link title="pdf" href="http://arxiv.org/pdf/2301.00001v1" rel="related"/>
+                <arxiv:comment>10 pages</arxiv:comment>
+                <arxiv:primary_category term="cs.AI"/>
+                <category term="cs.AI"/>
+                <category term="cs.LG"/>
+            </entry>"""
+        )
+
+        paper = client._normalize_paper_from_xml(entry)
+
+        assert paper.source_id == "2301.00001v1"
+        assert paper.title == "Test Paper Title"
+        assert [a.name for a in paper.authors] == ["John Doe", "Jane Smith"]
+        assert paper.abstract == "Abstract text."
+        assert paper.year == 2023
+        assert paper.doi == "10.1234/test.doi"
+        assert paper.pdf_url == "http://arxiv.org/pdf/2301.00001v1"
+        assert paper.venue == "cs.AI"
+        assert paper.keywords == ["cs.AI", "cs.LG"]
+        assert paper.extra_data["comment"] == "10 pages"
+
+        # Constructed without validation, but must still pass it
+        assert Paper.model_validate(paper.model_dump()) == paper
+
     @patch("paperseek.clients.arxiv.ArXivClient._make_request")
     def test_max_results_limit(self, mock_request, client, sample_arxiv_entry):
         """Test that max_results is respected."""
         mock_response = Mock()
         # Create multiple entries
         entries = sample_arxiv_entry * 5
-        mock_response.text = f"""<?xml version="1.0" encoding="UTF-8"?>
+        mock_response.content = f"""<?xml version="1.0" encoding="UTF-8"?>
         <feed xmlns="http://www.w3.org/2005/Atom">
             <opensearch:totalResults xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">5</opensearch:totalResults>
             {entries}
@@ -7,6 +7,7 @@ import requests
 from paperseek.core.base import DatabaseClient
 from paperseek.core.models import SearchFilters, SearchResult, Paper
 from paperseek.core.config import DatabaseConfig
+from paperseek.utils.rate_limiter import reset_shared_limiters
 from paperseek.core.exceptions import (
     APIError,
     RateLimitError,
@@ -31,6 +32,9 @@ class TestBaseDatabaseClient:
     @pytest.fixture
     def mock_client(self, config):
         """Create a mock client implementation."""
+        # Each test gets its own request budget instead of waiting on the last one
+        reset_shared_limiters()
+
         class MockClient(DatabaseClient):
             @property
             def database_name(self) -> str:
@@ -69,12 +73,71 @@ class TestBaseDatabaseClient:
         assert mock_client.config is not None
         assert mock_client.database_name == "mock_db"
 
+    def test_clients_of_same_database_share_rate_limiter(self, config, mock_client):
+        """Test that separate instances draw from one request budget."""
+        other = type(mock_client)(config=config)
+        assert other.rate_limiter is mock_client.rate_limiter
+
+        faster = type(mock_client)(config=DatabaseConfig(rate_limit_per_second=5.0))
+        assert faster.rate_limiter is not mock_client.rate_limiter
+
+    def test_clients_of_same_database_share_session(self, config, mock_client):
+        """Test that instances reuse one pooled session, and so its kept-alive connections."""
+        other = type(mock_client)(config=config)
+        assert other.session is mock_client.session
+
+        # Closing one client leaves the shared session (and its pool) open
+        other.close()
+        assert type(mock_client)(config=config).session is mock_client.session
+
     def test_context_manager(self, mock_client):
         """Test context manager protocol."""
         with mock_client as client:
             assert client is not None
             assert hasattr(client, 'session')
 
+    def test_session_adapter_keeps_pool_size(self, config):
+        """Test the retry adapter keeps the shared session's connection pool size."""
+        from paperseek.utils.session_pool import SessionPool
+
+        class PooledClient(DatabaseClient):
+            @property
+            def database_name(self) -> str:
+                return "pooled_db"
+
+            def search(self, filters):
+                return SearchResult()
+
+            def get_by_doi(self, doi):
+                return None
+
+            def get_by_identifier(self, identifier, id_type):
+                return None
+
+            def batch_lookup(self, identifiers, id_type):
+                return SearchResult()
+
+            def _normalize_paper(self, raw_data):
+                return Paper(title="x", source_database=self.database_name)
+
+        SessionPool.close_session("pooled_db")
+        client = PooledClient(config=config)
+
+        adapter = client.session.get_adapter("https://example.com")
+        assert adapter.max_retries.total == config.max_retries
+        assert adapter._pool_maxsize == DatabaseClient.POOL_MAXSIZE
+        SessionPool.close_session("pooled_db")
+
+    def test_http_cache_requires_requests_cache(self, config, mock_client, monkeypatch, tmp_path):
+        """Test that configuring an HTTP cache without requests-cache fails clearly."""
+        from paperseek.utils import http_cache
+
+        monkeypatch.setattr(http_cache, "REQUESTS_CACHE_AVAILABLE", False)
+        config.http_cache_path = str(tmp_path / "http.sqlite")
+
+        with pytest.raises(ImportError, match=r"paperseek\[cache\]"):
+            type(mock_client)(config=config)
+
     def test_close(self, mock_client):
         """Test client closure - with SessionPool, session is not closed."""
         mock_client.session = Mock()
@@ -124,6 +187,21 @@ class TestBaseDatabaseClient:
         
         assert "404" in str(exc_info.value)
 
+    @patch('requests.Session.request')
+    def test_make_request_stream_closes_failed_response(self, mock_request, mock_client):
+        """Test that streamed requests are forwarded and failed ones released."""
+        mock_response = Mock()
+        mock_response.status_code = 500
+        mock_response.ok = False
+        mock_response.text = "Server Error"
+        mock_request.return_value = mock_response
+
+        with pytest.raises(APIError):
+            mock_client._make_request("https://api.test.com", stream=True)
+
+        assert mock_request.call_args[1]["stream"] is True
+        mock_response.close.assert_called_once()
+
     @patch('requests.Session.request')
     def test_make_request_429_rate_limit(self, mock_request, mock_client):
         """Test handling of rate limit errors (429)."""
@@ -204,3 +282,30 @@ class TestBaseDatabaseClient:
         result = mock_client.batch_lookup(["id1", "id2"], "doi")
         assert isinstance(result, SearchResult)
         assert len(result.papers) == 0
+
+    def test_lookup_many_preserves_order_and_drops_misses(self, mock_client):
+        """Test concurrent lookups return found papers in identifier order."""
+        import threading
+        import time
+
+        threads = set()
+
+        def lookup(identifier):
+            threads.add(threading.get_ident())
+            time.sleep(0.01)
+            if identifier == "missing":
+                return None
+            return Paper(title=identifier, source_database="test")
+
+        identifiers = ["a", "missing", "b", "c", "d"]
+        papers = mock_client._lookup_many(identifiers, lookup)
+
+        assert [p.title for p in papers] == ["a", "b", "c", "d"]
+        assert len(threads) > 1
+
+    def test_parse_json_decodes_body(self, mock_client):
+        """Test decoding a JSON response body from its raw bytes."""
+        response = Mock()
+        response.content = '{"title": "Über", "count": 2}'.encode("utf-8")
+
+        assert mock_client._parse_json(response) == {"title": "Über", "count": 2}
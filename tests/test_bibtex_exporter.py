@@ -202,6 +202,14 @@ class TestBibTeXExporter:
         # The exact escaping depends on implementation
         assert 'Test' in entry
 
+    def test_escape_is_single_pass(self):
+        """Test that escapes are not re-escaped by later replacements."""
+        exporter = BibTeXExporter()
+
+        escaped = exporter._escape_bibtex("A & {B} \\ ~C 50%")
+
+        assert escaped == r"A \& \{B\} \textbackslash{} \textasciitilde{}C 50\%"
+
     def test_all_fields_included(self, sample_papers):
         """Test that all available fields are included."""
         exporter = BibTeXExporter()
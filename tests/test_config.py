@@ -0,0 +1,77 @@
+"""Tests for configuration loading."""
+
+import pytest
+
+from paperseek.core import config as config_module
+from paperseek.core.config import load_config
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Start every test with an empty configuration cache."""
+    config_module._CONFIG_CACHE.clear()
+    yield
+    config_module._CONFIG_CACHE.clear()
+
+
+class TestLoadConfig:
+    """Test suite for load_config."""
+
+    def test_config_dict_overrides(self):
+        """Test that config_dict values are applied."""
+        config = load_config(config_dict={"email": "test@example.com", "fail_fast": True})
+
+        assert config.email == "test@example.com"
+        assert config.fail_fast is True
+
+    def test_repeated_loads_are_cached(self, monkeypatch):
+        """Test that identical inputs are only validated once."""
+        calls = []
+        original = config_module._build_config
+
+        def counting_build(*args):
+            calls.append(args)
+            return original(*args)
+
+        monkeypatch.setattr(config_module, "_build_config", counting_build)
+
+        config_dict = {"email": "test@example.com", "crossref": {"enabled": True}}
+        first = load_config(config_dict=config_dict)
+        second = load_config(config_dict=config_dict)
+
+        assert len(calls) == 1
+        assert first == second
+
+    def test_cached_config_is_independent_copy(self):
+        """Test that mutating a loaded config does not affect later loads."""
+        config_dict = {"crossref": {"enabled": True}}
+
+        first = load_config(config_dict=config_dict)
+        first.crossref.enabled = False
+        second = load_config(config_dict=config_dict)
+
+        assert second.crossref.enabled is True
+
+    def test_cache_key_distinguishes_key_types(self):
+        """Test that keys which only match as strings give different cache keys."""
+        key_int = config_module._config_cache_key(None, {"extra": {1: "a"}}, False)
+        key_str = config_module._config_cache_key(None, {"extra": {"1": "a"}}, False)
+
+        assert key_int != key_str
+
+    def test_environment_change_invalidates_cache(self, monkeypatch):
+        """Test that changed environment variables are picked up."""
+        monkeypatch.setenv("ACADEMIC_SEARCH_EMAIL", "first@example.com")
+        assert load_config().email == "first@example.com"
+
+        monkeypatch.setenv("ACADEMIC_SEARCH_EMAIL", "second@example.com")
+        assert load_config().email == "second@example.com"
+
+    def test_config_file_change_invalidates_cache(self, tmp_path):
+        """Test that editing the YAML file is picked up."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("email: first@example.com\n")
+        assert load_config(config_file=str(config_file)).email == "first@example.com"
+
+        config_file.write_text("email: second.user@example.com\n")
+        assert load_config(config_file=str(config_file)).email == "second.user@example.com"
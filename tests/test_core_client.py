@@ -1,5 +1,7 @@
 """Unit tests for COREClient."""
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -62,10 +64,10 @@ class TestCOREClient:
     def test_search_by_title(self, mock_request, client, sample_core_work):
         """Test search by title."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "totalHits": 1,
             "results": [sample_core_work],
-        }
+        }).encode()
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Test Paper", max_results=10)
@@ -73,11 +75,21 @@ class TestCOREClient:
 
         assert len(result.papers) >= 0
 
+    def test_normalize_paper_drops_raw_data_by_default(self, config, sample_core_work):
+        """Test that the full API record is only kept when configured."""
+        paper = COREClient(config=config)._normalize_paper(sample_core_work)
+        assert "raw" not in paper.extra_data
+        assert paper.extra_data["core_id"] == 123456
+
+        config.keep_raw_data = True
+        paper = COREClient(config=config)._normalize_paper(sample_core_work)
+        assert paper.extra_data["raw"] is sample_core_work
+
     @patch("paperseek.clients.core.COREClient._make_request")
     def test_search_empty_results(self, mock_request, client):
         """Test search with no results."""
         mock_response = Mock()
-        mock_response.json.return_value = {"totalHits": 0, "results": []}
+        mock_response.content = json.dumps({"totalHits": 0, "results": []}).encode()
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Nonexistent Paper", max_results=10)
@@ -89,10 +101,10 @@ class TestCOREClient:
     def test_get_by_doi(self, mock_request, client, sample_core_work):
         """Test DOI lookup."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "totalHits": 1,
             "results": [sample_core_work],
-        }
+        }).encode()
         mock_request.return_value = mock_response
 
         paper = client.get_by_doi("10.1234/test.doi")
@@ -105,3 +117,39 @@ class TestCOREClient:
     def test_close(self, client):
         """Test client closure."""
         client.close()
+
+    @patch("paperseek.clients.core.COREClient._make_request")
+    def test_batch_lookup_doi_uses_or_query(self, mock_request, client, sample_core_work):
+        """Test that DOIs are resolved with one OR query, in input order."""
+        other = dict(sample_core_work, id=2, doi="10.1234/OTHER", title="Other")
+        duplicate = dict(sample_core_work, id=3, title="Duplicate record")
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            {"results": [other, sample_core_work, duplicate]}
+        ).encode()
+        mock_request.return_value = mock_response
+
+        result = client.batch_lookup(
+            ["10.1234/test.doi", "https://doi.org/10.1234/other", "10.1234/missing"], "doi"
+        )
+
+        assert mock_request.call_count == 1
+        query = mock_request.call_args.kwargs["json_data"]["q"]
+        assert query == (
+            'doi:"10.1234/test.doi" OR doi:"10.1234/other" OR doi:"10.1234/missing"'
+        )
+        assert [p.title for p in result.papers] == ["Test Paper Title", "Other"]
+
+    @patch("paperseek.clients.core.COREClient.get_by_doi")
+    @patch("paperseek.clients.core.COREClient._search_dois")
+    def test_batch_lookup_falls_back_to_individual(
+        self, mock_search, mock_get_by_doi, client, sample_core_work
+    ):
+        """Test that a failed batch is retried one DOI at a time."""
+        mock_search.side_effect = APIError("Server error", database="core")
+        mock_get_by_doi.return_value = client._normalize_paper(sample_core_work)
+
+        result = client.batch_lookup(["10.1234/a", "10.1234/b"], "doi")
+
+        assert mock_get_by_doi.call_count == 2
+        assert len(result.papers) == 2
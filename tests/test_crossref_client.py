@@ -1,5 +1,7 @@
 """Unit tests for CrossRefClient."""
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
@@ -71,12 +73,12 @@ class TestCrossRefClient:
     def test_search_by_title(self, mock_request, client, sample_crossref_work):
         """Test search by title."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "message": {
                 "items": [sample_crossref_work],
                 "total-results": 1,
             }
-        }
+        }).encode()
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Test Paper", max_results=10)
@@ -91,12 +93,12 @@ class TestCrossRefClient:
     def test_search_by_author(self, mock_request, client, sample_crossref_work):
         """Test search by author."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "message": {
                 "items": [sample_crossref_work],
                 "total-results": 1,
             }
-        }
+        }).encode()
         mock_request.return_value = mock_response
 
         filters = SearchFilters(author="John Doe", max_results=10)
@@ -109,12 +111,12 @@ class TestCrossRefClient:
     def test_search_by_year(self, mock_request, client, sample_crossref_work):
         """Test search by year."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "message": {
                 "items": [sample_crossref_work],
                 "total-results": 1,
             }
-        }
+        }).encode()
         mock_request.return_value = mock_response
 
         filters = SearchFilters(year=2023, max_results=10)
@@ -127,12 +129,12 @@ class TestCrossRefClient:
     def test_search_by_year_range(self, mock_request, client, sample_crossref_work):
         """Test search by year range."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "message": {
                 "items": [sample_crossref_work],
                 "total-results": 1,
             }
-        }
+        }).encode()
         mock_request.return_value = mock_response
 
         filters = SearchFilters(year_start=2020, year_end=2023, max_results=10)
@@ -144,7 +146,7 @@ class TestCrossRefClient:
     def test_search_empty_results(self, mock_request, client):
         """Test search with no results."""
         mock_response = Mock()
-        mock_response.json.return_value = {"message": {"items": [], "total-results": 0}}
+        mock_response.content = json.dumps({"message": {"items": [], "total-results": 0}}).encode()
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Nonexistent Paper", max_results=10)
@@ -157,7 +159,7 @@ class TestCrossRefClient:
     def test_get_by_doi(self, mock_request, client, sample_crossref_work):
         """Test DOI lookup."""
         mock_response = Mock()
-        mock_response.json.return_value = {"message": sample_crossref_work}
+        mock_response.content = json.dumps({"message": sample_crossref_work}).encode()
         mock_request.return_value = mock_response
 
         paper = client.get_by_doi("10.1234/test.doi")
@@ -257,7 +259,7 @@ class TestCrossRefClient:
     def test_batch_lookup(self, mock_request, client, sample_crossref_work):
         """Test batch DOI lookup."""
         mock_response = Mock()
-        mock_response.json.return_value = {"message": sample_crossref_work}
+        mock_response.content = json.dumps({"message": {"items": [sample_crossref_work]}}).encode()
         mock_request.return_value = mock_response
 
         dois = ["10.1234/test.doi", "10.5678/another.doi"]
@@ -265,6 +267,33 @@ class TestCrossRefClient:
 
         assert len(result.papers) > 0
 
+    @patch("paperseek.clients.crossref.CrossRefClient._make_request")
+    def test_batch_lookup_doi_uses_filter(self, mock_request, client, sample_crossref_work):
+        """Test DOI batch lookup sends one filtered request per chunk."""
+        mock_response = Mock()
+        mock_response.content = json.dumps({"message": {"items": [sample_crossref_work]}}).encode()
+        mock_request.return_value = mock_response
+
+        dois = [f"10.1234/test{i}" for i in range(CrossRefClient.BATCH_SIZE + 1)]
+        result = client.batch_lookup(dois, "doi")
+
+        assert mock_request.call_count == 2
+        first_params = mock_request.call_args_list[0].kwargs["params"]
+        assert first_params["filter"].startswith("doi:10.1234/test0,doi:10.1234/test1,")
+        assert first_params["rows"] == CrossRefClient.BATCH_SIZE
+        assert len(result.papers) == 2
+
+    @patch("paperseek.clients.crossref.CrossRefClient.get_by_doi")
+    def test_batch_lookup_falls_back_to_individual(self, mock_get_by_doi, client):
+        """Test a failed batch request falls back to individual lookups."""
+        mock_get_by_doi.return_value = Paper(title="Found", source_database="crossref")
+
+        with patch.object(client, "_make_request", side_effect=APIError("Batch failed", "crossref")):
+            result = client.batch_lookup(["10.1234/a", "10.1234/b"], "doi")
+
+        assert mock_get_by_doi.call_count == 2
+        assert len(result.papers) == 2
+
     @patch("paperseek.clients.crossref.CrossRefClient._make_request")
     def test_api_error_handling(self, mock_request, client):
         """Test API error handling."""
@@ -293,16 +322,57 @@ class TestCrossRefClient:
         # We'll verify by checking the built params
         # This is a conceptual test - actual implementation may vary
 
+    def test_build_search_params(self, client):
+        """Test the query and filter parameters built for a search."""
+        query, params = client._build_search_params(
+            SearchFilters(title="Deep", author="Doe", year=2023, max_results=2000)
+        )
+        assert query == "title:Deep author:Doe"
+        assert params == {
+            "rows": 1000,
+            "query": "title:Deep author:Doe",
+            "filter": "from-pub-date:2023,until-pub-date:2023",
+        }
+
+        query, params = client._build_search_params(SearchFilters(year_start=2020))
+        assert query is None
+        assert params == {"rows": 100, "filter": "from-pub-date:2020"}
+
+    @patch("paperseek.clients.crossref.CrossRefClient._make_request")
+    def test_search_uses_cursor_for_large_results(
+        self, mock_request, client, sample_crossref_work
+    ):
+        """Test that results beyond one page are fetched with next-cursor."""
+        first_page = Mock()
+        first_page.content = json.dumps({
+            "message": {"items": [sample_crossref_work] * 1000, "next-cursor": "abc"}
+        }).encode()
+        last_page = Mock()
+        last_page.content = json.dumps({
+            "message": {"items": [sample_crossref_work] * 3, "next-cursor": "def"}
+        }).encode()
+        empty_page = Mock()
+        empty_page.content = json.dumps({"message": {"items": []}}).encode()
+        mock_request.side_effect = [first_page, last_page, empty_page]
+
+        filters = SearchFilters(title="Test", max_results=1500)
+        result = client.search(filters)
+
+        assert len(result.papers) == 1003
+        cursors = [call.kwargs["params"]["cursor"] for call in mock_request.call_args_list]
+        assert cursors == ["*", "abc", "def"]
+        assert all("offset" not in call.kwargs["params"] for call in mock_request.call_args_list)
+
     @patch("paperseek.clients.crossref.CrossRefClient._make_request")
     def test_pagination(self, mock_request, client, sample_crossref_work):
         """Test pagination with offset."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "message": {
                 "items": [sample_crossref_work],
                 "total-results": 100,
             }
-        }
+        }).encode()
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Test", max_results=10, offset=20)
@@ -142,6 +142,21 @@ class TestCSVExporter:
         finally:
             Path(filepath).unlink(missing_ok=True)
 
+    def test_export_missing_values_and_unknown_columns(self, tmp_path):
+        """Test that None values and unknown columns are written as empty cells."""
+        result = SearchResult()
+        result.add_paper(Paper(title="Only Title", source_database="crossref"))
+        filepath = tmp_path / "papers.csv"
+
+        CSVExporter().export(
+            result, str(filepath), columns=["title", "doi", "not_a_field"], include_metadata=False
+        )
+
+        with open(filepath, "r", encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+
+        assert rows == [["title", "doi", "not_a_field"], ["Only Title", "", ""]]
+
     def test_export_creates_directory(self, search_result):
         """Test that export creates parent directory if needed."""
         exporter = CSVExporter()
@@ -1,5 +1,7 @@
 """Unit tests for DBLPClient."""
 
+import io
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -62,7 +64,7 @@ class TestDBLPClient:
     def test_search_by_title(self, mock_request, client):
         """Test search by title."""
         mock_response = Mock()
-        mock_response.text = """<?xml version="1.0"?>
+        mock_response.raw = io.BytesIO("""<?xml version="1.0"?>
         <result>
             <hits total="1">
                 <hit>
@@ -79,7 +81,7 @@ class TestDBLPClient:
                 </hit>
             </hits>
         </result>
-        """
+        """.encode())
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Test Paper", max_results=10)
@@ -91,12 +93,12 @@ class TestDBLPClient:
     def test_search_empty_results(self, mock_request, client):
         """Test search with no results."""
         mock_response = Mock()
-        mock_response.text = """<?xml version="1.0"?>
+        mock_response.raw = io.BytesIO("""<?xml version="1.0"?>
         <result>
             <hits total="0">
             </hits>
         </result>
-        """
+        """.encode())
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Nonexistent Paper", max_results=10)
@@ -108,7 +110,7 @@ class TestDBLPClient:
     def test_search_by_author(self, mock_request, client):
         """Test search by author."""
         mock_response = Mock()
-        mock_response.text = """<?xml version="1.0"?>
+        mock_response.raw = io.BytesIO("""<?xml version="1.0"?>
         <result>
             <hits total="1">
                 <hit>
@@ -123,7 +125,7 @@ class TestDBLPClient:
                 </hit>
             </hits>
         </result>
-        """
+        """.encode())
         mock_request.return_value = mock_response
 
         filters = SearchFilters(author="John Doe", max_results=10)
@@ -141,7 +143,7 @@ class TestDBLPClient:
     def test_search_with_year_filter(self, mock_request, client):
         """Test search with year filter."""
         mock_response = Mock()
-        mock_response.text = """<?xml version="1.0"?>
+        mock_response.raw = io.BytesIO("""<?xml version="1.0"?>
         <result>
             <hits total="1">
                 <hit>
@@ -151,7 +153,7 @@ class TestDBLPClient:
                 </hit>
             </hits>
         </result>
-        """
+        """.encode())
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Test", year=2023, max_results=10)
@@ -173,7 +175,7 @@ class TestDBLPClient:
     def test_search_xml_parse_error(self, mock_request, client):
         """Test search with XML parse error raises APIError."""
         mock_response = Mock()
-        mock_response.text = "Invalid XML"
+        mock_response.raw = io.BytesIO(b"Invalid XML")
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Test", max_results=10)
@@ -185,7 +187,7 @@ class TestDBLPClient:
     def test_search_normalization_error(self, mock_request, client):
         """Test search with paper that fails normalization."""
         mock_response = Mock()
-        mock_response.text = """<?xml version="1.0"?>
+        mock_response.raw = io.BytesIO("""<?xml version="1.0"?>
         <result>
             <hits total="2">
                 <hit>
@@ -197,7 +199,7 @@ class TestDBLPClient:
                 </hit>
             </hits>
         </result>
-        """
+        """.encode())
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Test", max_results=10)
@@ -206,11 +208,28 @@ class TestDBLPClient:
         # Should skip invalid papers
         assert len(result.papers) >= 0
 
+    @patch("paperseek.clients.dblp.DBLPClient._make_request")
+    def test_search_streams_hits_in_order(self, mock_request, client):
+        """Test that every streamed hit is normalized and year-filtered."""
+        hits = "".join(
+            f"<hit><info><title>Paper {i}</title><year>{2020 + i % 2}</year></info></hit>"
+            for i in range(6)
+        )
+        mock_response = Mock()
+        mock_response.raw = io.BytesIO(f"<result><hits>{hits}</hits></result>".encode())
+        mock_request.return_value = mock_response
+
+        result = client.search(SearchFilters(title="Paper", year=2021, max_results=10))
+
+        assert [p.title for p in result.papers] == ["Paper 1", "Paper 3", "Paper 5"]
+        assert mock_request.call_args.kwargs["stream"] is True
+        mock_response.close.assert_called_once()
+
     @patch("paperseek.clients.dblp.DBLPClient._make_request")
     def test_get_by_doi(self, mock_request, client):
         """Test DOI lookup."""
         mock_response = Mock()
-        mock_response.text = """<?xml version="1.0"?>
+        mock_response.raw = io.BytesIO("""<?xml version="1.0"?>
         <result>
             <hits total="1">
                 <hit>
@@ -222,7 +241,7 @@ class TestDBLPClient:
                 </hit>
             </hits>
         </result>
-        """
+        """.encode())
         mock_request.return_value = mock_response
 
         paper = client.get_by_doi("10.1234/test.doi")
@@ -234,11 +253,11 @@ class TestDBLPClient:
     def test_get_by_doi_not_found(self, mock_request, client):
         """Test DOI lookup with no results."""
         mock_response = Mock()
-        mock_response.text = """<?xml version="1.0"?>
+        mock_response.raw = io.BytesIO("""<?xml version="1.0"?>
         <result>
             <hits total="0"></hits>
         </result>
-        """
+        """.encode())
         mock_request.return_value = mock_response
 
         paper = client.get_by_doi("10.1234/nonexistent")
@@ -258,7 +277,7 @@ class TestDBLPClient:
     def test_get_by_identifier_dblp_key(self, mock_request, client):
         """Test get by DBLP key."""
         mock_response = Mock()
-        mock_response.text = """<?xml version="1.0"?>
+        mock_response.content = """<?xml version="1.0"?>
         <dblp>
             <article>
                 <title>Test Paper</title>
@@ -277,7 +296,7 @@ class TestDBLPClient:
     def test_get_by_identifier_doi(self, mock_request, client):
         """Test get by identifier with DOI type."""
         mock_response = Mock()
-        mock_response.text = """<?xml version="1.0"?>
+        mock_response.raw = io.BytesIO("""<?xml version="1.0"?>
         <result>
             <hits total="1">
                 <hit>
@@ -286,7 +305,7 @@ class TestDBLPClient:
                 </hit>
             </hits>
         </result>
-        """
+        """.encode())
         mock_request.return_value = mock_response
 
         paper = client.get_by_identifier("10.1234/test", "doi")
@@ -315,6 +334,79 @@ class TestDBLPClient:
         with pytest.raises(NotImplementedError, match="Use _normalize_paper_from_xml"):
             client._normalize_paper({})
 
+    @patch("paperseek.clients.dblp.DBLPClient._make_request")
+    def test_search_normalizes_all_info_fields(self, mock_request, client):
+        """Test that every info field, including wrapped authors, is extracted."""
+        mock_response = Mock()
+        mock_response.raw = io.BytesIO(b"""<result><hits><hit><info>
+            <authors><author pid="1">Ada Lovelace</author><author pid="2">Alan Turing</author></authors>
+            <title>On Computable Numbers</title>
+            <venue>Proc. LMS</venue>
+            <year>1937</year>
+            <type>Journal Articles</type>
+            <key>journals/plms/Turing37</key>
+            <doi>10.1112/plms/s2-42.1.230</doi>
+            <ee>https://doi.org/10.1112/plms/s2-42.1.230</ee>
+            <ee>https://example.org/second</ee>
+            <url>https://dblp.org/rec/journals/plms/Turing37</url>
+        </info></hit></hits></result>""")
+        mock_request.return_value = mock_response
+
+        paper = client.search(SearchFilters(title="Computable", max_results=10)).papers[0]
+
+        assert [a.name for a in paper.authors] == ["Ada Lovelace", "Alan Turing"]
+        assert paper.title == "On Computable Numbers"
+        assert paper.year == 1937
+        assert paper.doi == "10.1112/plms/s2-42.1.230"
+        assert paper.source_id == "journals/plms/Turing37"
+        assert paper.extra_data["ee"] == "https://doi.org/10.1112/plms/s2-42.1.230"
+        assert paper.pdf_url is None
+        assert Paper.model_validate(paper.model_dump()) == paper
+
+    @pytest.mark.parametrize(
+        "ee, pdf_url",
+        [
+            ("https://arxiv.org/abs/2101.00001", "https://arxiv.org/abs/2101.00001"),
+            ("https://example.org/paper.pdf", "https://example.org/paper.pdf"),
+            ("https://doi.org/10.1234/x", None),
+        ],
+    )
+    @patch("paperseek.clients.dblp.DBLPClient._make_request")
+    def test_search_pdf_url_from_ee(self, mock_request, client, ee, pdf_url):
+        """Test that only arXiv or PDF electronic editions become pdf_url."""
+        mock_response = Mock()
+        mock_response.raw = io.BytesIO(f"<result><hits><hit><info><title>T</title><ee>{ee}</ee></info></hit></hits></result>".encode())
+        mock_request.return_value = mock_response
+
+        paper = client.search(SearchFilters(title="T", max_results=10)).papers[0]
+
+        assert paper.pdf_url == pdf_url
+
+    @pytest.mark.parametrize(
+        "pub_type, venue, journal, conference",
+        [
+            ("Conference and Workshop Papers", "J. Conf. Stud.", None, "J. Conf. Stud."),
+            ("Journal Articles", "ML Workshop Letters", "ML Workshop Letters", None),
+            ("Informal and Other Publications", "CoRR", "CoRR", None),
+            ("Editorship", "NeurIPS Workshop", None, "NeurIPS Workshop"),
+        ],
+    )
+    @patch("paperseek.clients.dblp.DBLPClient._make_request")
+    def test_search_classifies_venue_by_type(
+        self, mock_request, client, pub_type, venue, journal, conference
+    ):
+        """Test that DBLP type labels decide journal vs conference before the venue name."""
+        mock_response = Mock()
+        mock_response.raw = io.BytesIO(
+            f"<result><hits><hit><info><title>T</title><venue>{venue}</venue>"
+            f"<type>{pub_type}</type></info></hit></hits></result>".encode()
+        )
+        mock_request.return_value = mock_response
+
+        paper = client.search(SearchFilters(title="T", max_results=10)).papers[0]
+
+        assert (paper.journal, paper.conference) == (journal, conference)
+
     def test_get_supported_fields(self, client):
         """Test get supported fields."""
         fields = client.get_supported_fields()
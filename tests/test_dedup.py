@@ -0,0 +1,104 @@
+"""Tests for near-duplicate title detection."""
+
+import sys
+
+import pytest
+
+from paperseek.utils import dedup
+
+
+class TestUniqueTitleIndices:
+    """Tests for unique_title_indices."""
+
+    def test_requires_rapidfuzz(self, monkeypatch):
+        """Test that a helpful ImportError is raised without rapidfuzz."""
+        monkeypatch.setattr(dedup, "RAPIDFUZZ_AVAILABLE", False)
+
+        with pytest.raises(ImportError, match="paperseek\\[fuzzy\\]"):
+            dedup.unique_title_indices(["a title"])
+
+    def test_groups_near_duplicates(self):
+        """Test that near-identical titles collapse onto the first occurrence."""
+        pytest.importorskip("rapidfuzz")
+        titles = [
+            "attention is all you need",
+            "a survey of graph neural networks",
+            "attention is all you need!",
+            "attention is all we need",
+        ]
+
+        assert dedup.unique_title_indices(titles) == [0, 1]
+
+    def test_works_without_numpy(self, monkeypatch):
+        """Test that grouping does not need numpy (the fuzzy extra only installs rapidfuzz)."""
+        pytest.importorskip("rapidfuzz")
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        titles = ["attention is all you need", "attention is all you need!", "graph networks"]
+
+        assert dedup.unique_title_indices(titles) == [0, 2]
+
+    def test_distinct_titles_are_kept(self):
+        """Test that dissimilar titles are all kept."""
+        pytest.importorskip("rapidfuzz")
+        titles = ["deep residual learning", "protein structure prediction", "climate models"]
+
+        assert dedup.unique_title_indices(titles) == [0, 1, 2]
+
+    def test_empty_input(self):
+        """Test that no titles yields no indices."""
+        pytest.importorskip("rapidfuzz")
+
+        assert dedup.unique_title_indices([]) == []
+
+
+@pytest.fixture(params=[True, False], ids=["rapidfuzz", "python"])
+def backend(request, monkeypatch):
+    """Run each test with and without rapidfuzz."""
+    if request.param and not dedup.RAPIDFUZZ_AVAILABLE:
+        pytest.skip("rapidfuzz not installed")
+    monkeypatch.setattr(dedup, "RAPIDFUZZ_AVAILABLE", request.param)
+    return request.param
+
+
+def levenshtein(a, b):
+    """Reference (unbounded) Levenshtein distance."""
+    previous = list(range(len(b) + 1))
+    for i, char in enumerate(a, 1):
+        current = [i]
+        for j, other in enumerate(b, 1):
+            current.append(min(previous[j - 1] + (char != other), previous[j] + 1, current[-1] + 1))
+        previous = current
+    return previous[-1]
+
+
+class TestWithinK:
+    """Tests for within_k."""
+
+    @pytest.mark.parametrize(
+        "a, b, k, expected",
+        [
+            ("", "", 0, True),
+            ("colour", "color", 1, True),
+            ("colour", "color", 0, False),
+            ("kitten", "sitting", 3, True),
+            ("kitten", "sitting", 2, False),
+            ("abc", "abcdefg", 3, False),
+            ("deep learning", "deep learning", 0, True),
+        ],
+    )
+    def test_known_distances(self, backend, a, b, k, expected):
+        """Test against distances worked out by hand."""
+        assert dedup.within_k(a, b, k) is expected
+        assert dedup.within_k(b, a, k) is expected
+
+    def test_matches_full_levenshtein(self, backend):
+        """Test agreement with an unbounded reference on random strings."""
+        import random
+
+        rng = random.Random(0)
+        for _ in range(300):
+            a = "".join(rng.choice("abc") for _ in range(rng.randint(0, 10)))
+            b = "".join(rng.choice("abc") for _ in range(rng.randint(0, 10)))
+            k = rng.randint(0, 4)
+
+            assert dedup.within_k(a, b, k) is (levenshtein(a, b) <= k)
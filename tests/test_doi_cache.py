@@ -0,0 +1,110 @@
+"""Tests for the persistent DOI cache."""
+
+import pytest
+import time
+from unittest.mock import patch
+
+from paperseek.utils.doi_cache import DOICache
+from paperseek.core.models import Paper, Author
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a DOI cache in a temporary directory."""
+    cache = DOICache(str(tmp_path / "doi_cache.sqlite"))
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def sample_paper():
+    """Create a sample paper for caching."""
+    return Paper(
+        title="Cached Paper",
+        authors=[Author(name="Jane Doe", orcid="0000-0001-2345-6789")],
+        doi="10.1234/Cached",
+        year=2023,
+        source_database="crossref",
+    )
+
+
+class TestDOICache:
+    """Tests for DOICache."""
+
+    def test_miss_returns_none(self, cache):
+        """Test that unknown DOIs are cache misses."""
+        assert cache.get("crossref", "10.1234/unknown") is None
+
+    def test_set_and_get_roundtrip(self, cache, sample_paper):
+        """Test that cached papers are restored with all fields."""
+        cache.set("crossref", sample_paper.doi, sample_paper)
+
+        cached = cache.get("crossref", sample_paper.doi)
+
+        assert cached == sample_paper
+        assert cached.authors[0].orcid == "0000-0001-2345-6789"
+
+    def test_keys_are_normalized(self, cache, sample_paper):
+        """Test that DOI prefixes and case do not affect lookups."""
+        cache.set("crossref", "https://doi.org/10.1234/CACHED", sample_paper)
+
+        assert cache.get("crossref", "doi:10.1234/cached") is not None
+
+    def test_keys_are_scoped_by_source(self, cache, sample_paper):
+        """Test that entries from one database do not leak into another."""
+        cache.set("crossref", sample_paper.doi, sample_paper)
+
+        assert cache.get("openalex", sample_paper.doi) is None
+
+    def test_get_many(self, cache, sample_paper):
+        """Test bulk lookup returns hits keyed by normalized DOI."""
+        other = sample_paper.model_copy(update={"doi": "10.1234/other", "title": "Other"})
+        cache.set_many("crossref", [(sample_paper.doi, sample_paper), (other.doi, other)])
+
+        hits = cache.get_many("crossref", ["10.1234/cached", "10.1234/other", "10.1234/missing"])
+
+        assert set(hits) == {"10.1234/cached", "10.1234/other"}
+        assert hits["10.1234/other"].title == "Other"
+
+    def test_expired_entries_are_misses(self, tmp_path, sample_paper):
+        """Test that entries older than the TTL are ignored and purged."""
+        with DOICache(str(tmp_path / "cache.sqlite"), ttl_days=1) as cache:
+            with patch("paperseek.utils.doi_cache.time.time", return_value=time.time() - 2 * 86400):
+                cache.set("crossref", sample_paper.doi, sample_paper)
+
+            assert cache.get("crossref", sample_paper.doi) is None
+            assert cache.get_many("crossref", [sample_paper.doi]) == {}
+            assert cache.purge_expired() == 1
+            assert len(cache) == 0
+
+    def test_source_ttl_overrides(self, tmp_path, sample_paper):
+        """Test that per-source TTLs override the default TTL."""
+        path = str(tmp_path / "cache.sqlite")
+        with DOICache(path, ttl_days=30, source_ttl_days={"crossref": 7}) as cache:
+            with patch(
+                "paperseek.utils.doi_cache.time.time", return_value=time.time() - 10 * 86400
+            ):
+                cache.set("crossref", sample_paper.doi, sample_paper)
+                cache.set("arxiv", sample_paper.doi, sample_paper)
+
+            assert cache.get("crossref", sample_paper.doi) is None
+            assert cache.get("arxiv", sample_paper.doi) is not None
+            assert cache.get_many("arxiv", [sample_paper.doi]) != {}
+            assert cache.purge_expired() == 1
+            assert len(cache) == 1
+
+    def test_persists_across_instances(self, tmp_path, sample_paper):
+        """Test that cached entries survive reopening the cache file."""
+        path = str(tmp_path / "cache.sqlite")
+        with DOICache(path) as cache:
+            cache.set("crossref", sample_paper.doi, sample_paper)
+
+        with DOICache(path) as cache:
+            assert cache.get("crossref", sample_paper.doi) is not None
+
+    def test_clear(self, cache, sample_paper):
+        """Test clearing the cache."""
+        cache.set("crossref", sample_paper.doi, sample_paper)
+        cache.clear()
+
+        assert len(cache) == 0
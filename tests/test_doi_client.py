@@ -1,5 +1,7 @@
 """Unit tests for DOIClient."""
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -65,7 +67,7 @@ class TestDOIClient:
     def test_get_by_doi(self, mock_request, client, sample_doi_response):
         """Test DOI lookup."""
         mock_response = Mock()
-        mock_response.json.return_value = sample_doi_response
+        mock_response.content = json.dumps(sample_doi_response).encode()
         mock_request.return_value = mock_response
 
         paper = client.get_by_doi("10.1234/test.doi")
@@ -74,6 +76,35 @@ class TestDOIClient:
             assert paper.doi == "10.1234/test.doi"
             assert paper.title == "Test Paper Title"
 
+    @patch("paperseek.clients.doi.DOIClient._make_request")
+    def test_get_by_doi_is_cached(self, mock_request, client, sample_doi_response):
+        """Test repeated lookups of the same DOI are served from memory."""
+        mock_response = Mock()
+        mock_response.content = json.dumps(sample_doi_response).encode()
+        mock_request.return_value = mock_response
+
+        first = client.get_by_doi("10.1234/test.doi")
+        second = client.get_by_doi("10.1234/TEST.DOI")
+
+        assert mock_request.call_count == 1
+        assert first == second
+        assert first is not second
+
+    @patch("paperseek.clients.doi.DOIClient._make_request")
+    def test_get_by_doi_cache_evicts_least_recent(self, mock_request, client, sample_doi_response):
+        """Test the cache is bounded by CACHE_SIZE."""
+        mock_response = Mock()
+        mock_response.content = json.dumps(sample_doi_response).encode()
+        mock_request.return_value = mock_response
+        client.CACHE_SIZE = 2
+
+        for doi in ["10.1/a", "10.1/b", "10.1/a", "10.1/c", "10.1/a"]:
+            client.get_by_doi(doi)
+
+        # "b" was evicted when "c" arrived; "a" stayed because it was reused
+        assert mock_request.call_count == 3
+        assert list(client._cache) == ["10.1/c", "10.1/a"]
+
     @patch("paperseek.clients.doi.DOIClient._make_request")
     def test_get_by_doi_not_found(self, mock_request, client):
         """Test DOI lookup with non-existent DOI."""
@@ -87,7 +118,7 @@ class TestDOIClient:
     def test_search_by_doi(self, mock_request, client, sample_doi_response):
         """Test search with DOI filter."""
         mock_response = Mock()
-        mock_response.json.return_value = sample_doi_response
+        mock_response.content = json.dumps(sample_doi_response).encode()
         mock_request.return_value = mock_response
 
         filters = SearchFilters(doi="10.1234/test.doi")
@@ -96,6 +127,20 @@ class TestDOIClient:
         if len(result.papers) > 0:
             assert result.papers[0].doi == "10.1234/test.doi"
 
+    @patch("paperseek.clients.doi.DOIClient.get_by_doi")
+    def test_batch_lookup_keeps_input_order(self, mock_get_by_doi, client):
+        """Test that concurrent lookups are returned in identifier order."""
+        mock_get_by_doi.side_effect = lambda doi: (
+            None if doi.endswith("missing") else Paper(title=doi, source_database="doi")
+        )
+        dois = [f"10.1234/{i}" for i in range(20)] + ["10.1234/missing"]
+
+        result = client.batch_lookup(dois, "doi")
+
+        assert mock_get_by_doi.call_count == 21
+        assert [p.title for p in result.papers] == dois[:20]
+        assert result.total_results == 20
+
     def test_search_without_doi(self, client):
         """Test search without DOI filter returns empty result."""
         filters = SearchFilters(title="Some Title")
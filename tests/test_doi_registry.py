@@ -0,0 +1,89 @@
+"""Tests for DOI prefix routing."""
+
+import pytest
+
+from paperseek.core.doi_registry import DOIRegistry
+
+ALL_DATABASES = [
+    "crossref",
+    "openalex",
+    "semantic_scholar",
+    "doi",
+    "pubmed",
+    "arxiv",
+    "core",
+    "unpaywall",
+    "dblp",
+]
+
+
+class TestDOIRegistry:
+    """Tests for DOIRegistry."""
+
+    @pytest.fixture
+    def registry(self):
+        """Create a fresh registry."""
+        return DOIRegistry()
+
+    @pytest.mark.parametrize(
+        "doi,expected",
+        [
+            ("10.48550/arXiv.1706.03762", "10.48550"),
+            ("https://doi.org/10.1038/nature14539", "10.1038"),
+            ("doi:10.1145/3290605.3300233", "10.1145"),
+            ("not-a-doi", None),
+            ("", None),
+        ],
+    )
+    def test_get_prefix(self, doi, expected):
+        """Test prefix extraction."""
+        assert DOIRegistry.get_prefix(doi) == expected
+
+    def test_route_known_prefix_skips_databases(self, registry):
+        """Test that arXiv DOIs are not sent to CrossRef, Unpaywall or PubMed."""
+        routed = registry.route("10.48550/arXiv.1706.03762", ALL_DATABASES)
+
+        assert "arxiv" in routed
+        assert "crossref" not in routed
+        assert "unpaywall" not in routed
+        assert "pubmed" not in routed
+
+    def test_route_unknown_prefix_keeps_all(self, registry):
+        """Test that unknown prefixes fall through to every database."""
+        assert registry.route("10.1038/nature14539", ALL_DATABASES) == ALL_DATABASES
+
+    def test_route_malformed_doi_keeps_all(self, registry):
+        """Test that malformed DOIs are not filtered."""
+        assert registry.route("garbage", ["crossref", "arxiv"]) == ["crossref", "arxiv"]
+
+    def test_record_prioritizes_successful_database(self, registry):
+        """Test that databases which resolved a prefix are tried first."""
+        registry.record("10.1038/nature14539", "openalex")
+
+        routed = registry.route("10.1038/other", ["crossref", "openalex", "pubmed"])
+
+        assert routed == ["openalex", "crossref", "pubmed"]
+
+    def test_record_keeps_explicit_order(self, registry):
+        """Test that learned databases don't reorder when asked to keep the order."""
+        registry.record("10.1038/nature14539", "openalex")
+
+        routed = registry.route(
+            "10.1038/other", ["crossref", "openalex", "pubmed"], prefer_learned=False
+        )
+
+        assert routed == ["crossref", "openalex", "pubmed"]
+
+    def test_record_does_not_reorder_known_prefixes(self, registry):
+        """Test that known prefixes keep the caller's database order."""
+        registry.record("10.48550/arXiv.1706.03762", "openalex")
+
+        routed = registry.route("10.48550/arXiv.1512.03385", ["arxiv", "openalex"])
+
+        assert routed == ["arxiv", "openalex"]
+
+    def test_record_does_not_override_known_exclusions(self, registry):
+        """Test that learned databases are still subject to prefix restrictions."""
+        registry.record("10.48550/arXiv.1706.03762", "crossref")
+
+        assert "crossref" not in registry.route("10.48550/arXiv.1512.03385", ALL_DATABASES)
@@ -5,7 +5,7 @@ import json
 import tempfile
 from pathlib import Path
 
-from paperseek.exporters.json_exporter import JSONExporter
+from paperseek.exporters.json_exporter import JSONExporter, StreamingJSONLExporter
 from paperseek.core.models import Paper, Author, SearchResult
 
 
@@ -91,6 +91,19 @@ class TestJSONExporter:
         finally:
             Path(filepath).unlink(missing_ok=True)
 
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_streamed_export_matches_single_dump(self, search_result, pretty, tmp_path):
+        """Test that writing papers one at a time produces the same document."""
+        from paperseek.utils import serialization
+
+        exporter = JSONExporter()
+        filepath = tmp_path / "results.json"
+
+        exporter.export(search_result, str(filepath), pretty=pretty)
+
+        expected = serialization.dumps(exporter._results_to_dict(search_result), pretty=pretty)
+        assert filepath.read_bytes() == expected
+
     def test_export_empty_result(self):
         """Test exporting empty search result."""
         exporter = JSONExporter()
@@ -328,3 +341,45 @@ class TestJSONExporter:
         # Try to export to invalid path
         with pytest.raises(ExportError):
             exporter.export_jsonl(search_result, "/invalid/path/that/does/not/exist/file.jsonl")
+
+    @pytest.mark.parametrize("include_raw", [True, False])
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_paper_to_json_matches_paper_to_dict(self, include_raw, pretty):
+        """Test that direct model serialization matches the dictionary path."""
+        from paperseek.utils import serialization
+
+        exporter = JSONExporter()
+        paper = Paper(
+            title="Schrödinger \"Cat\"",
+            authors=[Author(name="Jane Smith", orcid="0000-0001")],
+            keywords=["physics"],
+            year=2023,
+            is_open_access=True,
+            source_database="crossref",
+            extra_data={"raw": {"id": [1, 2]}, "type": "journal-article"},
+        )
+
+        expected = serialization.dumps(
+            exporter._paper_to_dict(paper, include_raw=include_raw), pretty=pretty
+        )
+        assert exporter._paper_to_json(paper, include_raw=include_raw, pretty=pretty) == expected
+
+class TestStreamingJSONLExporter:
+    """Test suite for StreamingJSONLExporter."""
+
+    def test_writes_one_utf8_line_per_paper(self, tmp_path):
+        """Test that papers are written as UTF-8 JSON lines."""
+        filepath = tmp_path / "papers.jsonl"
+        papers = [
+            Paper(title="Schrödinger Paper", source_database="crossref"),
+            Paper(title="Second Paper", doi="10.1234/b", source_database="openalex"),
+        ]
+
+        with StreamingJSONLExporter(str(filepath)) as exporter:
+            exporter.write_papers(paper for paper in papers)
+
+        lines = filepath.read_bytes().splitlines()
+        assert exporter.count == 2
+        assert "Schrödinger".encode("utf-8") in lines[0]
+        assert [json.loads(line)["title"] for line in lines] == [p.title for p in papers]
+
@@ -118,6 +118,20 @@ class TestPaper:
         assert "year" in available
         assert "pdf_url" not in available  # This is None
 
+    def test_paper_get_available_fields_reflects_updates(self):
+        """Test get_available_fields skips empty collections and sees later edits."""
+        paper = Paper(title="Test", source_database="test", keywords=[])
+
+        assert "keywords" not in paper.get_available_fields()
+        assert "source_database" not in paper.get_available_fields()
+
+        paper.keywords = ["ml"]
+        paper.pdf_url = "https://example.com/paper.pdf"
+
+        available = paper.get_available_fields()
+        assert "keywords" in available
+        assert "pdf_url" in available
+
 
 class TestSearchFilters:
     """Test suite for SearchFilters model."""
@@ -254,6 +268,26 @@ class TestSearchResult:
         assert stats["abstract"].available_count == 2
         assert stats["abstract"].total_count == 3
 
+    def test_papers_with_pdf(self):
+        """Test selecting papers with PDF URLs."""
+        open_pdf = Paper(
+            title="Open", source_database="test", pdf_url="https://a.pdf", is_open_access=True
+        )
+        closed_pdf = Paper(title="Closed", source_database="test", pdf_url="https://b.pdf")
+        no_pdf = Paper(title="None", source_database="test", is_open_access=True)
+        result = SearchResult(papers=[open_pdf, closed_pdf, no_pdf])
+
+        assert result.papers_with_pdf() == [open_pdf, closed_pdf]
+        assert result.papers_with_pdf(only_open_access=True) == [open_pdf]
+
+    def test_counts_by(self, sample_papers):
+        """Test counting papers by field value."""
+        result = SearchResult(papers=sample_papers)
+
+        assert result.counts_by("year") == {2023: 2, "Unknown": 1}
+        assert result.counts_by("source_database") == {"crossref": 3}
+        assert result.counts_by("year", missing=None) == {2023: 2, None: 1}
+
     def test_filter_by_required_fields(self, sample_papers):
         """Test filter_by_required_fields method."""
         result = SearchResult(papers=sample_papers)
@@ -52,6 +52,11 @@ class TestTextNormalizer:
         result = TextNormalizer.clean_text("   \n\t   ")
         assert result is None
 
+    def test_clean_text_unicode_whitespace(self):
+        """Test that non-ASCII whitespace (e.g. no-break space) is collapsed too."""
+        result = TextNormalizer.clean_text("\u00a0Hello\u2009\u00a0World\u3000")
+        assert result == "Hello World"
+
     def test_truncate_text_basic(self):
         """Test basic text truncation."""
         text = "a" * 100
@@ -79,6 +84,30 @@ class TestTextNormalizer:
         assert len(result) == 53
         assert not result.startswith(" ")
 
+    def test_normalize_title(self):
+        """Test title normalization for duplicate detection."""
+        assert TextNormalizer.normalize_title("Attention Is All You Need.") == (
+            "attention is all you need"
+        )
+        assert TextNormalizer.normalize_title("  Naïve  Bayes—Revisited ") == (
+            "naive bayes revisited"
+        )
+
+    def test_normalize_title_empty(self):
+        """Test normalizing empty titles."""
+        assert TextNormalizer.normalize_title(None) == ""
+        assert TextNormalizer.normalize_title("...") == ""
+
+    def test_normalize_title_is_memoized(self):
+        """Test that repeated titles are served from the cache."""
+        TextNormalizer.normalize_title.cache_clear()
+
+        TextNormalizer.normalize_title("Deep Learning")
+        TextNormalizer.normalize_title("Deep Learning")
+
+        info = TextNormalizer.normalize_title.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
 
 class TestDateNormalizer:
     """Tests for DateNormalizer."""
@@ -91,6 +120,13 @@ class TestDateNormalizer:
         """Test extracting year from string year."""
         assert DateNormalizer.extract_year("2023") == 2023
 
+    def test_extract_year_string_year_range(self):
+        """Test that bare string years outside 1900-2099 are rejected."""
+        assert DateNormalizer.extract_year("1900") == 1900
+        assert DateNormalizer.extract_year("2099") == 2099
+        assert DateNormalizer.extract_year("1850") is None
+        assert DateNormalizer.extract_year("2100") is None
+
     def test_extract_year_from_iso_date(self):
         """Test extracting year from ISO date string."""
         assert DateNormalizer.extract_year("2023-05-15") == 2023
@@ -218,6 +254,8 @@ class TestAuthorNormalizer:
         assert author.name == "John Doe"
         assert author.affiliation == "MIT"
         assert author.orcid == "0000-0001-2345-6789"
+        # Constructed without validation, but must still pass it
+        assert Author.model_validate(author.model_dump()) == author
 
     def test_create_author_minimal(self):
         """Test creating author with minimal fields."""
@@ -253,6 +291,11 @@ class TestIdentifierNormalizer:
         result = IdentifierNormalizer.clean_doi("10.1234/test")
         assert result == "10.1234/test"
 
+    def test_clean_doi_trailing_whitespace(self):
+        """Test that surrounding whitespace is removed from bare DOIs."""
+        assert IdentifierNormalizer.clean_doi("10.1234/test \n") == "10.1234/test"
+        assert IdentifierNormalizer.clean_doi("  10.1234/test") == "10.1234/test"
+
     def test_clean_doi_with_prefix(self):
         """Test cleaning DOI with doi: prefix."""
         result = IdentifierNormalizer.clean_doi("doi:10.1234/test")
@@ -286,6 +329,22 @@ class TestIdentifierNormalizer:
         """Test cleaning empty DOI."""
         assert IdentifierNormalizer.clean_doi("") is None
 
+    def test_clean_doi_only_strips_prefix(self):
+        """Test that URL text inside the DOI itself is kept."""
+        result = IdentifierNormalizer.clean_doi("HTTPS://DOI.ORG/10.1234/https://doi.org/x")
+        assert result == "10.1234/https://doi.org/x"
+
+    def test_clean_orcid(self):
+        """Test removing the ORCID URL prefix."""
+        assert IdentifierNormalizer.clean_orcid("https://orcid.org/0000-0001-2345-6789") == (
+            "0000-0001-2345-6789"
+        )
+        assert IdentifierNormalizer.clean_orcid("http://orcid.org/0000-0001-2345-6789") == (
+            "0000-0001-2345-6789"
+        )
+        assert IdentifierNormalizer.clean_orcid("0000-0001-2345-6789") == "0000-0001-2345-6789"
+        assert IdentifierNormalizer.clean_orcid(None) is None
+
     def test_extract_arxiv_id_basic(self):
         """Test extracting basic arXiv ID."""
         result = IdentifierNormalizer.extract_arxiv_id("2301.12345")
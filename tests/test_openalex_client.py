@@ -1,12 +1,17 @@
 """Unit tests for OpenAlexClient."""
 
+import io
+import json
+
 import pytest
 from unittest.mock import Mock, patch
+from urllib3.exceptions import ProtocolError
 
 from paperseek.clients.openalex import OpenAlexClient
 from paperseek.core.models import SearchFilters, Paper, Author
 from paperseek.core.config import DatabaseConfig
 from paperseek.core.exceptions import APIError
+from paperseek.utils import serialization
 
 
 class TestOpenAlexClient:
@@ -98,10 +103,13 @@ class TestOpenAlexClient:
     def test_search_by_title(self, mock_request, client, sample_openalex_work):
         """Test search by title."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "results": [sample_openalex_work],
-            "meta": {"count": 1},
-        }
+        mock_response.content = json.dumps(
+            {
+                "results": [sample_openalex_work],
+                "meta": {"count": 1},
+            }
+        ).encode()
+        mock_response.headers = {}
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Test Paper", max_results=10)
@@ -113,7 +121,8 @@ class TestOpenAlexClient:
     def test_search_empty_results(self, mock_request, client):
         """Test search with no results."""
         mock_response = Mock()
-        mock_response.json.return_value = {"results": [], "meta": {"count": 0}}
+        mock_response.content = json.dumps({"results": [], "meta": {"count": 0}}).encode()
+        mock_response.headers = {}
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Nonexistent Paper", max_results=10)
@@ -121,6 +130,123 @@ class TestOpenAlexClient:
 
         assert len(result.papers) == 0
 
+    @patch("paperseek.clients.openalex.OpenAlexClient._make_request")
+    def test_search_query_info_is_json_serializable(self, mock_request, client):
+        """Test that query_info records the filters as plain, exportable data."""
+        mock_response = Mock()
+        mock_response.content = json.dumps({"results": []}).encode()
+        mock_response.headers = {}
+        mock_request.return_value = mock_response
+        filters = SearchFilters(title="Test Paper")
+
+        result = client.search(filters)
+
+        assert result.query_info["filters"] == filters.model_dump()
+        assert json.loads(json.dumps(result.query_info))["filters"]["title"] == "Test Paper"
+
+    @patch("paperseek.clients.openalex.OpenAlexClient._make_request")
+    def test_search_records_current_filters(self, mock_request, client):
+        """Test that each result records its own dump of the filters as searched."""
+        mock_response = Mock()
+        mock_response.content = json.dumps({"results": []}).encode()
+        mock_response.headers = {}
+        mock_request.return_value = mock_response
+        filters = SearchFilters(title="Test Paper", keywords=["graphs"])
+
+        first = client.search(filters)
+        filters.keywords.append("networks")
+        second = client.search(filters)
+
+        assert first.query_info["filters"]["keywords"] == ["graphs"]
+        assert second.query_info["filters"]["keywords"] == ["graphs", "networks"]
+
+    @patch("paperseek.clients.openalex.OpenAlexClient._make_request")
+    def test_search_streams_large_pages(
+        self, mock_request, client, sample_openalex_work, monkeypatch
+    ):
+        """Test that pages above the threshold are decoded from the connection."""
+        body = json.dumps({"results": [sample_openalex_work] * 3}).encode()
+        streamed = []
+
+        def fake_iter_items(source, prefix):
+            streamed.append(prefix)
+            return iter(json.load(source)["results"])
+
+        monkeypatch.setattr(serialization, "IJSON_AVAILABLE", True)
+        monkeypatch.setattr(serialization, "iter_items", fake_iter_items)
+        monkeypatch.setattr(client, "STREAM_THRESHOLD_BYTES", len(body) - 1)
+        mock_response = Mock()
+        mock_response.headers = {"Content-Length": str(len(body))}
+        mock_response.raw = io.BytesIO(body)
+        mock_request.return_value = mock_response
+
+        result = client.search(SearchFilters(title="Test Paper"))
+
+        assert mock_request.call_args.kwargs["stream"] is True
+        assert streamed == ["results.item"]
+        assert len(result.papers) == 3
+        mock_response.close.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "error",
+        [ProtocolError("Connection broken"), ValueError("Incomplete JSON content")],
+    )
+    @patch("paperseek.clients.openalex.OpenAlexClient._make_request")
+    def test_search_stream_failure_raises_api_error(
+        self, mock_request, client, sample_openalex_work, monkeypatch, error
+    ):
+        """Test that a stream failing partway through is reported as an APIError."""
+
+        def failing_iter_items(source, prefix):
+            yield sample_openalex_work
+            raise error
+
+        monkeypatch.setattr(serialization, "IJSON_AVAILABLE", True)
+        monkeypatch.setattr(serialization, "iter_items", failing_iter_items)
+        monkeypatch.setattr(client, "STREAM_THRESHOLD_BYTES", 0)
+        mock_response = Mock()
+        mock_response.headers = {"Content-Length": "1000"}
+        mock_request.return_value = mock_response
+
+        with pytest.raises(APIError):
+            client.search(SearchFilters(title="Test Paper"))
+
+        mock_response.close.assert_called_once()
+
+    @patch("paperseek.clients.openalex.OpenAlexClient._make_request")
+    def test_batch_lookup_doi_uses_or_filter(self, mock_request, client, sample_openalex_work):
+        """Test DOI batch lookup sends one filtered request per chunk."""
+        mock_response = Mock()
+        mock_response.content = json.dumps({"results": [sample_openalex_work]}).encode()
+        mock_request.return_value = mock_response
+
+        dois = [f"10.1234/test{i}" for i in range(OpenAlexClient.BATCH_SIZE + 1)]
+        result = client.batch_lookup(dois, "doi")
+
+        # Chunks are fetched concurrently, so calls may arrive in any order
+        assert mock_request.call_count == 2
+        calls = sorted(
+            (call.kwargs["params"] for call in mock_request.call_args_list),
+            key=lambda params: -params["per-page"],
+        )
+        assert calls[0]["filter"].startswith("doi:10.1234/test0|10.1234/test1|")
+        assert calls[0]["per-page"] == OpenAlexClient.BATCH_SIZE
+        assert calls[1]["filter"] == f"doi:10.1234/test{OpenAlexClient.BATCH_SIZE}"
+        assert len(result.papers) == 2
+
+    @patch("paperseek.clients.openalex.OpenAlexClient.get_by_doi")
+    def test_batch_lookup_falls_back_to_individual(self, mock_get_by_doi, client):
+        """Test a failed batch request falls back to individual lookups."""
+        mock_get_by_doi.return_value = Paper(title="Found", source_database="openalex")
+
+        with patch.object(
+            client, "_make_request", side_effect=APIError("Batch failed", "openalex")
+        ):
+            result = client.batch_lookup(["10.1234/a", "10.1234/b"], "doi")
+
+        assert mock_get_by_doi.call_count == 2
+        assert len(result.papers) == 2
+
     def test_normalize_paper(self, client, sample_openalex_work):
         """Test paper normalization."""
         paper = client._normalize_paper(sample_openalex_work)
@@ -132,6 +258,38 @@ class TestOpenAlexClient:
         assert paper.year == 2023
         assert paper.source_database == "openalex"
 
+    def test_normalize_paper_drops_bulky_raw_fields(self, config, sample_openalex_work):
+        """Test that the inverted index and raw record are not retained by default."""
+        sample_openalex_work["abstract_inverted_index"] = {"Deep": [0], "learning": [1]}
+        sample_openalex_work["referenced_works"] = ["https://openalex.org/W1"] * 300
+
+        paper = OpenAlexClient(config=config)._normalize_paper(sample_openalex_work)
+        assert paper.abstract == "Deep learning"
+        assert paper.reference_count == 300
+        assert "raw" not in paper.extra_data
+        assert "abstract_inverted_index" not in paper.model_dump_json()
+
+        config.keep_raw_data = True
+        paper = OpenAlexClient(config=config)._normalize_paper(sample_openalex_work)
+        assert paper.extra_data["raw"] is sample_openalex_work
+
+    def test_normalize_paper_null_sections(self, client):
+        """Test that null nested sections are treated as missing."""
+        work = {
+            "id": "https://openalex.org/W123",
+            "title": "Sparse Paper",
+            "authorships": [{"author": None, "institutions": None}],
+            "primary_location": None,
+            "open_access": None,
+        }
+
+        paper = client._normalize_paper(work)
+
+        assert paper.venue is None
+        assert paper.pdf_url is None
+        assert paper.is_open_access is False
+        assert paper.authors[0].name == "Unknown"
+
     def test_normalize_paper_minimal(self, client):
         """Test normalization with minimal data."""
         minimal_work = {
@@ -158,6 +316,23 @@ class TestOpenAlexClient:
             abstract = client._reconstruct_abstract(inverted_index)
             assert "This is a test" in abstract
 
+    def test_reconstruct_abstract_orders_repeated_and_sparse_words(self, client):
+        """Test reconstruction of repeated words, gaps and sparse positions."""
+        inverted_index = {"the": [0, 3], "cat": [1], "saw": [2], "dog": [5]}
+        assert client._reconstruct_abstract(inverted_index) == "the cat saw the dog"
+
+        sparse = {"far": [1000], "near": [0]}
+        assert client._reconstruct_abstract(sparse) == "near far"
+        assert client._reconstruct_abstract({}) == ""
+
+    def test_reconstruct_abstract_keeps_shared_and_negative_positions(self, client):
+        """Test that shared or negative positions keep every word, as sorting does."""
+        shared = {"deep": [0], "learning": [1], "models": [1], "work": [2]}
+        assert client._reconstruct_abstract(shared) == "deep learning models work"
+
+        negative = {"intro": [-1], "deep": [0], "learning": [1]}
+        assert client._reconstruct_abstract(negative) == "intro deep learning"
+
     def test_close(self, client):
         """Test client closure."""
         client.close()
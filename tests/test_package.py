@@ -0,0 +1,32 @@
+"""Tests for the top-level paperseek package."""
+
+import subprocess
+import sys
+
+import paperseek
+
+
+class TestPackage:
+    """Tests for lazy top-level imports."""
+
+    def test_import_does_not_load_clients(self):
+        """Test that importing paperseek does not import any backend."""
+        code = (
+            "import sys, paperseek; "
+            "print(sorted(m for m in sys.modules if m.startswith('paperseek.')))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert "paperseek.clients" not in output
+        assert "paperseek.utils.pdf_downloader" not in output
+
+    def test_public_names_resolve(self):
+        """Test that every name in __all__ can be imported."""
+        for name in paperseek.__all__:
+            assert getattr(paperseek, name).__name__ == name
+
+    def test_unknown_attribute(self):
+        """Test that unknown names raise AttributeError."""
+        assert not hasattr(paperseek, "NotAClient")
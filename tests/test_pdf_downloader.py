@@ -5,6 +5,8 @@ import time
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock, mock_open
 import tempfile
+import requests
+from concurrent.futures import ThreadPoolExecutor
 import shutil
 
 from paperseek.utils.pdf_downloader import PDFDownloader
@@ -144,6 +146,19 @@ class TestPDFDownloaderSession:
             downloader.close()
             mock_close.assert_called_once()
 
+    def test_shared_session_is_reused(self, temp_dir):
+        """Test that a caller-provided session is used and left open."""
+        shared = requests.Session()
+        downloader = PDFDownloader(download_dir=temp_dir, session=shared)
+
+        assert downloader.session is shared
+        assert "pdf" not in shared.headers.get("Accept", "")
+
+        with patch.object(shared, 'close') as mock_close:
+            downloader.close()
+            mock_close.assert_not_called()
+        shared.close()
+
 
 class TestFilenameGeneration:
     """Test filename generation."""
@@ -408,6 +423,51 @@ class TestDownloadPaper:
         assert filepath is None
         assert downloader.stats["failed"] == 1
 
+    @patch('paperseek.utils.pdf_downloader.requests.Session')
+    def test_download_paper_too_large_on_get(self, mock_session_class, temp_dir, sample_paper):
+        """Test rejection before reading the body when only GET declares the size."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+
+        mock_head = Mock()
+        mock_head.status_code = 200
+        mock_head.headers = {"Content-Type": "application/pdf"}
+        mock_get = Mock()
+        mock_get.headers = {"Content-Length": str(100 * 1024 * 1024)}
+        mock_get.iter_content = Mock()
+        mock_session.head.return_value = mock_head
+        mock_session.get.return_value = mock_get
+
+        downloader = PDFDownloader(download_dir=temp_dir, max_file_size_mb=50)
+
+        with patch.object(downloader, '_wait_for_rate_limit'):
+            filepath = downloader.download_paper(sample_paper)
+
+        assert filepath is None
+        mock_get.iter_content.assert_not_called()
+        mock_get.close.assert_called_once()
+        assert downloader.stats["failed"] == 1
+
+    @patch('paperseek.utils.pdf_downloader.requests.Session')
+    def test_download_paper_head_not_found(self, mock_session_class, temp_dir, sample_paper):
+        """Test a 404 on HEAD skips the GET request."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+
+        mock_head = Mock()
+        mock_head.status_code = 404
+        mock_head.headers = {}
+        mock_session.head.return_value = mock_head
+
+        downloader = PDFDownloader(download_dir=temp_dir)
+
+        with patch.object(downloader, '_wait_for_rate_limit'):
+            filepath = downloader.download_paper(sample_paper)
+
+        assert filepath is None
+        mock_session.get.assert_not_called()
+        assert downloader.stats["failed"] == 1
+
     @patch('paperseek.utils.pdf_downloader.requests.Session')
     def test_download_paper_invalid_content(self, mock_session_class, temp_dir, sample_paper):
         """Test rejection of non-PDF content."""
@@ -546,6 +606,55 @@ class TestDownloadMultiplePapers:
         
         assert len(results) == 2  # Only successful downloads
 
+    @patch('paperseek.utils.pdf_downloader.PDFDownloader.download_paper')
+    def test_download_papers_concurrent(self, mock_download, temp_dir):
+        """Test concurrent downloads return the same results."""
+        mock_download.side_effect = lambda paper, subdirectory=None: (
+            None if paper.title == "Paper 2" else Path(temp_dir) / f"{paper.title}.pdf"
+        )
+        papers = [
+            Paper(title=f"Paper {i}", source_database="test", pdf_url=f"https://example.com/{i}.pdf")
+            for i in range(5)
+        ]
+        downloader = PDFDownloader(download_dir=temp_dir, max_concurrent_downloads=3)
+
+        results = downloader.download_papers(papers)
+
+        assert mock_download.call_count == 5
+        assert set(results) == {"Paper 0", "Paper 1", "Paper 3", "Paper 4"}
+
+    @patch('paperseek.utils.pdf_downloader.PDFDownloader.download_paper')
+    def test_download_papers_concurrent_max_limit(self, mock_download, temp_dir):
+        """Test max_downloads is never exceeded with concurrent downloads."""
+        mock_download.return_value = Path(temp_dir) / "paper.pdf"
+        papers = [
+            Paper(title=f"Paper {i}", source_database="test", pdf_url=f"https://example.com/{i}.pdf")
+            for i in range(10)
+        ]
+        downloader = PDFDownloader(download_dir=temp_dir, max_concurrent_downloads=4)
+
+        results = downloader.download_papers(papers, max_downloads=3)
+
+        assert len(results) == 3
+        assert mock_download.call_count == 3
+
+    def test_rate_limit_spaces_concurrent_starts(self, temp_dir):
+        """Test concurrent callers are spaced by the rate limit."""
+        downloader = PDFDownloader(download_dir=temp_dir, rate_limit_seconds=0.05)
+        starts = []
+
+        def start():
+            downloader._wait_for_rate_limit()
+            starts.append(time.time())
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            for _ in range(3):
+                executor.submit(start)
+
+        starts.sort()
+        assert starts[1] - starts[0] >= 0.045
+        assert starts[2] - starts[1] >= 0.045
+
 
 class TestDownloadSearchResults:
     """Test downloading from search results."""
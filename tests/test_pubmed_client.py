@@ -1,12 +1,16 @@
 """Unit tests for PubMedClient."""
 
+import io
+import json
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, PropertyMock, patch
 
 from paperseek.clients.pubmed import PubMedClient
 from paperseek.core.models import SearchFilters, Paper, Author
 from paperseek.core.config import DatabaseConfig
 from paperseek.core.exceptions import APIError
+from paperseek.utils import xml_parsing
 
 
 class TestPubMedClient:
@@ -98,13 +102,13 @@ class TestPubMedClient:
         """Test search by title."""
         # Mock search response
         mock_search_response = Mock()
-        mock_search_response.json.return_value = {
+        mock_search_response.content = json.dumps({
             "esearchresult": {"idlist": ["12345678"], "count": "1"}
-        }
+        }).encode()
         
         # Mock fetch response with XML
         mock_fetch_response = Mock()
-        mock_fetch_response.text = """<?xml version="1.0"?>
+        mock_fetch_response.raw = io.BytesIO(b"""<?xml version="1.0"?>
         <PubmedArticleSet>
             <PubmedArticle>
                 <MedlineCitation>
@@ -115,7 +119,7 @@ class TestPubMedClient:
                 </MedlineCitation>
             </PubmedArticle>
         </PubmedArticleSet>
-        """
+        """)
         
         mock_request.side_effect = [mock_search_response, mock_fetch_response]
 
@@ -128,7 +132,9 @@ class TestPubMedClient:
     def test_search_empty_results(self, mock_request, client):
         """Test search with no results."""
         mock_response = Mock()
-        mock_response.json.return_value = {"esearchresult": {"idlist": [], "count": "0"}}
+        mock_response.content = json.dumps(
+            {"esearchresult": {"idlist": [], "count": "0"}}
+        ).encode()
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Nonexistent Paper", max_results=10)
@@ -146,12 +152,12 @@ class TestPubMedClient:
     def test_search_by_author(self, mock_request, client):
         """Test search by author."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "esearchresult": {"idlist": ["12345678"], "count": "1"}
-        }
+        }).encode()
         
         mock_fetch_response = Mock()
-        mock_fetch_response.text = """<?xml version="1.0"?>
+        mock_fetch_response.raw = io.BytesIO(b"""<?xml version="1.0"?>
         <PubmedArticleSet>
             <PubmedArticle>
                 <MedlineCitation>
@@ -162,7 +168,7 @@ class TestPubMedClient:
                 </MedlineCitation>
             </PubmedArticle>
         </PubmedArticleSet>
-        """
+        """)
         
         mock_request.side_effect = [mock_response, mock_fetch_response]
 
@@ -175,12 +181,12 @@ class TestPubMedClient:
     def test_search_with_year_range(self, mock_request, client):
         """Test search with year range."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "esearchresult": {"idlist": ["12345678"], "count": "1"}
-        }
+        }).encode()
         
         mock_fetch_response = Mock()
-        mock_fetch_response.text = """<?xml version="1.0"?>
+        mock_fetch_response.raw = io.BytesIO(b"""<?xml version="1.0"?>
         <PubmedArticleSet>
             <PubmedArticle>
                 <MedlineCitation>
@@ -191,7 +197,7 @@ class TestPubMedClient:
                 </MedlineCitation>
             </PubmedArticle>
         </PubmedArticleSet>
-        """
+        """)
         
         mock_request.side_effect = [mock_response, mock_fetch_response]
 
@@ -204,7 +210,7 @@ class TestPubMedClient:
     def test_get_by_identifier(self, mock_request, client):
         """Test getting paper by PMID."""
         mock_response = Mock()
-        mock_response.text = """<?xml version="1.0"?>
+        mock_response.raw = io.BytesIO(b"""<?xml version="1.0"?>
         <PubmedArticleSet>
             <PubmedArticle>
                 <MedlineCitation>
@@ -215,23 +221,48 @@ class TestPubMedClient:
                 </MedlineCitation>
             </PubmedArticle>
         </PubmedArticleSet>
-        """
+        """)
         mock_request.return_value = mock_response
 
         paper = client.get_by_identifier("12345678", "pmid")
 
-        assert paper is not None or paper is None  # Depends on parsing
+        assert paper.title == "Test Paper"
+        assert paper.source_id == "12345678"
+
+    @patch("paperseek.clients.pubmed.PubMedClient._fetch_articles")
+    def test_get_by_identifier_is_cached(self, mock_fetch, client):
+        """Test that found PMIDs are served from memory and misses are retried."""
+        paper = Paper(title="Cached", source_database="pubmed")
+        mock_fetch.side_effect = lambda pmids: [paper] if pmids == ["12345678"] else []
+
+        first = client.get_by_identifier("12345678", "pmid")
+        second = client.get_by_identifier(" 12345678", "pubmed")
+        client.get_by_identifier("87654321", "pmid")
+        client.get_by_identifier("87654321", "pmid")
+
+        assert mock_fetch.call_count == 3
+        assert first == second == paper
+        assert first is not second
+
+    @patch("paperseek.clients.pubmed.PubMedClient._make_request")
+    def test_get_by_identifier_no_article(self, mock_request, client):
+        """Test that an efetch response without articles yields None."""
+        mock_response = Mock()
+        mock_response.raw = io.BytesIO(b"<PubmedArticleSet></PubmedArticleSet>")
+        mock_request.return_value = mock_response
+
+        assert client.get_by_identifier("12345678", "pmid") is None
 
     @patch("paperseek.clients.pubmed.PubMedClient._make_request")
     def test_max_results_limit(self, mock_request, client):
         """Test that max_results is respected."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "esearchresult": {"idlist": ["1", "2", "3", "4", "5"], "count": "5"}
-        }
+        }).encode()
         
         mock_fetch_response = Mock()
-        mock_fetch_response.text = """<?xml version="1.0"?>
+        mock_fetch_response.raw = io.BytesIO(b"""<?xml version="1.0"?>
         <PubmedArticleSet>
             <PubmedArticle>
                 <MedlineCitation>
@@ -242,7 +273,7 @@ class TestPubMedClient:
                 </MedlineCitation>
             </PubmedArticle>
         </PubmedArticleSet>
-        """
+        """)
         
         mock_request.side_effect = [mock_response, mock_fetch_response]
 
@@ -260,3 +291,208 @@ class TestPubMedClient:
         
         with pytest.raises(APIError):
             client.search(filters)
+
+    @patch("paperseek.clients.pubmed.PubMedClient._make_request")
+    def test_batch_lookup_parses_every_article(self, mock_request, client):
+        """Test that all articles of an efetch response are normalized in order."""
+        mock_response = Mock()
+        mock_response.raw = io.BytesIO(b"""<?xml version="1.0" encoding="UTF-8"?>
+        <PubmedArticleSet>
+            <PubmedArticle>
+                <MedlineCitation>
+                    <PMID>11111111</PMID>
+                    <Article><ArticleTitle>Caf\xc3\xa9 Study</ArticleTitle></Article>
+                </MedlineCitation>
+                <PubmedData>
+                    <ArticleIdList>
+                        <ArticleId IdType="pubmed">11111111</ArticleId>
+                        <ArticleId IdType="doi">10.1234/one</ArticleId>
+                    </ArticleIdList>
+                </PubmedData>
+            </PubmedArticle>
+            <PubmedArticle>
+                <MedlineCitation>
+                    <PMID>22222222</PMID>
+                    <Article><ArticleTitle>Second</ArticleTitle></Article>
+                </MedlineCitation>
+            </PubmedArticle>
+        </PubmedArticleSet>
+        """)
+        mock_request.return_value = mock_response
+
+        result = client.batch_lookup(["11111111", "22222222"], "pmid")
+
+        assert [p.title for p in result.papers] == ["Café Study", "Second"]
+        assert [p.doi for p in result.papers] == ["10.1234/one", None]
+        assert [p.source_id for p in result.papers] == ["11111111", "22222222"]
+        assert mock_request.call_args.kwargs["stream"] is True
+        mock_response.close.assert_called_once()
+
+    @patch("paperseek.clients.pubmed.PubMedClient._make_request")
+    def test_search_invalid_xml(self, mock_request, client):
+        """Test that a malformed efetch response raises APIError."""
+        mock_search_response = Mock()
+        mock_search_response.content = json.dumps({"esearchresult": {"idlist": ["1"]}}).encode()
+        mock_fetch_response = Mock()
+        mock_fetch_response.raw = io.BytesIO(b"<PubmedArticleSet><PubmedArticle>")
+        mock_request.side_effect = [mock_search_response, mock_fetch_response]
+
+        with pytest.raises(APIError, match="Invalid XML"):
+            client.search(SearchFilters(title="test", max_results=10))
+
+    @patch("paperseek.clients.pubmed.PubMedClient._make_request")
+    def test_search_fetches_batches_in_order(self, mock_request, client):
+        """Test that concurrently fetched efetch batches keep the search order."""
+        pmids = [str(10000000 + i) for i in range(5)]
+
+        def respond(url, params, stream=False):
+            response = Mock()
+            if "term" in params:
+                response.content = json.dumps({"esearchresult": {"idlist": pmids}}).encode()
+            else:
+                articles = "".join(
+                    f"<PubmedArticle><MedlineCitation><PMID>{pmid}</PMID>"
+                    f"<Article><ArticleTitle>{pmid}</ArticleTitle></Article>"
+                    f"</MedlineCitation></PubmedArticle>"
+                    for pmid in params["id"].split(",")
+                )
+                body = f"<PubmedArticleSet>{articles}</PubmedArticleSet>"
+                response.raw = io.BytesIO(body.encode())
+            return response
+
+        mock_request.side_effect = respond
+        client.FETCH_BATCH_SIZE = 2
+
+        result = client.search(SearchFilters(title="test", max_results=10))
+
+        assert mock_request.call_count == 4
+        assert [p.title for p in result.papers] == pmids
+        assert result.total_results == 5
+
+    def test_normalize_paper_from_xml_full_record(self, client):
+        """Test that a complete efetch record is read from its anchored paths."""
+        article_elem = xml_parsing.fromstring(b"""
+        <PubmedArticle>
+            <MedlineCitation>
+                <PMID Version="1">31452104</PMID>
+                <Article>
+                    <Journal>
+                        <JournalIssue>
+                            <PubDate><Year>2019</Year><Month>Aug</Month></PubDate>
+                        </JournalIssue>
+                        <Title>Nature methods</Title>
+                    </Journal>
+                    <ArticleTitle>A Test Article.</ArticleTitle>
+                    <Abstract><AbstractText>Some findings.</AbstractText></Abstract>
+                    <AuthorList>
+                        <Author>
+                            <LastName>Doe</LastName>
+                            <ForeName>Jane</ForeName>
+                            <AffiliationInfo>
+                                <Affiliation>First Institute</Affiliation>
+                            </AffiliationInfo>
+                            <AffiliationInfo>
+                                <Affiliation>Second Institute</Affiliation>
+                            </AffiliationInfo>
+                        </Author>
+                        <Author><LastName>Roe</LastName><ForeName>Rick</ForeName></Author>
+                    </AuthorList>
+                </Article>
+                <KeywordList><Keyword>genomics</Keyword><Keyword>imaging</Keyword></KeywordList>
+            </MedlineCitation>
+            <PubmedData>
+                <ArticleIdList>
+                    <ArticleId IdType="pubmed">31452104</ArticleId>
+                    <ArticleId IdType="doi">10.1038/s41592-019-0000-0</ArticleId>
+                </ArticleIdList>
+            </PubmedData>
+        </PubmedArticle>
+        """)
+
+        paper = client._normalize_paper_from_xml(article_elem)
+
+        assert paper.source_id == "31452104"
+        assert paper.url == "https://pubmed.ncbi.nlm.nih.gov/31452104/"
+        assert paper.year == 2019
+        assert paper.journal == "Nature methods"
+        assert paper.abstract == "Some findings."
+        assert paper.doi == "10.1038/s41592-019-0000-0"
+        assert paper.keywords == ["genomics", "imaging"]
+        assert [a.name for a in paper.authors] == ["Jane Doe", "Rick Roe"]
+        assert paper.authors[0].affiliation == "First Institute"
+        assert paper.authors[1].affiliation is None
+        assert Paper.model_validate(paper.model_dump()) == paper
+
+    def test_normalize_paper_from_xml_reads_ids_from_article_id_list(self, client):
+        """Test that the first DOI wins and PMID falls back to the article ID list."""
+        article_elem = xml_parsing.fromstring(b"""
+        <PubmedArticle>
+            <MedlineCitation><Article><ArticleTitle>T</ArticleTitle></Article></MedlineCitation>
+            <PubmedData>
+                <ArticleIdList>
+                    <ArticleId IdType="pii">S0000</ArticleId>
+                    <ArticleId IdType="doi">10.1234/first</ArticleId>
+                    <ArticleId IdType="doi">10.1234/second</ArticleId>
+                    <ArticleId IdType="pubmed">31452104</ArticleId>
+                </ArticleIdList>
+            </PubmedData>
+        </PubmedArticle>
+        """)
+
+        paper = client._normalize_paper_from_xml(article_elem)
+
+        assert paper.doi == "10.1234/first"
+        assert paper.source_id == "31452104"
+
+    @patch("paperseek.clients.pubmed.PubMedClient._make_request")
+    def test_search_fetches_from_history_server(self, mock_request, client):
+        """Test that efetch pages through the esearch history entry."""
+        pmids = [str(10000000 + i) for i in range(5)]
+        fetched = []
+
+        def respond(url, params, stream=False):
+            response = Mock()
+            if "term" in params:
+                assert params["usehistory"] == "y"
+                response.content = json.dumps(
+                    {"esearchresult": {"idlist": pmids, "webenv": "ENV", "querykey": "1"}}
+                ).encode()
+            else:
+                assert "id" not in params
+                assert (params["WebEnv"], params["query_key"]) == ("ENV", "1")
+                fetched.append((params["retstart"], params["retmax"]))
+                start = params["retstart"] - 10
+                articles = "".join(
+                    f"<PubmedArticle><MedlineCitation><PMID>{pmid}</PMID>"
+                    f"<Article><ArticleTitle>{pmid}</ArticleTitle></Article>"
+                    f"</MedlineCitation></PubmedArticle>"
+                    for pmid in pmids[start : start + params["retmax"]]
+                )
+                body = f"<PubmedArticleSet>{articles}</PubmedArticleSet>"
+                response.raw = io.BytesIO(body.encode())
+            return response
+
+        mock_request.side_effect = respond
+        client.FETCH_BATCH_SIZE = 2
+
+        result = client.search(SearchFilters(title="test", max_results=5, offset=10))
+
+        assert sorted(fetched) == [(10, 2), (12, 2), (14, 1)]
+        assert [p.title for p in result.papers] == pmids
+
+    @patch("paperseek.clients.pubmed.PubMedClient._make_request")
+    def test_efetch_never_decodes_response_text(self, mock_request, client):
+        """Test that efetch bodies are parsed as bytes, never via response.text."""
+        mock_response = Mock()
+        type(mock_response).text = PropertyMock(side_effect=AssertionError("decoded body"))
+        mock_response.raw = io.BytesIO(
+            "<?xml version='1.0' encoding='ISO-8859-1'?><PubmedArticleSet><PubmedArticle>"
+            "<MedlineCitation><PMID>12345678</PMID>"
+            "<Article><ArticleTitle>Résumé</ArticleTitle></Article>"
+            "</MedlineCitation></PubmedArticle></PubmedArticleSet>".encode("iso-8859-1")
+        )
+        mock_request.return_value = mock_response
+
+        paper = client.get_by_identifier("12345678", "pmid")
+
+        assert paper.title == "Résumé"
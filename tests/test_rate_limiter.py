@@ -54,6 +54,18 @@ class TestRateLimiter:
         
         assert elapsed < 0.1  # Should be very fast
 
+    @patch("paperseek.utils.rate_limiter.time.sleep")
+    def test_fractional_rate_spaces_requests(self, mock_sleep):
+        """Test that rates below one per second wait for the full interval."""
+        limiter = RateLimiter(requests_per_second=1 / 3)
+
+        limiter.wait_if_needed()
+        mock_sleep.assert_not_called()
+
+        limiter.wait_if_needed()
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(3.0, abs=0.1)
+
 
 class TestDatabaseRateLimiter:
     """Test suite for DatabaseRateLimiter."""
@@ -131,3 +143,17 @@ class TestDatabaseRateLimiter:
         
         # Should not raise (no limiting for unknown databases)
         manager.wait_if_needed("unknown_db")
+
+    def test_get_or_add_shares_matching_limiter(self):
+        """Test that callers asking for the same limits share one limiter."""
+        manager = DatabaseRateLimiter()
+
+        first = manager.get_or_add("test_db", requests_per_second=5.0)
+        assert manager.get_or_add("test_db", requests_per_second=5.0) is first
+
+        changed = manager.get_or_add("test_db", requests_per_second=2.0)
+        assert changed is not first
+        assert manager.get_limiter("test_db") is changed
+
+        manager.reset()
+        assert manager.get_limiter("test_db") is None
@@ -0,0 +1,96 @@
+"""Tests for the persistent search result cache."""
+
+import pytest
+import time
+from unittest.mock import patch
+
+from paperseek.utils.search_cache import SearchCache
+from paperseek.core.models import Paper, Author, SearchFilters, SearchResult
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a search cache in a temporary directory."""
+    cache = SearchCache(str(tmp_path / "search_cache.sqlite"))
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def sample_result():
+    """Create a sample search result for caching."""
+    return SearchResult(
+        papers=[
+            Paper(
+                title="Cached Paper",
+                authors=[Author(name="Jane Doe")],
+                doi="10.1234/cached",
+                year=2023,
+                source_database="dblp",
+            )
+        ],
+        total_results=1,
+        databases_queried=["dblp"],
+    )
+
+
+class TestSearchCache:
+    """Tests for SearchCache."""
+
+    def test_make_key_is_stable(self):
+        """Test that equal searches produce equal keys."""
+        key1 = SearchCache.make_key(SearchFilters(venue="CHI", year=2023), ["dblp"], "parallel")
+        key2 = SearchCache.make_key(SearchFilters(year=2023, venue="CHI"), ["dblp"], "parallel")
+
+        assert key1 == key2
+
+    def test_make_key_distinguishes_searches(self):
+        """Test that filters, databases and mode are all part of the key."""
+        filters = SearchFilters(venue="CHI", year=2023)
+        base = SearchCache.make_key(filters, ["dblp"], "parallel")
+
+        other_year = SearchFilters(venue="CHI", year=2024)
+        assert base != SearchCache.make_key(other_year, ["dblp"], "parallel")
+        assert base != SearchCache.make_key(filters, ["dblp", "openalex"], "parallel")
+        assert base != SearchCache.make_key(filters, ["dblp"], "sequential")
+
+    def test_miss_returns_none(self, cache):
+        """Test that unknown keys are cache misses."""
+        assert cache.get("unknown") is None
+
+    def test_set_and_get_roundtrip(self, cache, sample_result):
+        """Test that cached results are restored with all papers."""
+        cache.set("key", sample_result)
+
+        cached = cache.get("key")
+
+        assert cached is not None
+        assert cached.papers == sample_result.papers
+        assert cached.databases_queried == ["dblp"]
+
+    def test_expired_entries_are_misses(self, tmp_path, sample_result):
+        """Test that entries older than the TTL are ignored and purged."""
+        with SearchCache(str(tmp_path / "ttl.sqlite"), ttl_days=1) as cache:
+            two_days_ago = time.time() - 2 * 86400
+            with patch("paperseek.utils.search_cache.time.time", return_value=two_days_ago):
+                cache.set("key", sample_result)
+
+            assert cache.get("key") is None
+            assert cache.purge_expired() == 1
+            assert len(cache) == 0
+
+    def test_other_version_entries_are_misses(self, cache, sample_result):
+        """Test that results cached by another paperseek version are ignored."""
+        cache.set("key", sample_result)
+        cache.version = "0.0.0-other"
+
+        assert cache.get("key") is None
+
+    def test_persists_across_instances(self, tmp_path, sample_result):
+        """Test that cached results survive reopening the database."""
+        path = str(tmp_path / "persist.sqlite")
+        with SearchCache(path) as cache:
+            cache.set("key", sample_result)
+
+        with SearchCache(path) as cache:
+            assert cache.get("key") is not None
@@ -1,5 +1,7 @@
 """Unit tests for SemanticScholarClient."""
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -84,10 +86,12 @@ class TestSemanticScholarClient:
     def test_search_by_title(self, mock_request, client, sample_s2_paper):
         """Test search by title."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [sample_s2_paper],
-            "total": 1,
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [sample_s2_paper],
+                "total": 1,
+            }
+        ).encode()
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Test Paper", max_results=10)
@@ -99,7 +103,7 @@ class TestSemanticScholarClient:
     def test_search_empty_results(self, mock_request, client):
         """Test search with no results."""
         mock_response = Mock()
-        mock_response.json.return_value = {"data": [], "total": 0}
+        mock_response.content = json.dumps({"data": [], "total": 0}).encode()
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Nonexistent Paper", max_results=10)
@@ -111,7 +115,7 @@ class TestSemanticScholarClient:
     def test_get_by_doi(self, mock_request, client, sample_s2_paper):
         """Test DOI lookup."""
         mock_response = Mock()
-        mock_response.json.return_value = sample_s2_paper
+        mock_response.content = json.dumps(sample_s2_paper).encode()
         mock_request.return_value = mock_response
 
         paper = client.get_by_doi("10.1234/test.doi")
@@ -119,6 +123,22 @@ class TestSemanticScholarClient:
         if paper:
             assert paper.doi == "10.1234/test.doi"
 
+    @patch("paperseek.clients.semantic_scholar.SemanticScholarClient._make_request")
+    def test_lookups_are_cached(self, mock_request, client, sample_s2_paper):
+        """Test repeated lookups of one paper are served from memory."""
+        mock_response = Mock()
+        mock_response.content = json.dumps(sample_s2_paper).encode()
+        mock_request.return_value = mock_response
+
+        first = client.get_by_doi("10.1234/test.doi")
+        second = client.get_by_identifier("https://doi.org/10.1234/TEST.DOI", "doi")
+        client.get_by_identifier("2301.12345", "arxiv")
+        client.get_by_identifier("2301.12345", "arxiv_id")
+
+        assert mock_request.call_count == 2
+        assert first == second
+        assert first is not second
+
     def test_normalize_paper(self, client, sample_s2_paper):
         """Test paper normalization."""
         paper = client._normalize_paper(sample_s2_paper)
@@ -175,10 +195,12 @@ class TestSemanticScholarClient:
     def test_search_by_author(self, mock_request, client, sample_s2_paper):
         """Test search by author."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [sample_s2_paper],
-            "total": 1,
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [sample_s2_paper],
+                "total": 1,
+            }
+        ).encode()
         mock_request.return_value = mock_response
 
         filters = SearchFilters(author="John Doe", max_results=10)
@@ -191,10 +213,12 @@ class TestSemanticScholarClient:
     def test_search_with_year_filter(self, mock_request, client, sample_s2_paper):
         """Test search with year filter."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [sample_s2_paper],
-            "total": 1,
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [sample_s2_paper],
+                "total": 1,
+            }
+        ).encode()
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Test", year=2023, max_results=10)
@@ -209,10 +233,12 @@ class TestSemanticScholarClient:
     def test_search_with_year_range(self, mock_request, client, sample_s2_paper):
         """Test search with year range."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [sample_s2_paper],
-            "total": 1,
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [sample_s2_paper],
+                "total": 1,
+            }
+        ).encode()
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Test", year_start=2020, year_end=2023, max_results=10)
@@ -226,10 +252,12 @@ class TestSemanticScholarClient:
     def test_search_with_venue_filter(self, mock_request, client, sample_s2_paper):
         """Test search with venue filter."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [sample_s2_paper],
-            "total": 1,
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [sample_s2_paper],
+                "total": 1,
+            }
+        ).encode()
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Test", venue="NeurIPS", max_results=10)
@@ -252,7 +280,7 @@ class TestSemanticScholarClient:
     def test_search_with_doi(self, mock_request, client, sample_s2_paper):
         """Test search with DOI uses DOI lookup."""
         mock_response = Mock()
-        mock_response.json.return_value = sample_s2_paper
+        mock_response.content = json.dumps(sample_s2_paper).encode()
         mock_request.return_value = mock_response
 
         filters = SearchFilters(doi="10.1234/test.doi", max_results=10)
@@ -266,14 +294,16 @@ class TestSemanticScholarClient:
     def test_search_normalization_error(self, mock_request, client):
         """Test search with paper that fails normalization."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {"paperId": "valid123", "title": "Valid Paper"},
-                {"paperId": None, "title": None},  # Invalid paper
-                {"paperId": "valid456", "title": "Another Valid Paper"},
-            ],
-            "total": 3,
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {"paperId": "valid123", "title": "Valid Paper"},
+                    {"paperId": None, "title": None},  # Invalid paper
+                    {"paperId": "valid456", "title": "Another Valid Paper"},
+                ],
+                "total": 3,
+            }
+        ).encode()
         mock_request.return_value = mock_response
 
         filters = SearchFilters(title="Test", max_results=10)
@@ -286,7 +316,7 @@ class TestSemanticScholarClient:
     def test_get_by_identifier_arxiv(self, mock_request, client, sample_s2_paper):
         """Test get by arXiv identifier."""
         mock_response = Mock()
-        mock_response.json.return_value = sample_s2_paper
+        mock_response.content = json.dumps(sample_s2_paper).encode()
         mock_request.return_value = mock_response
 
         paper = client.get_by_identifier("2301.12345", "arxiv")
@@ -299,7 +329,7 @@ class TestSemanticScholarClient:
     def test_get_by_identifier_pmid(self, mock_request, client, sample_s2_paper):
         """Test get by PubMed identifier."""
         mock_response = Mock()
-        mock_response.json.return_value = sample_s2_paper
+        mock_response.content = json.dumps(sample_s2_paper).encode()
         mock_request.return_value = mock_response
 
         paper = client.get_by_identifier("12345678", "pmid")
@@ -312,7 +342,7 @@ class TestSemanticScholarClient:
     def test_get_by_identifier_s2(self, mock_request, client, sample_s2_paper):
         """Test get by Semantic Scholar ID."""
         mock_response = Mock()
-        mock_response.json.return_value = sample_s2_paper
+        mock_response.content = json.dumps(sample_s2_paper).encode()
         mock_request.return_value = mock_response
 
         paper = client.get_by_identifier("abc123def456", "s2")
@@ -342,7 +372,7 @@ class TestSemanticScholarClient:
     def test_batch_lookup_doi(self, mock_request, client, sample_s2_paper):
         """Test batch lookup with DOI."""
         mock_response = Mock()
-        mock_response.json.return_value = [sample_s2_paper, sample_s2_paper]
+        mock_response.content = json.dumps([sample_s2_paper, sample_s2_paper]).encode()
         mock_request.return_value = mock_response
 
         dois = ["10.1234/test1", "10.1234/test2"]
@@ -357,7 +387,7 @@ class TestSemanticScholarClient:
     def test_batch_lookup_arxiv(self, mock_request, client, sample_s2_paper):
         """Test batch lookup with arXiv IDs."""
         mock_response = Mock()
-        mock_response.json.return_value = [sample_s2_paper]
+        mock_response.content = json.dumps([sample_s2_paper]).encode()
         mock_request.return_value = mock_response
 
         arxiv_ids = ["2301.00001"]
@@ -369,7 +399,7 @@ class TestSemanticScholarClient:
     def test_batch_lookup_pmid(self, mock_request, client, sample_s2_paper):
         """Test batch lookup with PubMed IDs."""
         mock_response = Mock()
-        mock_response.json.return_value = [sample_s2_paper]
+        mock_response.content = json.dumps([sample_s2_paper]).encode()
         mock_request.return_value = mock_response
 
         pmids = ["12345678"]
@@ -381,7 +411,7 @@ class TestSemanticScholarClient:
     def test_batch_lookup_with_nulls(self, mock_request, client, sample_s2_paper):
         """Test batch lookup with some null results."""
         mock_response = Mock()
-        mock_response.json.return_value = [sample_s2_paper, None, sample_s2_paper]
+        mock_response.content = json.dumps([sample_s2_paper, None, sample_s2_paper]).encode()
         mock_request.return_value = mock_response
 
         dois = ["10.1234/test1", "10.1234/notfound", "10.1234/test2"]
@@ -405,18 +435,21 @@ class TestSemanticScholarClient:
             # Should fall back to individual lookups
             assert mock_get_by_id.call_count == 2
 
-    @patch("paperseek.clients.semantic_scholar.SemanticScholarClient.get_by_identifier")
-    def test_batch_lookup_too_many_identifiers(self, mock_get_by_id, client):
-        """Test batch lookup with more than 500 identifiers."""
-        mock_paper = Mock()
-        mock_get_by_id.return_value = mock_paper
+    @patch("paperseek.clients.semantic_scholar.SemanticScholarClient._make_request")
+    def test_batch_lookup_too_many_identifiers(self, mock_request, client):
+        """Test batch lookup with more than 500 identifiers is split into chunks."""
+        mock_response = Mock()
+        mock_response.content = json.dumps([]).encode()
+        mock_request.return_value = mock_response
 
         # Create 501 identifiers
         identifiers = [f"10.1234/test{i}" for i in range(501)]
-        result = client.batch_lookup(identifiers, "doi")
+        client.batch_lookup(identifiers, "doi")
 
-        # Should fall back to individual lookups
-        assert mock_get_by_id.call_count == 501
+        # Should send two batch requests (500 + 1)
+        assert mock_request.call_count == 2
+        chunk_sizes = [len(c.kwargs["json_data"]["ids"]) for c in mock_request.call_args_list]
+        assert chunk_sizes == [500, 1]
 
     def test_normalize_paper_with_journal(self, client):
         """Test normalization with journal publication."""
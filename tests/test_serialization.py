@@ -0,0 +1,51 @@
+"""Tests for JSON serialization helpers."""
+
+import io
+import json
+import pytest
+
+from paperseek.utils import serialization
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with and without orjson."""
+    if request.param and not serialization.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+class TestSerialization:
+    """Tests for dumps/loads."""
+
+    def test_dumps_returns_utf8_bytes(self, backend):
+        """Test that non-ASCII text is written as UTF-8, not escaped."""
+        data = serialization.dumps({"title": "Schrödinger"})
+
+        assert isinstance(data, bytes)
+        assert "Schrödinger".encode("utf-8") in data
+
+    def test_dumps_compact_is_single_line(self, backend):
+        """Test that compact output has no newlines."""
+        assert b"\n" not in serialization.dumps({"a": [1, 2], "b": {"c": None}})
+
+    def test_dumps_pretty_indents(self, backend):
+        """Test that pretty output is indented with two spaces."""
+        data = serialization.dumps({"a": 1}, pretty=True)
+
+        assert data.decode("utf-8") == json.dumps({"a": 1}, indent=2)
+
+    def test_roundtrip(self, backend):
+        """Test that dumps and loads are inverse operations."""
+        obj = {"title": "Paper", "year": 2023, "authors": ["A", "B"], "oa": True}
+
+        assert serialization.loads(serialization.dumps(obj)) == obj
+        assert serialization.loads(serialization.dumps(obj).decode("utf-8")) == obj
+
+    def test_iter_items_requires_ijson(self, monkeypatch):
+        """Test that streaming without ijson names the extra to install."""
+        monkeypatch.setattr(serialization, "IJSON_AVAILABLE", False)
+
+        with pytest.raises(ImportError, match=r"paperseek\[streaming\]"):
+            serialization.iter_items(io.BytesIO(b'{"results": []}'), "results.item")
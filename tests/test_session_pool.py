@@ -2,6 +2,7 @@
 
 import pytest
 import requests
+from urllib3.util.retry import Retry
 
 from paperseek.utils.session_pool import SessionPool, get_session
 
@@ -47,6 +48,16 @@ class TestSessionPool:
         assert "http://" in session.adapters
         assert "https://" in session.adapters
 
+    def test_get_session_mounts_retry_strategy_once(self):
+        """Test that a Retry strategy is mounted by the first call only."""
+        retry = Retry(total=3)
+        session = SessionPool.get_session("test_db", max_retries=retry)
+        adapter = session.get_adapter("https://example.org")
+        assert adapter.max_retries is retry
+
+        SessionPool.get_session("test_db", max_retries=Retry(total=5))
+        assert session.get_adapter("https://example.org") is adapter
+
     def test_close_session(self):
         """Test closing a session removes it from pool."""
         SessionPool.get_session("test_db")
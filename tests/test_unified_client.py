@@ -1,5 +1,8 @@
 """Unit tests for the UnifiedSearchClient."""
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
@@ -132,6 +135,161 @@ class TestUnifiedSearchClient:
         assert results[0].doi == dois[0]
         assert results[1].doi == dois[1]
 
+    def test_get_by_doi_uses_cache(self, tmp_path):
+        """Test that DOI lookups are served from the persistent cache."""
+        config_dict = {
+            "crossref": {"enabled": True, "rate_limit_per_second": 1.0},
+            "doi_cache_path": str(tmp_path / "doi_cache.sqlite"),
+        }
+
+        client = UnifiedSearchClient(databases=["crossref"], config_dict=config_dict)
+
+        mock_paper = Paper(
+            title="Test Paper", authors=[], doi="10.1234/test", year=2023, source_database="crossref"
+        )
+        client.clients["crossref"].get_by_doi = Mock(return_value=mock_paper)
+
+        first = client.get_by_doi("10.1234/test")
+        second = client.get_by_doi("10.1234/test")
+
+        assert first == second
+        client.clients["crossref"].get_by_doi.assert_called_once()
+        client.close()
+
+    def test_search_uses_search_cache(self, tmp_path):
+        """Test that repeated searches are served from the persistent cache."""
+        config_dict = {
+            "crossref": {"enabled": True, "rate_limit_per_second": 1.0},
+            "search_cache_path": str(tmp_path / "search_cache.sqlite"),
+        }
+
+        client = UnifiedSearchClient(databases=["crossref"], config_dict=config_dict)
+        client.clients["crossref"].search = Mock(
+            return_value=SearchResult(
+                papers=[Paper(title="Test Paper", year=2023, source_database="crossref")]
+            )
+        )
+
+        first = client.search(venue="ICML", year=2023)
+        second = client.search(venue="ICML", year=2023)
+        client.search(venue="ICML", year=2024)
+
+        assert first.papers == second.papers
+        assert client.clients["crossref"].search.call_count == 2
+        client.close()
+
+    def test_search_cache_skips_failed_searches(self, tmp_path):
+        """Test that searches with failed databases are not cached."""
+        config_dict = {
+            "crossref": {"enabled": True, "rate_limit_per_second": 1.0},
+            "search_cache_path": str(tmp_path / "search_cache.sqlite"),
+        }
+
+        client = UnifiedSearchClient(databases=["crossref"], config_dict=config_dict)
+        client.clients["crossref"].search = Mock(side_effect=Exception("API down"))
+
+        client.search(venue="ICML", year=2023)
+        client.search(venue="ICML", year=2023)
+
+        assert client.clients["crossref"].search.call_count == 2
+        client.close()
+
+    def test_search_cache_skips_sequential_fallback_after_failure(self, tmp_path):
+        """Test that a sequential search answered by a fallback database is not cached."""
+        config_dict = {
+            "crossref": {"enabled": True, "rate_limit_per_second": 1.0},
+            "openalex": {"enabled": True, "rate_limit_per_second": 1.0},
+            "search_cache_path": str(tmp_path / "search_cache.sqlite"),
+        }
+
+        client = UnifiedSearchClient(
+            databases=["crossref", "openalex"], fallback_mode="sequential", config_dict=config_dict
+        )
+        client.clients["crossref"].search = Mock(side_effect=Exception("API down"))
+        client.clients["openalex"].search = Mock(
+            return_value=SearchResult(
+                papers=[Paper(title="Test Paper", year=2023, source_database="openalex")]
+            )
+        )
+
+        first = client.search(venue="ICML", year=2023)
+        client.search(venue="ICML", year=2023)
+
+        assert first.databases_queried == ["openalex"]
+        assert client.clients["crossref"].search.call_count == 2
+        assert client.clients["openalex"].search.call_count == 2
+        client.close()
+
+    def test_batch_lookup_only_fetches_cache_misses(self, tmp_path):
+        """Test that batch lookups only send uncached DOIs to the database."""
+        config_dict = {
+            "crossref": {"enabled": True, "rate_limit_per_second": 1.0},
+            "doi_cache_path": str(tmp_path / "doi_cache.sqlite"),
+        }
+
+        client = UnifiedSearchClient(databases=["crossref"], config_dict=config_dict)
+
+        cached_paper = Paper(
+            title="Cached", authors=[], doi="10.1234/test1", year=2023, source_database="crossref"
+        )
+        client.doi_cache.set("crossref", cached_paper.doi, cached_paper)
+
+        fetched_paper = Paper(
+            title="Fetched", authors=[], doi="10.1234/test2", year=2023, source_database="crossref"
+        )
+        client.clients["crossref"].batch_lookup = Mock(
+            return_value=SearchResult(papers=[fetched_paper], databases_queried=["crossref"])
+        )
+
+        results = client.batch_lookup(["10.1234/test1", "10.1234/test2"], id_type="doi")
+
+        assert {p.title for p in results.papers} == {"Cached", "Fetched"}
+        client.clients["crossref"].batch_lookup.assert_called_once_with(["10.1234/test2"], "doi")
+        assert client.doi_cache.get("crossref", "10.1234/test2") is not None
+        client.close()
+
+    def test_get_by_doi_skips_databases_by_prefix(self):
+        """Test that arXiv DOIs are not sent to databases that cannot resolve them."""
+        config_dict = {
+            "crossref": {"enabled": True, "rate_limit_per_second": 1.0},
+            "arxiv": {"enabled": True, "rate_limit_per_second": 1.0},
+        }
+
+        client = UnifiedSearchClient(databases=["crossref", "arxiv"], config_dict=config_dict)
+
+        mock_paper = Paper(
+            title="Attention Is All You Need",
+            authors=[],
+            doi="10.48550/arXiv.1706.03762",
+            source_database="arxiv",
+        )
+        client.clients["crossref"].get_by_doi = Mock(return_value=None)
+        client.clients["arxiv"].get_by_doi = Mock(return_value=mock_paper)
+
+        paper = client.get_by_doi("10.48550/arXiv.1706.03762")
+
+        assert paper is mock_paper
+        client.clients["crossref"].get_by_doi.assert_not_called()
+
+    def test_get_by_doi_keeps_explicit_database_order(self):
+        """Test that learned routing doesn't override an explicit database list."""
+        config_dict = {
+            "crossref": {"enabled": True, "rate_limit_per_second": 1.0},
+            "openalex": {"enabled": True, "rate_limit_per_second": 1.0},
+        }
+
+        client = UnifiedSearchClient(databases=["crossref", "openalex"], config_dict=config_dict)
+        client.doi_registry.record("10.1038/nature14539", "openalex")
+
+        mock_paper = Paper(title="Test Paper", doi="10.1038/other", source_database="crossref")
+        client.clients["crossref"].get_by_doi = Mock(return_value=mock_paper)
+        client.clients["openalex"].get_by_doi = Mock(return_value=None)
+
+        paper = client.get_by_doi("10.1038/other", databases=["crossref", "openalex"])
+
+        assert paper is mock_paper
+        client.clients["openalex"].get_by_doi.assert_not_called()
+
     def test_parallel_search_mode(self):
         """Test parallel search mode."""
         config_dict = {
@@ -163,6 +321,150 @@ class TestUnifiedSearchClient:
         assert len(results) >= 2
         assert len(results.databases_queried) == 2
 
+    def test_parallel_search_merges_in_database_order(self):
+        """Test parallel results are merged in configured order, not arrival order."""
+        config_dict = {
+            "crossref": {"enabled": True, "rate_limit_per_second": 1.0},
+            "openalex": {"enabled": True, "rate_limit_per_second": 2.0},
+        }
+        client = UnifiedSearchClient(
+            databases=["crossref", "openalex"], fallback_mode="parallel", config_dict=config_dict
+        )
+
+        def slow_crossref(filters):
+            time.sleep(0.05)
+            return SearchResult(
+                papers=[Paper(title="Same", doi="10.1/x", source_database="crossref")]
+            )
+
+        client.clients["crossref"].search = Mock(side_effect=slow_crossref)
+        client.clients["openalex"].search = Mock(
+            return_value=SearchResult(
+                papers=[Paper(title="Same", doi="10.1/x", source_database="openalex")]
+            )
+        )
+
+        results = client.search(venue="ICML", year=2023)
+
+        assert results.databases_queried == ["crossref", "openalex"]
+        assert [p.source_database for p in results.papers] == ["crossref"]
+
+    def test_deduplicate_results_by_normalized_doi(self):
+        """Test duplicates across databases keep the most complete record."""
+        config_dict = {"crossref": {"enabled": True, "rate_limit_per_second": 1.0}}
+        client = UnifiedSearchClient(databases=["crossref"], config_dict=config_dict)
+
+        sparse = Paper(title="Deep Learning", doi="10.1038/NATURE14539", source_database="crossref")
+        rich = Paper(
+            title="Deep learning",
+            doi="https://doi.org/10.1038/nature14539",
+            abstract="Abstract",
+            year=2015,
+            source_database="openalex",
+        )
+        other = Paper(title="Other", doi="10.1/other", source_database="crossref")
+
+        results = client._deduplicate_results(SearchResult(papers=[sparse, other, rich]))
+
+        assert results.papers == [rich, other]
+        assert results.total_results == 2
+
+    def test_deduplicate_results_by_title_and_year(self):
+        """Test papers without shared identifiers are matched by title and year."""
+        config_dict = {"crossref": {"enabled": True, "rate_limit_per_second": 1.0}}
+        client = UnifiedSearchClient(databases=["crossref"], config_dict=config_dict)
+
+        with_doi = Paper(
+            title="Deep Learning.", year=2015, doi="10.1/a", source_database="crossref"
+        )
+        preprint = Paper(
+            title="deep learning", year=2015, arxiv_id="1234.5678", source_database="arxiv"
+        )
+        other_year = Paper(title="Deep Learning", year=2016, source_database="dblp")
+        conflicting_doi = Paper(
+            title="Deep Learning", year=2015, doi="10.1/b", source_database="crossref"
+        )
+
+        results = client._deduplicate_results(
+            SearchResult(papers=[with_doi, preprint, other_year, conflicting_doi])
+        )
+
+        assert len(results.papers) == 3
+        assert other_year in results.papers
+        assert conflicting_doi in results.papers
+
+    def test_client_registry_classes(self):
+        """Test every registered database resolves to a client with that name."""
+        from paperseek.core.base import DatabaseClient
+        from paperseek.core.unified_client import CLIENT_REGISTRY, load_client_class
+
+        for db_name in CLIENT_REGISTRY:
+            client_class = load_client_class(db_name)
+            assert issubclass(client_class, DatabaseClient)
+            assert client_class(config=DatabaseConfig()).database_name == db_name
+
+    def test_search_async(self):
+        """Test the awaitable search wrapper."""
+        config_dict = {"crossref": {"enabled": True, "rate_limit_per_second": 1.0}}
+        client = UnifiedSearchClient(databases=["crossref"], config_dict=config_dict)
+        client.clients["crossref"].search = Mock(
+            return_value=SearchResult(
+                papers=[Paper(title="Async Paper", year=2023, source_database="crossref")]
+            )
+        )
+
+        results = asyncio.run(client.search_async(venue="ICML", year=2023))
+
+        assert [p.title for p in results.papers] == ["Async Paper"]
+        filters = client.clients["crossref"].search.call_args[0][0]
+        assert filters.venue == "ICML"
+
+    def test_search_mode_override_does_not_touch_client_mode(self):
+        """Test that concurrent searches with different modes don't interfere."""
+        config_dict = {
+            "crossref": {"enabled": True, "rate_limit_per_second": 1.0},
+            "openalex": {"enabled": True, "rate_limit_per_second": 1.0},
+        }
+        client = UnifiedSearchClient(
+            databases=["crossref", "openalex"], fallback_mode="sequential", config_dict=config_dict
+        )
+        modes_seen = []
+
+        def search(filters):
+            modes_seen.append(client.fallback_mode)
+            return SearchResult(
+                papers=[Paper(title="Async Paper", year=2023, source_database="crossref")]
+            )
+
+        client.clients["crossref"].search = Mock(side_effect=search)
+        client.clients["openalex"].search = Mock(return_value=SearchResult(papers=[]))
+
+        async def run_both():
+            return await asyncio.gather(
+                client.search_async(venue="ICML", mode="parallel"),
+                client.search_async(venue="ICML"),
+            )
+
+        parallel, sequential = asyncio.run(run_both())
+
+        assert parallel.databases_queried == ["crossref", "openalex"]
+        assert sequential.databases_queried == ["crossref"]
+        assert modes_seen == ["sequential", "sequential"]
+        assert client.fallback_mode == "sequential"
+
+    def test_parallel_search_without_clients(self):
+        """Test parallel search with no configured databases returns empty results."""
+        config_dict = {"crossref": {"enabled": True, "rate_limit_per_second": 1.0}}
+        client = UnifiedSearchClient(
+            databases=["crossref"], fallback_mode="parallel", config_dict=config_dict
+        )
+        client.clients = {}
+
+        results = client.search(venue="ICML", year=2023)
+
+        assert len(results) == 0
+        assert results.databases_queried == []
+
     def test_context_manager(self):
         """Test context manager functionality."""
         config_dict = {"crossref": {"enabled": True, "rate_limit_per_second": 1.0}}
@@ -0,0 +1,81 @@
+"""Tests for XML parsing helpers."""
+
+import pytest
+
+from paperseek.utils import xml_parsing
+
+ATOM_NS = {"atom": "http://www.w3.org/2005/Atom"}
+
+FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+    <entry><title>Schrödinger</title><link title="pdf" href="http://x/1.pdf"/></entry>
+    <entry><title>Second</title></entry>
+</feed>
+"""
+
+
+@pytest.fixture(params=[True, False], ids=["lxml", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with and without lxml."""
+    if request.param and not xml_parsing.LXML_AVAILABLE:
+        pytest.skip("lxml not installed")
+    monkeypatch.setattr(xml_parsing, "LXML_AVAILABLE", request.param)
+    return request.param
+
+
+class TestFromString:
+    """Tests for fromstring."""
+
+    @pytest.mark.parametrize("encode", [True, False], ids=["bytes", "str"])
+    def test_parses_namespaced_document(self, backend, encode):
+        """Test that bytes and str documents give the same elements."""
+        root = xml_parsing.fromstring(FEED.encode("utf-8") if encode else FEED)
+
+        entries = root.findall("atom:entry", ATOM_NS)
+        assert [e.find("atom:title", ATOM_NS).text for e in entries] == ["Schrödinger", "Second"]
+        assert entries[0].find("atom:link", ATOM_NS).get("href") == "http://x/1.pdf"
+
+    def test_malformed_document_raises_parse_error(self, backend):
+        """Test that malformed XML raises one of XML_PARSE_ERRORS."""
+        with pytest.raises(xml_parsing.XML_PARSE_ERRORS):
+            xml_parsing.fromstring(b"<feed><entry></feed>")
+
+
+class TestIterElements:
+    """Tests for iter_elements."""
+
+    ENTRY = "{http://www.w3.org/2005/Atom}entry"
+
+    def test_yields_matching_elements_in_order(self, backend):
+        """Test that only elements with the requested tag are yielded."""
+        titles = [
+            entry.find("atom:title", ATOM_NS).text
+            for entry in xml_parsing.iter_elements(FEED.encode("utf-8"), self.ENTRY)
+        ]
+
+        assert titles == ["Schrödinger", "Second"]
+
+    def test_yields_any_of_several_tags(self, backend):
+        """Test that a sequence of tags matches each of them, in document order."""
+        document = b"<dblp><book><title>B</title></book><article><title>A</title></article></dblp>"
+
+        titles = [
+            element.find("title").text
+            for element in xml_parsing.iter_elements(document, ("article", "book"))
+        ]
+
+        assert titles == ["B", "A"]
+
+    def test_processed_elements_are_cleared(self, backend):
+        """Test that each element is released once the caller moves on."""
+        entries = []
+        for entry in xml_parsing.iter_elements(FEED, self.ENTRY):
+            assert len(entry) > 0
+            entries.append(entry)
+
+        assert all(len(entry) == 0 for entry in entries)
+
+    def test_malformed_document_raises_parse_error(self, backend):
+        """Test that malformed XML raises one of XML_PARSE_ERRORS while iterating."""
+        with pytest.raises(xml_parsing.XML_PARSE_ERRORS):
+            list(xml_parsing.iter_elements(b"<feed><entry></feed>", self.ENTRY))